@@ -660,6 +660,7 @@ Visualizations examples:
 
     AudioContainer
     AudioContainer.load
+    AudioContainer.load_batch
     AudioContainer.load_from_youtube
     AudioContainer.save
     AudioContainer.show
@@ -691,6 +692,23 @@ Visualizations examples:
     AudioContainer.plot_wave
     AudioContainer.plot_spec
 
+AudioReaderCache
+----------------
+
+*dcase_util.containers.AudioReaderCache*
+
+Cache of open seekable audio file handles used by AudioContainer when loading WAV, FLAC, OGG and MP3 files.
+Repeated segment requests from the same file are served without reopening and decoding the file from the start.
+Process-wide instance is available as ``dcase_util.containers.audio_reader_cache``.
+
+.. autosummary::
+    :toctree: generated/
+
+    AudioReaderCache
+    AudioReaderCache.info
+    AudioReaderCache.read
+    AudioReaderCache.close
+
 
 Feature containers
 ::::::::::::::::::
@@ -704,6 +722,8 @@ FeatureContainer
     :toctree: generated/
 
     FeatureContainer
+    FeatureContainer.load
+    FeatureContainer.save
 
 FeatureRepository
 -----------------
@@ -715,6 +735,26 @@ FeatureRepository
 
     FeatureRepository
 
+FeatureStore
+------------
+
+*dcase_util.containers.FeatureStore*
+
+Feature store to pack feature matrices of a whole dataset into a few large shard files with an offset index.
+
+.. autosummary::
+    :toctree: generated/
+
+    FeatureStore
+    FeatureStore.load
+    FeatureStore.save
+    FeatureStore.set_container
+    FeatureStore.get_container
+    FeatureStore.set_repository
+    FeatureStore.get_repository
+    FeatureStore.keys
+    FeatureStore.get_labels
+
 Mapping containers
 ::::::::::::::::::
 
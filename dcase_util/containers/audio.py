@@ -5,15 +5,227 @@
 from __future__ import print_function, absolute_import
 import sys
 import os
+import six
 import soundfile
 import tempfile
 import numpy
 import librosa
+import threading
+import collections
 from six.moves.http_client import BadStatusLine
 
 from dcase_util.containers import ContainerMixin, FileMixin
 from dcase_util.ui.ui import FancyStringifier, FancyHTMLStringifier
-from dcase_util.utils import FileFormat, Path, is_int, is_jupyter, get_audio_info
+from dcase_util.utils import FileFormat, Path, IntervalIndex, is_int, is_jupyter, get_audio_info, get_file_hash, \
+    resample, AudioInfoCache, compute_dtype, to_compute_dtype, get_dtype_policy, DtypePolicy, replace_file
+
+
+class AudioReaderCache(object):
+    """Cache of open seekable audio file handles.
+
+    Files readable with soundfile (WAV, FLAC, OGG, MP3) are opened once and kept open, segment reads seek directly
+    to the segment start. Least recently used handles are closed when the cache is full, and handles are reopened
+    if the file has been modified. Handles are not shared between processes.
+
+    """
+
+    def __init__(self, size=16):
+        """Constructor
+
+        Parameters
+        ----------
+        size : int
+            Maximum amount of open files
+            Default value 16
+
+        """
+
+        self.size = size
+
+        self._readers = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+
+    def __len__(self):
+        return len(self._readers)
+
+    def __contains__(self, filename):
+        return os.path.abspath(filename) in self._readers
+
+    def _get(self, filename):
+        """Get reader entry for the file, open the file if needed.
+
+        Parameters
+        ----------
+        filename : str
+            Audio file
+
+        Returns
+        -------
+        dict
+
+        """
+
+        key = os.path.abspath(filename)
+        stat = os.stat(key)
+        stamp = (stat.st_mtime, stat.st_size)
+
+        with self._lock:
+            if self._pid != os.getpid():
+                # Forked process, file positions of the inherited handles are shared with the parent
+                self._readers = collections.OrderedDict()
+                self._pid = os.getpid()
+
+            reader = self._readers.get(key)
+            if reader is not None and reader['stamp'] != stamp:
+                self._close(key)
+                reader = None
+
+            if reader is None:
+                handle = soundfile.SoundFile(key)
+                reader = {
+                    'filename': key,
+                    'handle': handle,
+                    'stamp': stamp,
+                    'lock': threading.Lock(),
+                    'info': {
+                        'fs': handle.samplerate,
+                        'channels': handle.channels,
+                        'duration_samples': handle.frames,
+                        'duration_sec': handle.frames / float(handle.samplerate),
+                        'duration_ms': (handle.frames / float(handle.samplerate)) * 1000,
+                        'subtype': {
+                            'name': handle.subtype,
+                            'info': soundfile.available_subtypes().get(handle.subtype, handle.subtype)
+                        }
+                    }
+                }
+                self._readers[key] = reader
+
+                while len(self._readers) > self.size:
+                    self._close(next(iter(self._readers)))
+
+            else:
+                # Mark reader as recently used
+                self._readers[key] = self._readers.pop(key)
+
+        return reader
+
+    def _close(self, key):
+        reader = self._readers.pop(key)
+        with reader['lock']:
+            reader['handle'].close()
+
+    def info(self, filename):
+        """Get audio file information from the open handle
+
+        Parameters
+        ----------
+        filename : str
+            Audio file
+
+        Raises
+        ------
+        RuntimeError:
+            File cannot be opened with soundfile
+
+        Returns
+        -------
+        dict
+            fs, channels, duration_samples, duration_sec, duration_ms, and subtype
+
+        """
+
+        return dict(self._get(filename)['info'])
+
+    def read(self, filename, start=None, stop=None, dtype='float64', always_2d=False):
+        """Read segment from the audio file
+
+        Parameters
+        ----------
+        filename : str
+            Audio file
+
+        start : int
+            Segment start sample, if None, segment starts from the beginning.
+            Default value None
+
+        stop : int
+            Segment stop sample, if None, segment continues until the end.
+            Default value None
+
+        dtype : str
+            Data type of the returned data
+            Default value 'float64'
+
+        always_2d : bool
+            Return 2d array also for single channel audio.
+            Default value False
+
+        Raises
+        ------
+        RuntimeError:
+            File cannot be opened with soundfile
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n, channels)], int
+            Audio data and sampling rate
+
+        """
+
+        reader = self._get(filename)
+        duration = reader['info']['duration_samples']
+
+        start, stop, _ = slice(start, stop).indices(duration)
+
+        with reader['lock']:
+            if not reader['handle'].closed:
+                reader['handle'].seek(start)
+                data = reader['handle'].read(frames=max(stop - start, 0), dtype=dtype, always_2d=always_2d)
+
+                return data, reader['info']['fs']
+
+        # Handle was closed by another thread after the entry was fetched, read with a temporary handle
+        with soundfile.SoundFile(reader['filename']) as handle:
+            handle.seek(start)
+            data = handle.read(frames=max(stop - start, 0), dtype=dtype, always_2d=always_2d)
+
+        return data, reader['info']['fs']
+
+    def close(self, filename=None):
+        """Close open files
+
+        Parameters
+        ----------
+        filename : str
+            Audio file to close, if None, all files are closed.
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        with self._lock:
+            if filename is None:
+                keys = list(self._readers.keys())
+
+            else:
+                keys = [os.path.abspath(filename)] if filename in self else []
+
+            for key in keys:
+                self._close(key)
+
+        return self
+
+
+#: Process-wide audio reader cache used by AudioContainer
+audio_reader_cache = AudioReaderCache()
+
+# Content hashes of the audio files, keyed by path, modification time and size
+_file_hashes = {}
 
 
 class AudioContainer(ContainerMixin, FileMixin):
@@ -688,7 +900,8 @@ class AudioContainer(ContainerMixin, FileMixin):
             else:
                 return True
 
-    def load(self, filename=None, fs='native', mono=False, res_type='kaiser_best', start=None, stop=None, auto_trimming=False):
+    def load(self, filename=None, fs='native', mono=False, res_type='kaiser_best', start=None, stop=None, auto_trimming=False,
+             reader_cache=True, resample_cache_path=None):
         """Load file
 
         Parameters
@@ -707,7 +920,7 @@ class AudioContainer(ContainerMixin, FileMixin):
             Default value False
 
         res_type : str
-            Resample type, defined by Librosa.
+            Resample type, see `dcase_util.utils.resampler_list`. Types not registered are passed to Librosa.
             Default value 'kaiser_best'
 
         start : float, optional
@@ -722,6 +935,17 @@ class AudioContainer(ContainerMixin, FileMixin):
             In case using segment stop parameter, the parameter is adjusted automatically if it exceeds the file duration.
             Default value False
 
+        reader_cache : bool
+            Keep the file open in the process-wide reader cache (`audio_reader_cache`) to serve repeated segment
+            requests without reopening the file. Used for formats readable with soundfile (WAV, FLAC, OGG, MP3).
+            Default value True
+
+        resample_cache_path : str
+            Path to store resampled audio. Whole file is resampled once, stored as NPY file keyed by the file
+            content hash, target sampling frequency and resample type, and segments are read from the stored file.
+            If None, cache is not used.
+            Default value None
+
         Raises
         ------
         IOError:
@@ -742,7 +966,31 @@ class AudioContainer(ContainerMixin, FileMixin):
             if fs is None:
                 # Use sampling frequency defined in class construction.
                 fs = self.fs
-            info = get_audio_info(filename=self.filename)
+
+            info = None
+            if reader_cache and self.format in [FileFormat.WAV, FileFormat.FLAC, FileFormat.OGG, FileFormat.MP3]:
+                try:
+                    # File information from the open handle
+                    info = audio_reader_cache.info(filename=self.filename)
+
+                except RuntimeError:
+                    # Format not supported by the soundfile installation
+                    info = None
+
+            seekable = info is not None
+            if not seekable:
+                info = get_audio_info(filename=self.filename)
+
+            if resample_cache_path is not None and fs != 'native' and fs != info['fs']:
+                cache_filename = self._resample_cache_filename(
+                    path=resample_cache_path,
+                    fs=fs,
+                    res_type=res_type
+                )
+
+            else:
+                cache_filename = None
+
             # Check start and stop parameters against file duration
             if start is not None and start < 0:
                 message = '{name}: Start parameter is negative [{file}]'.format(
@@ -780,7 +1028,50 @@ class AudioContainer(ContainerMixin, FileMixin):
                 self.logger.exception(message)
                 raise IOError(message)
 
-            if self.format == FileFormat.WAV:
+            if cache_filename is not None:
+                if not os.path.isfile(cache_filename):
+                    # Resample the whole file once, and store it into the cache
+                    source = AudioContainer().load(
+                        filename=self.filename,
+                        fs='native',
+                        reader_cache=reader_cache
+                    )
+
+                    data = resample(
+                        y=source.data,
+                        orig_sr=source.fs,
+                        target_sr=fs,
+                        res_type=res_type
+                    )
+
+                    Path().makedirs(path=resample_cache_path)
+                    tmp_filename = cache_filename + '.' + str(os.getpid()) + '.tmp'
+                    with open(tmp_filename, 'wb') as file_handle:
+                        numpy.save(file_handle, data, allow_pickle=False)
+
+                    replace_file(source=tmp_filename, destination=cache_filename)
+
+                data = numpy.load(cache_filename, mmap_mode='r')
+
+                # Handle segment start and stop
+                start_sample = None
+                stop_sample = None
+                if start is not None:
+                    start_sample = int(start * fs)
+
+                if stop is not None:
+                    stop_sample = (start_sample or 0) + int((stop - (start or 0.0)) * fs)
+
+                data = data[..., start_sample:stop_sample]
+
+                # Down-mix audio
+                if mono and data.ndim > 1:
+                    data = numpy.mean(data, axis=0)
+
+                self._data = numpy.array(data, dtype=compute_dtype(default=data.dtype))
+                self.fs = fs
+
+            elif self.format == FileFormat.WAV:
 
                 self.filetype_info = {
                     'subtype': info['subtype']['name'],
@@ -799,11 +1090,21 @@ class AudioContainer(ContainerMixin, FileMixin):
                     start_sample = None
                     stop_sample = None
 
-                self._data, source_fs = soundfile.read(
-                    file=self.filename,
-                    start=start_sample,
-                    stop=stop_sample
-                )
+                if seekable:
+                    self._data, source_fs = audio_reader_cache.read(
+                        filename=self.filename,
+                        start=start_sample,
+                        stop=stop_sample,
+                        dtype=compute_dtype(default=numpy.float64).name
+                    )
+
+                else:
+                    self._data, source_fs = soundfile.read(
+                        file=self.filename,
+                        start=start_sample,
+                        stop=stop_sample,
+                        dtype=compute_dtype(default=numpy.float64).name
+                    )
 
                 self._data = self._data.T
 
@@ -818,8 +1119,8 @@ class AudioContainer(ContainerMixin, FileMixin):
                 else:
                     # Target sampling frequency defined, possibly re-sample signal.
                     if fs != source_fs:
-                        self._data = librosa.core.resample(
-                            self._data,
+                        self._data = resample(
+                            y=self._data,
                             orig_sr=source_fs,
                             target_sr=fs,
                             res_type=res_type
@@ -852,14 +1153,55 @@ class AudioContainer(ContainerMixin, FileMixin):
                     # Use target sampling frequency
                     sr = fs
 
-                self._data, self.fs = librosa.load(
-                    self.filename,
-                    sr=sr,
-                    mono=mono,
-                    res_type=res_type,
-                    offset=offset,
-                    duration=duration
-                )
+                if seekable:
+                    # Seek directly to the segment, sample indexing and output as in librosa.load
+                    start_sample = int(offset * info['fs'])
+                    stop_sample = None
+                    if duration is not None:
+                        stop_sample = start_sample + int(duration * info['fs'])
+
+                    data, source_fs = audio_reader_cache.read(
+                        filename=self.filename,
+                        start=start_sample,
+                        stop=stop_sample,
+                        dtype=compute_dtype(default=numpy.float32).name
+                    )
+                    data = data.T
+
+                    if mono and data.ndim > 1:
+                        data = numpy.mean(data, axis=0)
+
+                    if sr is not None and sr != source_fs:
+                        data = resample(
+                            y=data,
+                            orig_sr=source_fs,
+                            target_sr=sr,
+                            res_type=res_type
+                        )
+
+                    else:
+                        sr = source_fs
+
+                    self._data, self.fs = data, sr
+
+                else:
+                    self._data, self.fs = librosa.load(
+                        self.filename,
+                        sr=None,
+                        mono=mono,
+                        offset=offset,
+                        duration=duration,
+                        dtype=compute_dtype(default=numpy.float32)
+                    )
+
+                    if sr is not None and sr != self.fs:
+                        self._data = resample(
+                            y=self._data,
+                            orig_sr=self.fs,
+                            target_sr=sr,
+                            res_type=res_type
+                        )
+                        self.fs = sr
 
                 if not auto_trimming and duration is not None and round(duration, 6) != self.duration_sec:
                     message = '{name}: Check start and stop parameter, requested duration exceeds the file length [{file}]'.format(
@@ -888,6 +1230,9 @@ class AudioContainer(ContainerMixin, FileMixin):
             self.logger.exception(message)
             raise IOError(message)
 
+        # Resampling can change the data type
+        self._data = to_compute_dtype(self._data)
+
         # Check if after load function is defined, call if found
         if hasattr(self, '_after_load'):
             self._after_load()
@@ -897,6 +1242,184 @@ class AudioContainer(ContainerMixin, FileMixin):
 
         return self
 
+    def _resample_cache_filename(self, path, fs, res_type):
+        """Filename of the resampled audio in the cache
+
+        Parameters
+        ----------
+        path : str
+            Cache path
+
+        fs : int
+            Target sampling frequency
+
+        res_type : str
+            Resample type
+
+        Returns
+        -------
+        str
+
+        """
+
+        key = (os.path.abspath(self.filename),) + AudioInfoCache.stamp(self.filename)
+        if key not in _file_hashes:
+            _file_hashes[key] = get_file_hash(self.filename)
+
+        return os.path.join(
+            path,
+            '{hash}_{fs}_{res_type}.npy'.format(hash=_file_hashes[key], fs=fs, res_type=res_type)
+        )
+
+    @classmethod
+    def load_batch(cls, items, n_jobs=4, ordered=True, max_in_flight=None,
+                   res_type='kaiser_best', reader_cache=True, resample_cache_path=None):
+        """Load audio for many requests with a thread pool
+
+        Decoding runs in worker threads (soundfile releases the GIL while reading), while at most max_in_flight
+        requests are submitted ahead of the consumer. Containers are yielded as soon as they are available,
+        either in the request order or in the completion order.
+
+        Parameters
+        ----------
+        items : list of dict or list of tuple
+            Load requests, dict with fields filename, start, stop, fs, and mono, or tuple
+            (filename, start, stop, fs, mono). Fields other than filename are optional, start and stop in seconds.
+
+        n_jobs : int
+            Amount of worker threads.
+            Default value 4
+
+        ordered : bool
+            Yield containers in the request order. If False, tuples (request index, container) are yielded in
+            the completion order.
+            Default value True
+
+        max_in_flight : int, optional
+            Maximum amount of requests submitted but not yet yielded, if None two times n_jobs is used.
+            Default value None
+
+        res_type : str
+            Resample type, see `dcase_util.utils.resampler_list`.
+            Default value 'kaiser_best'
+
+        reader_cache : bool
+            Use the process-wide reader cache, see `load`.
+            Default value True
+
+        resample_cache_path : str
+            Path to store resampled audio, see `load`.
+            Default value None
+
+        Raises
+        ------
+        IOError:
+            File does not exists or has unknown file format, raised when the failed request is reached.
+
+        Returns
+        -------
+        generator of AudioContainer, or generator of tuple (int, AudioContainer)
+
+        """
+
+        from multiprocessing.pool import ThreadPool
+        from six.moves import queue
+
+        items = [cls._load_request(item) for item in items]
+
+        if n_jobs is None or n_jobs < 1:
+            n_jobs = 1
+
+        if max_in_flight is None:
+            max_in_flight = 2 * n_jobs
+
+        max_in_flight = max(max_in_flight, 1)
+
+        # Data type policy of the caller thread, used also in the worker threads
+        policy = get_dtype_policy()
+
+        def load_item(index):
+            try:
+                with DtypePolicy(**policy):
+                    container = cls().load(
+                        res_type=res_type,
+                        reader_cache=reader_cache,
+                        resample_cache_path=resample_cache_path,
+                        **items[index]
+                    )
+
+                return index, container, None
+
+            except Exception:
+                return index, None, sys.exc_info()
+
+        pool = ThreadPool(processes=n_jobs)
+        completed = queue.Queue()
+        pending = collections.deque()
+
+        try:
+            next_index = 0
+            while next_index < len(items) or pending:
+                # Keep the in-flight queue full
+                while next_index < len(items) and len(pending) < max_in_flight:
+                    pending.append(
+                        pool.apply_async(load_item, (next_index,), callback=None if ordered else completed.put)
+                    )
+                    next_index += 1
+
+                if ordered:
+                    index, container, error = pending.popleft().get()
+
+                else:
+                    index, container, error = completed.get()
+                    pending.popleft()
+
+                if error is not None:
+                    six.reraise(*error)
+
+                if ordered:
+                    yield container
+
+                else:
+                    yield index, container
+
+        finally:
+            pool.terminate()
+
+    @staticmethod
+    def _load_request(item):
+        """Load request as keyword arguments for load
+
+        Parameters
+        ----------
+        item : dict or tuple or str
+            Load request
+
+        Returns
+        -------
+        dict
+
+        """
+
+        if isinstance(item, six.string_types):
+            item = {'filename': item}
+
+        elif isinstance(item, (tuple, list)):
+            item = dict(zip(['filename', 'start', 'stop', 'fs', 'mono'], item))
+
+        request = {
+            'filename': item['filename'],
+            'start': item.get('start'),
+            'stop': item.get('stop'),
+            'fs': item.get('fs', 'native'),
+            'mono': item.get('mono', False)
+        }
+
+        if request['fs'] is None:
+            request['fs'] = 'native'
+
+        return request
+
     def save(self, filename=None, bit_depth=16, bit_rate=None):
         """Save audio
 
@@ -1316,11 +1839,11 @@ class AudioContainer(ContainerMixin, FileMixin):
             Target sampling rate
 
         scale : bool
-            Scale the resampled signal to have approximately equal total energy (see `librosa.core.resample`).
+            Scale the resampled signal to have approximately equal total energy.
             Default value True
 
         res_type : str
-            Resample type (see `librosa.core.resample`)
+            Resample type, see `dcase_util.utils.resampler_list`. Types not registered are passed to Librosa.
             Default value 'kaiser_best'
 
         Returns
@@ -1330,8 +1853,7 @@ class AudioContainer(ContainerMixin, FileMixin):
         """
 
         if target_fs != self.fs:
-            self._data = numpy.asfortranarray(self._data)
-            self._data = librosa.resample(
+            self._data = resample(
                 y=self._data,
                 orig_sr=self.fs,
                 target_sr=target_fs,
@@ -1479,11 +2001,7 @@ class AudioContainer(ContainerMixin, FileMixin):
 
             elif self.channels > 1:
                 # We have multichannel audio
-                focused_data = []
-                for channel_data in self._data:
-                    focused_data.append(channel_data[focus_start_samples:focus_stop_samples])
-
-                focused_data = numpy.vstack(focused_data)
+                focused_data = self._data[:, focus_start_samples:focus_stop_samples]
 
         else:
             focused_data = self._data
@@ -1513,9 +2031,12 @@ class AudioContainer(ContainerMixin, FileMixin):
 
     def frames(self,
                frame_length=None, hop_length=None,
-               frame_length_seconds=None, hop_length_seconds=None):
+               frame_length_seconds=None, hop_length_seconds=None,
+               frames_last=True, copy=False):
         """Slice audio into overlapping frames.
 
+        Frames are returned as a read-only strided view to the audio data, no data is copied.
+
         Parameters
         ----------
         frame_length : int, optional
@@ -1534,6 +2055,16 @@ class AudioContainer(ContainerMixin, FileMixin):
             Frame hop length in seconds, converted into samples based on sampling rate.
             Default value None
 
+        frames_last : bool
+            Frame index on the last axis, output shape (frame_length, frames) or (channels, frame_length, frames).
+            If False, frame samples are on the last axis, output shape (frames, frame_length) or
+            (channels, frames, frame_length).
+            Default value True
+
+        copy : bool
+            Return writable contiguous copy instead of the view.
+            Default value False
+
         Raises
         ------
         ValueError:
@@ -1566,31 +2097,66 @@ class AudioContainer(ContainerMixin, FileMixin):
             self.logger.exception(message)
             raise ValueError(message)
 
-        if self.channels == 1:
-            return librosa.util.frame(
-                x=self.get_focused(),
-                frame_length=frame_length,
-                hop_length=hop_length
-            )
+        data = self.get_focused()
 
-        else:
-            data = []
-            for channel_id, channel_data in enumerate(self.get_focused()):
-                data.append(
-                    librosa.util.frame(
-                        x=channel_data,
-                        frame_length=frame_length,
-                        hop_length=hop_length
-                    )
-                )
+        frames = self._strided_frames(
+            data=data,
+            frame_length=frame_length,
+            hop_length=hop_length,
+            frame_count=max(0, 1 + (data.shape[-1] - frame_length) // hop_length)
+        )
+
+        if frames_last:
+            frames = numpy.swapaxes(frames, -1, -2)
+
+        if copy:
+            frames = numpy.ascontiguousarray(frames)
+
+        return frames
+
+    @staticmethod
+    def _strided_frames(data, frame_length, hop_length, frame_count, start=0):
+        """Read-only strided view to equal-length frames along the last axis
+
+        Parameters
+        ----------
+        data : numpy.ndarray [shape=(..., n)]
+            Audio data
+
+        frame_length : int
+            Frame length in samples
+
+        hop_length : int
+            Hop length in samples
+
+        frame_count : int
+            Amount of frames
+
+        start : int
+            Start of the first frame in samples
+            Default value 0
+
+        Returns
+        -------
+        numpy.ndarray [shape=(..., frame_count, frame_length)]
+
+        """
+
+        data = data[..., start:]
 
-            return numpy.array(data)
+        return numpy.lib.stride_tricks.as_strided(
+            data,
+            shape=data.shape[:-1] + (frame_count, frame_length),
+            strides=data.strides[:-1] + (data.strides[-1] * hop_length, data.strides[-1]),
+            writeable=False
+        )
 
     def segments(self,
                  segment_length=None, segment_length_seconds=None,
                  segments=None,
                  active_segments=None,
-                 skip_segments=None):
+                 skip_segments=None,
+                 as_array=False, copy=False):
         """Slice audio into segments.
 
         Parameters
@@ -1623,14 +2189,25 @@ class AudioContainer(ContainerMixin, FileMixin):
             within this method.
             Default value None
 
+        as_array : bool
+            Return segments as a single array, shape (segments, segment_length) or
+            (channels, segments, segment_length). Equally spaced segments are returned as a read-only strided view to
+            the audio data without copying. All segments should have the same length.
+            Default value False
+
+        copy : bool
+            Return writable contiguous copies instead of the views.
+            Default value False
+
         Raises
         ------
         ValueError:
             No segments and no segment_length given.
+            Segments with different lengths or exceeding the signal when as_array is used.
 
         Returns
         -------
-        list, MetaDataContainer
+        list or numpy.ndarray, MetaDataContainer
 
         """
         from dcase_util.containers import MetaDataContainer
@@ -1640,10 +2217,32 @@ class AudioContainer(ContainerMixin, FileMixin):
             segment_length = int(self.fs * segment_length_seconds)
 
         if segments is None and segment_length is not None:
+            skip_index = None
             if skip_segments is not None:
                 # Make sure skip segments is MetaDataContainer
                 skip_segments = MetaDataContainer(skip_segments)
 
+                # Index skip segments once, in samples. Segment start only moves forward, skip segments ending at
+                # or before it need not to be considered.
+                skip_index = IntervalIndex(
+                    onsets=[int(self.fs * item.onset) for item in skip_segments],
+                    offsets=[int(self.fs * item.offset) for item in skip_segments]
+                )
+
+                def skip_start(segment_start):
+                    # Move segment start past skip segments overlapping with the segment, segment stop sample is
+                    # not part of the segment
+                    while True:
+                        position = skip_index.first_overlap(
+                            start=segment_start,
+                            stop=segment_start + segment_length - 1
+                        )
+
+                        if position is None:
+                            return segment_start
+
+                        segment_start = skip_index.offsets[position]
+
             if active_segments is not None:
                 # Make sure active segments is MetaDataContainer
                 active_segments = MetaDataContainer(active_segments)
@@ -1655,17 +2254,10 @@ class AudioContainer(ContainerMixin, FileMixin):
                     while segment_start + segment_length < int(self.fs * active_seg.offset):
                         # Segment stop
                         segment_stop = segment_start + segment_length
-                        if skip_segments is not None:
-                            # Go through skip segments and adjust segment start and stop to avoid segments
-                            for item in skip_segments:
-                                if item.active_within_segment(
-                                        start=segment_start / float(self.fs),
-                                        stop=segment_stop / float(self.fs)
-                                ):
-                                    # Adjust segment start to avoid current skip segment
-                                    segment_start = int(self.fs * item.offset)
-                                    # Adjust segment stop accordingly
-                                    segment_stop = segment_start + segment_length
+                        if skip_index is not None:
+                            # Adjust segment start and stop to avoid skip segments
+                            segment_start = skip_start(segment_start)
+                            segment_stop = segment_start + segment_length
 
                         if segment_stop < self.length:
                             # Valid segment found, store it
@@ -1690,17 +2282,10 @@ class AudioContainer(ContainerMixin, FileMixin):
                 while True:
                     # Segment stop
                     segment_stop = segment_start + segment_length
-                    if skip_segments is not None:
-                        # Go through skip segments and adjust segment start and stop to avoid segments
-                        for item in skip_segments:
-                            if item.active_within_segment(
-                                start=segment_start/float(self.fs),
-                                stop=segment_stop/float(self.fs)
-                            ):
-                                # Adjust segment start to avoid current skip segment
-                                segment_start = int(self.fs * item.offset)
-                                # Adjust segment stop accordingly
-                                segment_stop = segment_start + segment_length
+                    if skip_index is not None:
+                        # Adjust segment start and stop to avoid skip segments
+                        segment_start = skip_start(segment_start)
+                        segment_stop = segment_start + segment_length
 
                     if segment_stop < self.length:
                         # Valid segment found, store it
@@ -1729,21 +2314,60 @@ class AudioContainer(ContainerMixin, FileMixin):
             self.logger.exception(message)
             raise ValueError(message)
 
-        # Get audio segments
-        data = []
-        for segment in segments:
-            segment_start_samples = int(self.fs * segment.onset)
-            segment_stop_samples = int(self.fs * segment.offset)
-            if self.channels > 1:
-                data.append(
-                    self._data[:, segment_start_samples:segment_stop_samples]
+        segment_start_samples = [int(round(self.fs * segment.onset)) for segment in segments]
+        segment_stop_samples = [int(round(self.fs * segment.offset)) for segment in segments]
+
+        if as_array:
+            lengths = set([stop - start for start, stop in zip(segment_start_samples, segment_stop_samples)])
+
+            if len(lengths) > 1:
+                message = '{name}: Segments should have the same length to return them as array.'.format(
+                    name=self.__class__.__name__
+                )
+                self.logger.exception(message)
+                raise ValueError(message)
+
+            if segment_stop_samples and max(segment_stop_samples) > self.length:
+                message = '{name}: Segments exceed the signal length.'.format(
+                    name=self.__class__.__name__
+                )
+                self.logger.exception(message)
+                raise ValueError(message)
+
+            length = lengths.pop() if lengths else segment_length or 0
+            hops = set(numpy.diff(segment_start_samples))
+
+            if len(hops) <= 1 and (not hops or min(hops) > 0):
+                # Equally spaced segments, strided view
+                data = self._strided_frames(
+                    data=self._data,
+                    frame_length=length,
+                    hop_length=hops.pop() if hops else 1,
+                    frame_count=len(segment_start_samples),
+                    start=segment_start_samples[0] if segment_start_samples else 0
                 )
 
             else:
-                data.append(
-                    self._data[segment_start_samples:segment_stop_samples]
+                data = numpy.stack(
+                    [self._data[..., start:start + length] for start in segment_start_samples],
+                    axis=-2
                 )
 
+            if copy:
+                data = numpy.ascontiguousarray(data)
+
+            return data, segments
+
+        # Get audio segments
+        data = []
+        for segment_start, segment_stop in zip(segment_start_samples, segment_stop_samples):
+            segment_data = self._data[..., segment_start:segment_stop]
+
+            if copy:
+                segment_data = segment_data.copy()
+
+            data.append(segment_data)
+
         return data, segments
 
     def pad(self, type='silence', length=None, length_seconds=None):
@@ -12,7 +12,7 @@ from past.builtins import basestring
 
 from dcase_util.containers import ObjectContainer, RepositoryContainer, OneToOneMappingContainer
 from dcase_util.ui import FancyStringifier
-from dcase_util.utils import FileFormat, filelist_exists
+from dcase_util.utils import FileFormat, filelist_exists, to_storage_dtype, from_storage_dtype, is_memory_mapped
 
 
 class DataContainer(ObjectContainer):
@@ -137,6 +137,20 @@ class DataContainer(ObjectContainer):
         self.focus_start = d['_focus_start']
         self.focus_stop = d['_focus_stop']
 
+    def _before_save(self, data):
+        # Store data in the storage data type
+        if '_data' in data:
+            data = dict(data)
+            data['_data'] = to_storage_dtype(data['_data'])
+
+        return data
+
+    def _after_load(self):
+        # Data from the storage data type into the compute data type, memory-mapped data is kept in the storage
+        # data type as conversion would read it fully into the memory
+        if not is_memory_mapped(self._data):
+            self._data = from_storage_dtype(self._data)
+
     def __add__(self, other):
         new = copy.deepcopy(self)
         if isinstance(other, DataContainer):
@@ -517,8 +531,8 @@ class DataContainer(ObjectContainer):
             'mean': numpy.mean(self.data, axis=self.time_axis),
             'std': numpy.std(self.data, axis=self.time_axis),
             'n': self.data.shape[self.time_axis],
-            's1': numpy.sum(self.data, axis=self.time_axis),
-            's2': numpy.sum(self.data ** 2, axis=self.time_axis),
+            's1': numpy.sum(self.data, axis=self.time_axis, dtype=numpy.float64),
+            's2': numpy.sum(numpy.square(self.data, dtype=numpy.float64), axis=self.time_axis),
         }
 
     def _time_to_frame(self, time, rounding_direction=None):
@@ -2425,7 +2439,7 @@ class DataRepository(RepositoryContainer):
         else:
             return None
 
-    def load(self, filename=None, collect_from_containers=True):
+    def load(self, filename=None, collect_from_containers=True, **kwargs):
         """Load file list
 
         Parameters
@@ -2441,6 +2455,9 @@ class DataRepository(RepositoryContainer):
             Collect data to the repository from separate containers.
             Default value True
 
+        kwargs
+            Extra parameters passed to the load method of the item containers.
+
         Returns
         -------
         self
@@ -2464,11 +2481,15 @@ class DataRepository(RepositoryContainer):
                 filename_base, file_extension = os.path.splitext(self.filename)
                 containers = glob.glob(filename_base + '.*-*' + file_extension)
                 for filename in containers:
+                    if os.path.isfile(os.path.splitext(filename)[0]):
+                        # Sidecar file of another container, skip it
+                        continue
+
                     label, stream_id = os.path.splitext(filename)[0].split('.')[-1].split('-')
                     if label not in self:
                         self[label] = {}
 
-                    self[label][int(stream_id)] = self.item_class().load(filename=filename)
+                    self[label][int(stream_id)] = self.item_class().load(filename=filename, **kwargs)
 
         elif isinstance(self.filename, dict):
             sorted(self.filename)
@@ -2483,11 +2504,11 @@ class DataRepository(RepositoryContainer):
                         # Skip labels starting with '_', those are just for extra info
                         if isinstance(data, basestring):
                             # filename given directly, only one feature stream per method inputted.
-                            self[label][self.default_stream_id] = self.item_class().load(filename=data)
+                            self[label][self.default_stream_id] = self.item_class().load(filename=data, **kwargs)
 
                         elif isinstance(data, dict):
                             for stream, filename in iteritems(data):
-                                self[label][stream] = self.item_class().load(filename=filename)
+                                self[label][stream] = self.item_class().load(filename=filename, **kwargs)
 
             else:
                 # All filenames did not exists, find which ones is missing and raise error.
@@ -2522,7 +2543,7 @@ class DataRepository(RepositoryContainer):
 
         return self
 
-    def save(self, filename=None, split_into_containers=False):
+    def save(self, filename=None, split_into_containers=False, **kwargs):
         """Save file
 
         Parameters
@@ -2535,6 +2556,9 @@ class DataRepository(RepositoryContainer):
             Split data from repository separate containers and save them individually.
             Default value False
 
+        kwargs
+            Parameters passed to save method of the containers, when saved individually.
+
         Raises
         ------
         ImportError:
@@ -2584,7 +2608,7 @@ class DataRepository(RepositoryContainer):
                     for stream_id in self.stream_ids(label=label):
                         if stream_id in self.filename[label]:
                             current_container = self.get_container(label=label, stream_id=stream_id)
-                            current_container.save(filename=self.filename[label][stream_id])
+                            current_container.save(filename=self.filename[label][stream_id], **kwargs)
 
         return self
 
@@ -3,14 +3,30 @@
 
 
 from __future__ import print_function, absolute_import
+import os
+from past.builtins import basestring
+import numpy
 
-from dcase_util.containers import DataMatrix2DContainer, DataRepository
-from dcase_util.utils import FileFormat
+from dcase_util.containers import ObjectContainer, DataMatrix2DContainer, DataRepository
+from dcase_util.ui import FancyStringifier
+from dcase_util.utils import FileFormat, to_storage_dtype, from_storage_dtype, encode_array, decode_array, \
+    is_memory_mapped
 
 
 class FeatureContainer(DataMatrix2DContainer):
-    """Feature container class for a single feature matrix, inherited from DataContainer."""
-    valid_formats = [FileFormat.CPICKLE]  #: Valid file formats
+    """Feature container class for a single feature matrix, inherited from DataContainer.
+
+    Feature matrix can be stored either as a pickled object (CPICKLE), or as a native numpy array (NUMPY). With
+    NUMPY format the matrix is stored into a `.npy` file and the rest of the container (time resolution,
+    metadata, processing chain) into a sidecar file next to it (`[filename].cpickle`). Native array files can be
+    opened as memory-mapped arrays, this way only the accessed part of the matrix is read from the disk.
+
+    Feature matrix can be stored in a reduced form with `storage_type` and `compression` parameters of `save`:
+    as float16, as 8-bit integers with per-band scale and offset ('int8' or 'uint8'), and compressed with zlib or
+    lz4. Storage form is recorded into the file, and `load` restores the matrix transparently.
+
+    """
+    valid_formats = [FileFormat.CPICKLE, FileFormat.NUMPY]  #: Valid file formats
 
     def __init__(self, data=None, stats=None, metadata=None, time_resolution=None, processing_chain=None, **kwargs):
         kwargs.update({
@@ -35,15 +51,227 @@ class FeatureContainer(DataMatrix2DContainer):
     def hop_length_seconds(self, value):
         self.time_resolution = value
 
+    @property
+    def memory_mapped(self):
+        """Feature matrix is memory-mapped from the disk
+
+        Returns
+        -------
+        bool
+
+        """
+
+        return is_memory_mapped(self.data)
+
+    @staticmethod
+    def sidecar_filename(filename):
+        """Filename of the sidecar file used to store container information along with the NUMPY format.
+
+        Parameters
+        ----------
+        filename : str
+            Filename of the feature matrix file
+
+        Returns
+        -------
+        str
+
+        """
+
+        return filename + '.cpickle'
+
+    def load(self, filename=None, mmap_mode=None):
+        """Load file
+
+        Parameters
+        ----------
+        filename : str, optional
+            File path
+            Default value filename given to class constructor
+
+        mmap_mode : {None, 'r', 'r+', 'c'}
+            Memory-map mode used with NUMPY format (see `numpy.load`). If None, feature matrix is fully read into
+            the memory. Memory-mapped feature matrix is kept in the stored data type, it is not converted into the
+            compute data type. Parameter is ignored with other formats, and with quantized or compressed feature
+            matrix.
+            Default value None
+
+        Raises
+        ------
+        IOError:
+            File does not exists or has unknown file format
+
+        Returns
+        -------
+        self
+
+        """
+
+        if filename:
+            self.filename = filename
+            self.detect_file_format()
+            self.validate_format()
+
+        if self.format != FileFormat.NUMPY:
+            return super(FeatureContainer, self).load()
+
+        if not self.exists():
+            message = '{name}: File does not exists [{file}]'.format(name=self.__class__.__name__, file=self.filename)
+            self.logger.exception(message)
+            raise IOError(message)
+
+        current_filename = self.filename
+        current_format = self.format
+
+        sidecar_filename = self.sidecar_filename(filename=self.filename)
+        if os.path.isfile(sidecar_filename):
+            from dcase_util.files import Serializer
+            self.__dict__.update(Serializer.load_cpickle(filename=sidecar_filename))
+
+        self.filename = current_filename
+        self.format = current_format
+
+        # Set data directly to keep possible stats and focus loaded from the sidecar file
+        self._data = numpy.load(self.filename, mmap_mode=mmap_mode)
+
+        # Check if after load function is defined, call if found
+        if hasattr(self, '_after_load'):
+            self._after_load()
+
+        return self
+
+    def save(self, filename=None, storage_type=None, compression=None):
+        """Save file
+
+        Parameters
+        ----------
+        filename : str, optional
+            File path
+            Default value filename given to class constructor
+
+        storage_type : str
+            Storage type of the feature matrix, 'float16', 'float32', 'float64', or 'int8' or 'uint8' for
+            quantization with per-band scale and offset. If None, storage data type of the policy is used.
+            Default value None
+
+        compression : str
+            Compression of the feature matrix, 'zlib' or 'lz4' (requires lz4 module). If None, feature matrix is not
+            compressed.
+            Default value None
+
+        Raises
+        ------
+        IOError:
+            File has unknown file format
+
+        ValueError:
+            Invalid storage type or compression
+
+        Returns
+        -------
+        self
+
+        """
+
+        if filename:
+            self.filename = filename
+            self.detect_file_format()
+            self.validate_format()
+
+        if storage_type is not None or compression is not None:
+            # Picked up by _before_save
+            self._storage_options = {
+                'storage_type': storage_type,
+                'compression': compression
+            }
+
+        try:
+            if self.format != FileFormat.NUMPY:
+                return super(FeatureContainer, self).save()
+
+            return self._save_numpy()
+
+        finally:
+            self.__dict__.pop('_storage_options', None)
+
+    def _save_numpy(self):
+        if self.filename is None or self.filename == '':
+            message = '{name}: Filename is empty [{filename}]'.format(
+                name=self.__class__.__name__,
+                filename=self.filename
+            )
+
+            self.logger.exception(message)
+            raise IOError(message)
+
+        from dcase_util.files import Serializer
+        data = dict(self.__dict__)
+
+        # Check if before save function is defined, call if found
+        if hasattr(self, '_before_save'):
+            data = self._before_save(data)
+
+        matrix = data.pop('_data')
+        sidecar_filename = self.sidecar_filename(filename=self.filename)
+
+        try:
+            # Use file handle to prevent numpy from appending extension to the filename
+            with open(self.filename, 'wb') as file_handle:
+                numpy.save(file_handle, numpy.asarray(matrix), allow_pickle=False)
+
+            Serializer.save_cpickle(filename=sidecar_filename, data=data)
+
+        except KeyboardInterrupt:
+            # Delete the files, since most likely they were not saved fully
+            for current_filename in [self.filename, sidecar_filename]:
+                if os.path.isfile(current_filename):
+                    os.remove(current_filename)
+
+            raise
+
+        # Check if after save function is defined, call if found
+        if hasattr(self, '_after_save'):
+            self._after_save()
+
+        return self
+
+    def _before_save(self, data):
+        data = dict(data)
+        options = data.pop('_storage_options', None)
+
+        if options is None or '_data' not in data:
+            return super(FeatureContainer, self)._before_save(data)
+
+        if options['storage_type'] is None:
+            # Storage data type of the policy, compressed
+            data = super(FeatureContainer, self)._before_save(data)
+
+        data['_data'], data['_storage'] = encode_array(
+            data=data['_data'],
+            storage_type=options['storage_type'],
+            compression=options['compression']
+        )
+
+        return data
+
+    def _after_load(self):
+        # Restore quantized or compressed feature matrix
+        storage = self.__dict__.pop('_storage', None)
+        if storage is not None:
+            self._data = decode_array(data=self._data, info=storage)
+
+        super(FeatureContainer, self)._after_load()
+
 
 class FeatureRepository(DataRepository):
     """Feature repository container class to store multiple FeatureContainers together.
 
-    Feature containers for each method are stored in a dict. Method label is used as dictionary key.
+    Feature containers for each method are stored in a dict. Method label is used as dictionary key. With NUMPY
+    format the repository is always stored as separate containers (one `.npy` file per label and stream).
 
     """
 
-    valid_formats = [FileFormat.CPICKLE]  #: Valid file formats
+    valid_formats = [FileFormat.CPICKLE, FileFormat.NUMPY]  #: Valid file formats
 
     def __init__(self, filename=None, default_stream_id=0, processing_chain=None, **kwargs):
         """Constructor
@@ -77,6 +305,106 @@ class FeatureRepository(DataRepository):
 
         self.item_class = FeatureContainer
 
+    def load(self, filename=None, collect_from_containers=True, mmap_mode=None):
+        """Load file list
+
+        Parameters
+        ----------
+        filename : str or dict
+            Either one filename (str) or multiple filenames in a dictionary. If None given, parameter given to
+            class initializer is used instead.
+            Default value None
+
+        collect_from_containers : bool
+            Collect data to the repository from separate containers.
+            Default value True
+
+        mmap_mode : {None, 'r', 'r+', 'c'}
+            Memory-map mode used for containers stored in NUMPY format (see `numpy.load`).
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        if mmap_mode is not None:
+            return super(FeatureRepository, self).load(
+                filename=filename,
+                collect_from_containers=collect_from_containers,
+                mmap_mode=mmap_mode
+            )
+
+        else:
+            return super(FeatureRepository, self).load(
+                filename=filename,
+                collect_from_containers=collect_from_containers
+            )
+
+    def save(self, filename=None, split_into_containers=False, storage_type=None, compression=None):
+        """Save file
+
+        Parameters
+        ----------
+        filename : str or dict
+            File path
+            Default value filename given to class constructor
+
+        split_into_containers : bool
+            Split data from repository separate containers and save them individually. With NUMPY format
+            containers are always saved separately.
+            Default value False
+
+        storage_type : str
+            Storage type of the feature matrices, see `FeatureContainer.save`. Available only when containers are
+            saved separately.
+            Default value None
+
+        compression : str
+            Compression of the feature matrices, see `FeatureContainer.save`. Available only when containers are
+            saved separately.
+            Default value None
+
+        Raises
+        ------
+        IOError:
+            File has unknown file format
+
+        ValueError:
+            Storage type or compression given for repository saved into single file
+
+        Returns
+        -------
+        self
+
+        """
+
+        if filename:
+            self.filename = filename
+
+        if isinstance(self.filename, basestring) and FileFormat.detect(filename=self.filename) == FileFormat.NUMPY:
+            # Native array files can hold only single feature matrix
+            split_into_containers = True
+
+        if storage_type is None and compression is None:
+            return super(FeatureRepository, self).save(
+                split_into_containers=split_into_containers
+            )
+
+        if isinstance(self.filename, basestring) and not split_into_containers:
+            message = '{name}: Storage type and compression are available only when containers are saved separately.'.format(
+                name=self.__class__.__name__
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        return super(FeatureRepository, self).save(
+            split_into_containers=split_into_containers,
+            storage_type=storage_type,
+            compression=compression
+        )
+
     def detect_file_format(self, filename=None):
         """Detect file format from extension
 
@@ -177,4 +505,460 @@ class FeatureRepository(DataRepository):
                 raise IOError(message)
 
         else:
-            return True
\ No newline at end of file
+            return True
+
+
+class FeatureStore(ObjectContainer):
+    """Feature store class to pack feature matrices of a whole dataset into a few large shard files.
+
+    Feature matrices are appended as raw arrays into shard files (`[filename base].shard-[id].bin`) next to the
+    store index file. The index (the store file itself, CPICKLE format) maps item key (e.g. audio filename), label
+    and stream id to the shard, byte offset, shape and dtype of the stored matrix. Shard files are opened once as
+    memory-mapped arrays, and matrices are returned as read-only views to them. This way reading an item does not
+    need any file system metadata operations.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        store = dcase_util.containers.FeatureStore(filename='features/store.cpickle')
+        store.set_container(key='audio/file1.wav', container=features1)
+        store.set_repository(key='audio/file2.wav', repository=repository2)
+        store.save()
+
+        features1 = dcase_util.containers.FeatureStore().load(
+            filename='features/store.cpickle'
+        ).get_container(key='audio/file1.wav')
+
+    """
+
+    valid_formats = [FileFormat.CPICKLE]  #: Valid file formats
+
+    def __init__(self, filename=None, shard_size=1024, alignment=64, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        filename : str
+            Filename of the store index, shard files are stored into the same directory.
+            Default value None
+
+        shard_size : int
+            Maximum shard file size in megabytes, new shard file is started once the current one exceeds this.
+            Default value 1024
+
+        alignment : int
+            Byte alignment of the matrices inside the shard files.
+            Default value 64
+
+        """
+
+        kwargs.update({
+            'filename': filename
+        })
+
+        super(FeatureStore, self).__init__(**kwargs)
+
+        self.shard_size = shard_size
+        self.alignment = alignment
+
+        # Index, item key as key1, label as key2, stream id as key3. Plain containers are stored with label None.
+        self.index = {}
+
+        # Shard filenames, relative to the store directory
+        self.shards = []
+
+        # Memory-mapped shards
+        self._shard_maps = {}
+
+    def __getstate__(self):
+        d = super(FeatureStore, self).__getstate__()
+        d.update({
+            'filename': self.filename,
+            'format': self.format,
+            'shard_size': self.shard_size,
+            'alignment': self.alignment,
+            'index': self.index,
+            'shards': self.shards,
+        })
+
+        return d
+
+    def __setstate__(self, d):
+        super(FeatureStore, self).__setstate__(d)
+
+        self.filename = d['filename']
+        self.format = d['format']
+        self.shard_size = d['shard_size']
+        self.alignment = d['alignment']
+        self.index = d['index']
+        self.shards = d['shards']
+        self._shard_maps = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def __contains__(self, key):
+        return key in self.index
+
+    def to_string(self, ui=None, indent=0):
+        """Get container information in a string
+
+        Parameters
+        ----------
+        ui : FancyStringifier or FancyHTMLStringifier
+            Stringifier class
+            Default value FancyStringifier
+
+        indent : int
+            Amount of indent
+            Default value 0
+
+        Returns
+        -------
+        str
+
+        """
+
+        if ui is None:
+            ui = FancyStringifier()
+
+        output = super(FeatureStore, self).to_string(ui=ui, indent=indent)
+
+        output += ui.data(field='Items', value=len(self), indent=indent) + '\n'
+        output += ui.data(field='Shards', value=len(self.shards), indent=indent) + '\n'
+        output += ui.data(field='Shard size', value=self.shard_size, unit='MB', indent=indent) + '\n'
+
+        return output
+
+    @property
+    def keys(self):
+        """Item keys in the store
+
+        Returns
+        -------
+        list of str
+
+        """
+
+        return sorted(self.index.keys())
+
+    def get_labels(self, key):
+        """Labels stored for the item
+
+        Parameters
+        ----------
+        key : str
+            Item key
+
+        Returns
+        -------
+        list of str
+
+        """
+
+        if key in self.index:
+            return sorted([label for label in self.index[key] if label is not None])
+
+        else:
+            return None
+
+    def load(self, filename=None):
+        """Load store index
+
+        Parameters
+        ----------
+        filename : str, optional
+            File path
+            Default value filename given to class constructor
+
+        Raises
+        ------
+        IOError:
+            File does not exists or has unknown file format
+
+        Returns
+        -------
+        self
+
+        """
+
+        if filename:
+            self.filename = filename
+
+        # Keep current filename, store can be moved together with its shard files
+        current_filename = self.filename
+
+        super(FeatureStore, self).load(filename=filename)
+
+        self.filename = current_filename
+
+        return self
+
+    def _before_save(self, data):
+        data = dict(data)
+        data.pop('_shard_maps', None)
+        return data
+
+    def _after_load(self):
+        self._shard_maps = {}
+
+    def shard_path(self, shard_id):
+        """Path to the shard file
+
+        Parameters
+        ----------
+        shard_id : int
+            Shard id
+
+        Returns
+        -------
+        str
+
+        """
+
+        return os.path.join(os.path.dirname(os.path.abspath(self.filename)), self.shards[shard_id])
+
+    def _write_matrix(self, matrix):
+        if self.filename is None or self.filename == '':
+            message = '{name}: Filename is empty, set filename before adding data.'.format(
+                name=self.__class__.__name__
+            )
+
+            self.logger.exception(message)
+            raise IOError(message)
+
+        matrix = numpy.ascontiguousarray(to_storage_dtype(matrix))
+
+        if not self.shards or os.path.getsize(self.shard_path(len(self.shards) - 1)) + matrix.nbytes > self.shard_size * 1024 * 1024:
+            # Start new shard
+            self.shards.append(
+                os.path.splitext(os.path.basename(self.filename))[0] + '.shard-{shard_id:05d}.bin'.format(
+                    shard_id=len(self.shards)
+                )
+            )
+            open(self.shard_path(len(self.shards) - 1), 'wb').close()
+
+        shard_id = len(self.shards) - 1
+
+        with open(self.shard_path(shard_id), 'ab') as shard_file:
+            offset = shard_file.tell()
+            padding = (-offset) % self.alignment
+            if padding:
+                shard_file.write(b'\0' * padding)
+                offset += padding
+
+            matrix.tofile(shard_file)
+
+        # Shard changed, invalidate its memory map
+        self._shard_maps.pop(shard_id, None)
+
+        return {
+            'shard': shard_id,
+            'offset': offset,
+            'shape': matrix.shape,
+            'dtype': matrix.dtype.str
+        }
+
+    def _read_matrix(self, entry, memory_map=True):
+        if entry['shard'] not in self._shard_maps:
+            self._shard_maps[entry['shard']] = numpy.memmap(
+                self.shard_path(entry['shard']),
+                dtype=numpy.uint8,
+                mode='r'
+            )
+
+        dtype = numpy.dtype(entry['dtype'])
+        size = int(numpy.prod(entry['shape'])) * dtype.itemsize
+
+        matrix = self._shard_maps[entry['shard']][entry['offset']:entry['offset'] + size].view(dtype).reshape(
+            entry['shape']
+        )
+
+        if memory_map:
+            # Memory-mapped matrix is kept in the stored data type, conversion would read it into the memory
+            return matrix
+
+        # Converted only if the stored data type differs from the compute data type, conversion makes a copy
+        converted = from_storage_dtype(matrix)
+
+        if converted is not matrix:
+            return converted
+
+        else:
+            return numpy.array(matrix)
+
+    def set_container(self, key, container, label=None, stream_id=None):
+        """Store feature container
+
+        Parameters
+        ----------
+        key : str
+            Item key, e.g. audio filename
+
+        container : FeatureContainer or numpy.ndarray
+            Feature data
+
+        label : str
+            Label, used when container is part of a repository
+            Default value None
+
+        stream_id : str or int
+            Stream id, used when container is part of a repository
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        if isinstance(container, numpy.ndarray):
+            container = FeatureContainer(data=container)
+
+        entry = self._write_matrix(matrix=container.data)
+        entry.update({
+            'time_resolution': container.time_resolution,
+            'metadata': container.metadata,
+            'processing_chain': container.processing_chain
+        })
+
+        if key not in self.index:
+            self.index[key] = {}
+
+        if label not in self.index[key]:
+            self.index[key][label] = {}
+
+        self.index[key][label][stream_id] = entry
+
+        return self
+
+    def get_container(self, key, label=None, stream_id=None, memory_map=True):
+        """Get feature container
+
+        Parameters
+        ----------
+        key : str
+            Item key
+
+        label : str
+            Label, used when container is part of a repository
+            Default value None
+
+        stream_id : str or int
+            Stream id, used when container is part of a repository
+            Default value None
+
+        memory_map : bool
+            Return data as read-only view to the memory-mapped shard file, in the stored data type. If False, data
+            is read into the memory and converted into the compute data type.
+            Default value True
+
+        Raises
+        ------
+        ValueError:
+            Item not found from the store
+
+        Returns
+        -------
+        FeatureContainer
+
+        """
+
+        if key not in self.index or label not in self.index[key] or stream_id not in self.index[key][label]:
+            message = '{name}: Item not found [{key}][{label}][{stream_id}]'.format(
+                name=self.__class__.__name__,
+                key=key,
+                label=label,
+                stream_id=stream_id
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        entry = self.index[key][label][stream_id]
+
+        container = FeatureContainer(
+            time_resolution=entry['time_resolution'],
+            metadata=entry['metadata'],
+            processing_chain=entry['processing_chain']
+        )
+
+        # Set data directly to avoid stats calculation over the memory-mapped data
+        container._data = self._read_matrix(entry=entry, memory_map=memory_map)
+
+        return container
+
+    def set_repository(self, key, repository):
+        """Store feature repository
+
+        Parameters
+        ----------
+        key : str
+            Item key, e.g. audio filename
+
+        repository : FeatureRepository
+            Feature repository
+
+        Returns
+        -------
+        self
+
+        """
+
+        for label in repository.labels:
+            for stream_id in repository.stream_ids(label=label):
+                self.set_container(
+                    key=key,
+                    container=repository.get_container(label=label, stream_id=stream_id),
+                    label=label,
+                    stream_id=stream_id
+                )
+
+        return self
+
+    def get_repository(self, key, memory_map=True):
+        """Get feature repository
+
+        Parameters
+        ----------
+        key : str
+            Item key
+
+        memory_map : bool
+            Return data as read-only views to the memory-mapped shard file, in the stored data type. If False, data
+            is read into the memory and converted into the compute data type.
+            Default value True
+
+        Raises
+        ------
+        ValueError:
+            Item not found from the store
+
+        Returns
+        -------
+        FeatureRepository
+
+        """
+
+        if key not in self.index:
+            message = '{name}: Item not found [{key}]'.format(
+                name=self.__class__.__name__,
+                key=key
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        repository = FeatureRepository()
+        for label in self.get_labels(key=key):
+            repository[label] = {}
+            for stream_id in self.index[key][label]:
+                repository[label][stream_id] = self.get_container(
+                    key=key,
+                    label=label,
+                    stream_id=stream_id,
+                    memory_map=memory_map
+                )
+
+        return repository
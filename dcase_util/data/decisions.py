@@ -3,10 +3,10 @@
 
 from __future__ import print_function, absolute_import
 import numpy
-import copy
 import scipy
 
 from dcase_util.containers import ObjectContainer
+from dcase_util.utils import copy_unless_in_place
 
 
 class DecisionEncoder(ObjectContainer):
@@ -241,7 +241,7 @@ class DecisionEncoder(ObjectContainer):
             class_axis = 0
 
         # Get a copy of the activity_matrix to prevent data contamination
-        activity_matrix = copy.deepcopy(activity_matrix)
+        activity_matrix = copy_unless_in_place(activity_matrix)
 
         if operator == 'median_filtering':
             for class_id in range(0, activity_matrix.shape[class_axis]):
@@ -6,6 +6,7 @@ import numpy
 
 from dcase_util.containers import BinaryMatrix2DContainer, DataMatrix2DContainer
 from dcase_util.ui import FancyStringifier
+from dcase_util.utils import compute_dtype
 
 
 class BinaryMatrixEncoder(BinaryMatrix2DContainer):
@@ -163,7 +164,7 @@ class OneHotEncoder(BinaryMatrixEncoder):
             length_frames = self._length_to_frames(length_seconds)
 
         # Initialize binary matrix
-        binary_matrix = numpy.zeros((len(self.label_list), length_frames))
+        binary_matrix = numpy.zeros((len(self.label_list), length_frames), dtype=compute_dtype(default=numpy.float64))
 
         # Find correct row
         if label in self.label_list:
@@ -303,7 +304,7 @@ class ManyHotEncoder(BinaryMatrixEncoder):
             length_frames = self._length_to_frames(length_seconds)
 
         # Initialize binary matrix
-        binary_matrix = numpy.zeros((len(self.label_list), length_frames))
+        binary_matrix = numpy.zeros((len(self.label_list), length_frames), dtype=compute_dtype(default=numpy.float64))
 
         for label in label_list:
             if label in self.label_list:
@@ -448,7 +449,7 @@ class EventRollEncoder(BinaryMatrixEncoder):
             max_offset_frames = length_frames
 
         # Initialize event roll
-        event_roll = numpy.zeros((len(self.label_list), max_offset_frames))
+        event_roll = numpy.zeros((len(self.label_list), max_offset_frames), dtype=compute_dtype(default=numpy.float64))
 
         # Fill-in event_roll
         for item in metadata_container:
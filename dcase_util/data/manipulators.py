@@ -6,14 +6,14 @@ import six
 from six import iteritems
 import numpy
 import scipy
-import copy
 import os
 import glob
 from past.builtins import basestring
 
 from dcase_util.containers import ObjectContainer
 from dcase_util.ui import FancyStringifier
-from dcase_util.utils import VectorRecipeParser, filelist_exists
+from dcase_util.utils import VectorRecipeParser, filelist_exists, compute_dtype, to_compute_dtype, \
+    copy_unless_in_place, InPlace
 
 
 class Normalizer(ObjectContainer):
@@ -210,12 +210,13 @@ class Normalizer(ObjectContainer):
             stats = data.stats
 
         elif isinstance(data, numpy.ndarray):
+            # Sums are accumulated in float64 also for float32 data, variance is calculated from their difference
             stats = {
                 'mean': numpy.mean(data, axis=time_axis),
                 'std': numpy.std(data, axis=time_axis),
                 'n': data.shape[time_axis],
-                's1': numpy.sum(data, axis=time_axis),
-                's2': numpy.sum(data ** 2, axis=time_axis),
+                's1': numpy.sum(data, axis=time_axis, dtype=numpy.float64),
+                's2': numpy.sum(numpy.square(data, dtype=numpy.float64), axis=time_axis),
             }
 
         if stats:
@@ -271,16 +272,22 @@ class Normalizer(ObjectContainer):
         """
         from dcase_util.containers import DataContainer
 
-        # Make copy of data to prevent data contamination
-        data = copy.deepcopy(data)
+        mean = self.mean
+        std = self.std
+        if compute_dtype() is not None:
+            # Statistics in compute data type to avoid upcasting the data
+            mean = to_compute_dtype(numpy.asarray(mean))
+            std = to_compute_dtype(numpy.asarray(std))
 
         if isinstance(data, DataContainer):
-            data.data = (data.data - self.mean) / self.std
+            # Make copy of data to prevent data contamination
+            data = copy_unless_in_place(data)
+            data.data = to_compute_dtype((data.data - mean) / std)
 
             return data
 
         elif isinstance(data, numpy.ndarray):
-            return (data - self.mean) / self.std
+            return to_compute_dtype((data - mean) / std)
 
     def plot(self, plot=True, figsize=None):
         """Visualize normalization factors.
@@ -653,22 +660,24 @@ class RepositoryNormalizer(ObjectContainer):
         from dcase_util.containers import DataRepository
 
         # Make copy of data to prevent data contamination
-        data = copy.deepcopy(data)
+        data = copy_unless_in_place(data)
 
         if isinstance(data, DataRepository):
-            for label_id, label in enumerate(data.labels):
-                if label in self.normalizers:
-                    for stream_id in data.stream_ids(label=label):
-                        data.set_container(
-                            label=label,
-                            stream_id=stream_id,
-                            container=self.normalizers[label].normalize(
-                                data=data.get_container(
-                                    label=label,
-                                    stream_id=stream_id
+            # Containers belong to the copied repository, normalize them in-place
+            with InPlace():
+                for label_id, label in enumerate(data.labels):
+                    if label in self.normalizers:
+                        for stream_id in data.stream_ids(label=label):
+                            data.set_container(
+                                label=label,
+                                stream_id=stream_id,
+                                container=self.normalizers[label].normalize(
+                                    data=data.get_container(
+                                        label=label,
+                                        stream_id=stream_id
+                                    )
                                 )
                             )
-                        )
 
         return data
 
@@ -802,7 +811,7 @@ class Aggregator(ObjectContainer):
 
         from dcase_util.containers import DataContainer
         # Make copy of the data to prevent modifications to the original data
-        data = copy.deepcopy(data)
+        data = copy_unless_in_place(data)
 
         if isinstance(data, DataContainer):
             aggregated_data = []
@@ -865,7 +874,7 @@ class Aggregator(ObjectContainer):
 
             if aggregated_data:
                 # Update data
-                data.data = numpy.vstack(aggregated_data).T
+                data.data = to_compute_dtype(numpy.vstack(aggregated_data).T)
 
             else:
                 message = '{name}: No aggregated data, check your aggregation recipe.'.format(
@@ -1046,7 +1055,7 @@ class Sequencer(ObjectContainer):
 
         from dcase_util.containers import DataContainer, DataMatrix2DContainer, DataMatrix3DContainer
         # Make copy of the data to prevent modifications to the original data
-        data = copy.deepcopy(data)
+        data = copy_unless_in_place(data)
 
         if isinstance(data, numpy.ndarray):
             if len(data.shape) == 2:
@@ -1123,7 +1132,10 @@ class Sequencer(ObjectContainer):
                         # Handle boundaries with zero padding
 
                         # Initialize current segment with zero content
-                        current_segment = numpy.zeros((data.vector_length, self.sequence_length))
+                        current_segment = numpy.zeros(
+                            (data.vector_length, self.sequence_length),
+                            dtype=compute_dtype(default=numpy.float64)
+                        )
 
                         # Copy data into correct position within the segment
                         current_segment[:, valid_frames] = data.get_frames(
@@ -1148,7 +1160,7 @@ class Sequencer(ObjectContainer):
                 raise IOError(message)
 
             return DataMatrix3DContainer(
-                data=numpy.moveaxis(numpy.array(processed_data), 0, 2),
+                data=to_compute_dtype(numpy.moveaxis(numpy.array(processed_data), 0, 2)),
                 time_resolution=None,
                 processing_chain=data.processing_chain
             )
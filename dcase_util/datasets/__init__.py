@@ -53,6 +53,8 @@ Usage examples:
 
     Dataset.audio_files
     Dataset.audio_file_count
+    Dataset.audio_info
+    Dataset.prefetch_audio_info
 
     Dataset.meta
     Dataset.meta_count
@@ -15,7 +15,8 @@ import importlib
 
 from dcase_util.containers import DictContainer, ListDictContainer, TextContainer, MetaDataContainer
 from dcase_util.files import RemoteFile, RemotePackage, File, Package
-from dcase_util.utils import get_byte_string, setup_logging, Path, is_jupyter, get_parameter_hash, get_class_inheritors
+from dcase_util.utils import get_byte_string, setup_logging, Path, is_jupyter, get_parameter_hash, get_class_inheritors, \
+    get_audio_info, audio_info_cache
 from dcase_util.ui import FancyLogger, FancyStringifier, FancyHTMLStringifier
 
 
@@ -272,6 +273,7 @@ class Dataset(object):
                  error_meta_filename='error.txt',
                  filelisthash_filename='filelist.python.hash',
                  filelisthash_exclude_dirs=None,
+                 audio_info_filename='audio_info.cpickle',
                  crossvalidation_folds=None,
                  package_list=None,
                  package_extract_parameters=None,
@@ -349,6 +351,10 @@ class Dataset(object):
             Directories to be excluded from filelist hash calculation
             Default value None
 
+        audio_info_filename : str
+            Filename for audio file information cache
+            Default value 'audio_info.cpickle'
+
         crossvalidation_folds : int
             Count fo cross-validation folds. Indexing starts from one.
             Default value None
@@ -457,6 +463,10 @@ class Dataset(object):
 
         self.filelisthash_exclude_dirs = filelisthash_exclude_dirs
 
+        # Audio file information cache
+        self.audio_info_filename = audio_info_filename
+        self.audio_info_file = os.path.join(self.local_path, self.audio_info_filename)
+
         # Number of evaluation folds
         self.crossvalidation_folds = crossvalidation_folds
 
@@ -840,8 +850,53 @@ class Dataset(object):
             # Save new filelist hash to monitor change in the dataset.
             self._save_filelist_hash()
 
+        # Load audio file information cached in the earlier runs
+        if os.path.isfile(self.audio_info_file):
+            audio_info_cache.load(filename=self.audio_info_file)
+
         return self
 
+    def prefetch_audio_info(self, n_jobs=1):
+        """Read information for all audio files in the dataset into the audio info cache, and store it in the
+        dataset directory to be reused between runs.
+
+        Parameters
+        ----------
+        n_jobs : int
+            Amount of threads used to read file information
+            Default value 1
+
+        Returns
+        -------
+        self
+
+        """
+
+        if os.path.isfile(self.audio_info_file):
+            audio_info_cache.load(filename=self.audio_info_file)
+
+        audio_info_cache.prefetch(filenames=self.audio_files, n_jobs=n_jobs)
+        audio_info_cache.save(filename=self.audio_info_file, path=self.local_path)
+
+        return self
+
+    def audio_info(self, filename):
+        """Get audio file information
+
+        Parameters
+        ----------
+        filename : str
+            Audio file, relative or absolute path
+
+        Returns
+        -------
+        DictContainer
+            fs, channels, duration, subtype and bit depth
+
+        """
+
+        return get_audio_info(filename=self.relative_to_absolute_path(filename))
+
     def show(self, mode='auto', indent=0, show_meta=True):
         """Show dataset information.
 
@@ -2260,6 +2315,10 @@ class Dataset(object):
         filelist = []
         for path, sub_directory, files in os.walk(self.local_path):
             for name in files:
+                if name == self.audio_info_filename and path == self.local_path:
+                    # Audio info cache is not part of the dataset content
+                    continue
+
                 if os.path.splitext(name)[1] != os.path.splitext(self.filelisthash_filename)[1] and os.path.split(path)[1] not in exclude_dirs:
                     filelist.append(os.path.join(path, name))
 
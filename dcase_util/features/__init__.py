@@ -15,6 +15,9 @@ FeatureExtractor
     :toctree: generated/
 
     FeatureExtractor
+    FeatureExtractor.extract
+    FeatureExtractor.extract_batch
+    FeatureExtractor.extract_from_graph
 
 SpectralFeatureExtractor
 ------------------------
@@ -26,8 +29,15 @@ SpectralFeatureExtractor
 
     SpectralFeatureExtractor
     SpectralFeatureExtractor.extract
+    SpectralFeatureExtractor.extract_batch
+    SpectralFeatureExtractor.extract_stream
+    SpectralFeatureExtractor.extract_from_spectrogram
+    SpectralFeatureExtractor.extract_from_graph
     SpectralFeatureExtractor.get_window_function
     SpectralFeatureExtractor.get_spectrogram
+    SpectralFeatureExtractor.get_spectrogram_batch
+    SpectralFeatureExtractor.get_spectrogram_stream
+    SpectralFeatureExtractor.read_blocks
 
 MelExtractor
 ------------
@@ -39,6 +49,10 @@ MelExtractor
 
     MelExtractor
     MelExtractor.extract
+    MelExtractor.extract_batch
+    MelExtractor.extract_stream
+    MelExtractor.extract_from_spectrogram
+    MelExtractor.extract_from_graph
 
 MfccStaticExtractor
 -------------------
@@ -50,6 +64,10 @@ MfccStaticExtractor
 
     MfccStaticExtractor
     MfccStaticExtractor.extract
+    MfccStaticExtractor.extract_batch
+    MfccStaticExtractor.extract_stream
+    MfccStaticExtractor.extract_from_spectrogram
+    MfccStaticExtractor.extract_from_graph
 
 MfccDeltaExtractor
 ------------------
@@ -61,6 +79,10 @@ MfccDeltaExtractor
 
     MfccDeltaExtractor
     MfccDeltaExtractor.extract
+    MfccDeltaExtractor.extract_batch
+    MfccDeltaExtractor.extract_stream
+    MfccDeltaExtractor.extract_from_spectrogram
+    MfccDeltaExtractor.extract_from_graph
 
 MfccAccelerationExtractor
 -------------------------
@@ -72,6 +94,10 @@ MfccAccelerationExtractor
 
     MfccAccelerationExtractor
     MfccAccelerationExtractor.extract
+    MfccAccelerationExtractor.extract_batch
+    MfccAccelerationExtractor.extract_stream
+    MfccAccelerationExtractor.extract_from_spectrogram
+    MfccAccelerationExtractor.extract_from_graph
 
 ZeroCrossingRateExtractor
 -------------------------
@@ -94,6 +120,8 @@ RMSEnergyExtractor
 
     RMSEnergyExtractor
     RMSEnergyExtractor.extract
+    RMSEnergyExtractor.extract_batch
+    RMSEnergyExtractor.extract_from_spectrogram
 
 SpectralCentroidExtractor
 -------------------------
@@ -105,7 +133,72 @@ SpectralCentroidExtractor
 
     SpectralCentroidExtractor
     SpectralCentroidExtractor.extract
+    SpectralCentroidExtractor.extract_batch
+    SpectralCentroidExtractor.extract_from_spectrogram
 
+StreamingFeatureExtractor
+-------------------------
+
+*dcase_util.features.StreamingFeatureExtractor*
+
+.. autosummary::
+    :toctree: generated/
+
+    StreamingFeatureExtractor
+    StreamingFeatureExtractor.push
+    StreamingFeatureExtractor.flush
+    StreamingFeatureExtractor.reset
+    StreamingFeatureExtractor.latency_samples
+    StreamingFeatureExtractor.latency_seconds
+
+
+FeatureGraph
+------------
+
+*dcase_util.features.FeatureGraph*
+
+.. autosummary::
+    :toctree: generated/
+
+    FeatureGraph
+    FeatureGraph.extract
+    FeatureGraph.get
+    FeatureGraph.spectrogram
+
+FilterbankCache
+---------------
+
+*dcase_util.features.FilterbankCache*
+
+Process-wide instance is available as ``dcase_util.features.filterbank_cache``.
+
+.. autosummary::
+    :toctree: generated/
+
+    FilterbankCache
+    FilterbankCache.get
+    FilterbankCache.mel_basis
+    FilterbankCache.dct_basis
+    FilterbankCache.info
+    FilterbankCache.clear
+
+FeatureCache
+------------
+
+*dcase_util.features.FeatureCache*
+
+.. autosummary::
+    :toctree: generated/
+
+    FeatureCache
+    FeatureCache.key
+    FeatureCache.audio_key
+    FeatureCache.extractor_key
+    FeatureCache.get
+    FeatureCache.set
+    FeatureCache.evict
+    FeatureCache.size
+    FeatureCache.clear
 
 EmbeddingExtractor
 ------------------
@@ -116,6 +209,8 @@ EmbeddingExtractor
     :toctree: generated/
 
     EmbeddingExtractor
+    EmbeddingExtractor.set_threads
+    load_embedding_model
 
 OpenL3Extractor
 ---------------
@@ -127,6 +222,7 @@ OpenL3Extractor
 
     OpenL3Extractor
     OpenL3Extractor.extract
+    OpenL3Extractor.extract_batch
 
 TorchOpenL3Extractor
 --------------------
@@ -138,6 +234,7 @@ TorchOpenL3Extractor
 
     TorchOpenL3Extractor
     TorchOpenL3Extractor.extract
+    TorchOpenL3Extractor.extract_batch
 
 EdgeL3Extractor
 ---------------
@@ -149,9 +246,12 @@ EdgeL3Extractor
 
     EdgeL3Extractor
     EdgeL3Extractor.extract
+    EdgeL3Extractor.extract_batch
+    EdgeL3Extractor.get_frames
 
 """
 
 from .features import *
+from .cache import *
 
 __all__ = [_ for _ in dir() if not _.startswith('_')]
@@ -0,0 +1,195 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import os
+import hashlib
+import numpy
+from dcase_util.utils import DiskCache, get_parameter_hash, compute_dtype
+
+
+class FeatureCache(DiskCache):
+    """Content-addressed feature cache
+
+    Features are stored under a key formed from the audio and the extractor parameters, and reused by any
+    experiment extracting the same features from the same audio, regardless of where the experiment stores its
+    own feature files. Audio is identified either by its content (hash of the samples), or by the audio file
+    (path, modification time and size) together with sampling rate, focus segment and shape of the audio.
+
+    Entries are single `.npy` files in a `DiskCache`, shared by concurrent processes and limited in size with
+    least recently used eviction.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        cache = dcase_util.features.FeatureCache(path='feature_cache', size_limit=10 * 1024 ** 3)
+        extractor = dcase_util.features.MelExtractor()
+
+        key = cache.key(data=audio, extractor=extractor)
+        mel = cache.get(key)
+        if mel is None:
+            mel = extractor.extract(audio)
+            cache.set(key, mel)
+
+    """
+
+    extension = '.npy'
+
+    def __init__(self, path, size_limit=None, key_type='content'):
+        """Constructor
+
+        Parameters
+        ----------
+        path : str
+            Cache directory
+
+        size_limit : int
+            Maximum size of the cache in bytes, if None, size is not limited.
+            Default value None
+
+        key_type : str
+            Audio identification, 'content' to use the audio samples, or 'file' to use audio file path,
+            modification time and size. Use 'file' only if the audio is always read from the file in the same way.
+            Default value 'content'
+
+        Raises
+        ------
+        ValueError:
+            Unknown key type
+
+        """
+
+        if key_type not in ['content', 'file']:
+            message = '{name}: Unknown key type [{key_type}]'.format(
+                name=self.__class__.__name__,
+                key_type=key_type
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        super(FeatureCache, self).__init__(path=path, size_limit=size_limit)
+
+        self.key_type = key_type
+
+    def __getstate__(self):
+        d = super(FeatureCache, self).__getstate__()
+        d['key_type'] = self.key_type
+
+        return d
+
+    def audio_key(self, data):
+        """Key identifying the audio
+
+        Parameters
+        ----------
+        data : AudioContainer or numpy.ndarray
+            Audio
+
+        Returns
+        -------
+        str
+
+        """
+
+        from dcase_util.containers import AudioContainer
+
+        if isinstance(data, AudioContainer):
+            focused = data.get_focused()
+
+            if self.key_type == 'file' and data.filename and os.path.isfile(data.filename):
+                stat = os.stat(data.filename)
+                return get_parameter_hash({
+                    'filename': os.path.abspath(data.filename),
+                    'mtime': stat.st_mtime,
+                    'size': stat.st_size,
+                    'fs': data.fs,
+                    'focus': str((data.focus_start_samples, data.focus_stop_samples, data.focus_channel)),
+                    'shape': list(focused.shape)
+                })
+
+            fs = data.fs
+
+        else:
+            focused = data
+            fs = None
+
+        focused = numpy.ascontiguousarray(focused)
+
+        md5 = hashlib.md5()
+        md5.update(str((fs, focused.dtype.str, focused.shape)).encode('utf-8'))
+        md5.update(focused.data)
+
+        return md5.hexdigest()
+
+    @staticmethod
+    def extractor_key(extractor):
+        """Key identifying the extractor parameters
+
+        Parameters
+        ----------
+        extractor : FeatureExtractor
+            Feature extractor
+
+        Returns
+        -------
+        str
+
+        """
+
+        state = dict(extractor.__getstate__())
+
+        # Processing chain fields do not affect the extracted features
+        state.pop('input_type', None)
+        state.pop('output_type', None)
+
+        return get_parameter_hash({
+            'label': extractor.label,
+            'parameters': state
+        })
+
+    def key(self, data, extractor, stream_id=None, audio_key=None):
+        """Entry key for the audio and the extractor
+
+        Parameters
+        ----------
+        data : AudioContainer or numpy.ndarray
+            Audio
+
+        extractor : FeatureExtractor
+            Feature extractor
+
+        stream_id : int
+            Audio stream, for features extracted separately for each channel.
+            Default value None
+
+        audio_key : str
+            Precalculated audio key, used instead of data if given.
+            Default value None
+
+        Returns
+        -------
+        str
+
+        """
+
+        if audio_key is None:
+            audio_key = self.audio_key(data=data)
+
+        dtype = compute_dtype()
+
+        return get_parameter_hash({
+            'audio': audio_key,
+            'extractor': self.extractor_key(extractor=extractor),
+            'stream_id': stream_id,
+            'dtype': dtype.name if dtype is not None else None
+        })
+
+    def _read(self, filename):
+        return numpy.load(filename, allow_pickle=False)
+
+    def _write(self, file_handle, data):
+        numpy.save(file_handle, numpy.asarray(data), allow_pickle=False)
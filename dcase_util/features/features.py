@@ -2,14 +2,20 @@
 # -*- coding: utf-8 -*-
 from __future__ import print_function, absolute_import
 
+import os
+import collections
+import threading
 import numpy
 import librosa
 import scipy
 import logging
 import importlib
+import inspect
+from six import iteritems
 from dcase_util.containers import ContainerMixin
 from dcase_util.ui import FancyStringifier, FancyHTMLStringifier
-from dcase_util.utils import setup_logging, get_class_inheritors, is_jupyter
+from dcase_util.utils import setup_logging, get_class_inheritors, is_jupyter, compute_dtype, to_compute_dtype, \
+    resample
 
 
 def feature_extractor_list(display=True):
@@ -125,6 +131,482 @@ def feature_extractor_factory(feature_extractor_label, **kwargs):
     return feature_extractor_class(**dict(kwargs))
 
 
+def stft_pad_mode():
+    """Padding mode used by librosa.stft for centered frames.
+
+    Default padding mode has changed between librosa versions, batched spectrogram calculation uses the same mode
+    as the installed librosa.
+
+    Returns
+    -------
+    str
+
+    """
+
+    try:
+        if hasattr(inspect, 'signature'):
+            return inspect.signature(librosa.stft).parameters['pad_mode'].default
+
+        # Python 2
+        argspec = inspect.getargspec(librosa.stft)
+        return dict(zip(argspec.args[-len(argspec.defaults):], argspec.defaults))['pad_mode']
+
+    except (KeyError, TypeError, ValueError):
+        return 'constant'
+
+
+def frame_signals(y, frame_length, hop_length):
+    """Frame signals into overlapping frames without copying the data.
+
+    Parameters
+    ----------
+    y : numpy.ndarray [shape=(..., n)]
+        Signals, time along the last axis
+
+    frame_length : int
+        Frame length in samples
+
+    hop_length : int
+        Hop length in samples
+
+    Returns
+    -------
+    numpy.ndarray [shape=(..., t, frame_length)]
+        Read-only view to the signals, frame samples are contiguous in the memory
+
+    """
+
+    y = numpy.ascontiguousarray(y)
+    frame_count = 1 + (y.shape[-1] - frame_length) // hop_length
+
+    return numpy.lib.stride_tricks.as_strided(
+        y,
+        shape=y.shape[:-1] + (frame_count, frame_length),
+        strides=y.strides[:-1] + (y.strides[-1] * hop_length, y.strides[-1]),
+        writeable=False
+    )
+
+
+def delta_stream(frames, width=9, order=1):
+    """Delta features for feature matrices given in consecutive blocks along the time axis.
+
+    Frames are buffered until enough context is available, concatenated output is identical to
+    `librosa.feature.delta` applied to the whole feature matrix.
+
+    Parameters
+    ----------
+    frames : iterable of numpy.ndarray [shape=(n_features, t)]
+        Consecutive feature blocks
+
+    width : int
+        Width of the delta window, odd integer, at least 3.
+        Default value 9
+
+    order : int
+        Order of the difference operator.
+        Default value 1
+
+    Yields
+    ------
+    numpy.ndarray [shape=(n_features, t)]
+        Delta features for the frames with full context available
+
+    """
+
+    half = width // 2
+
+    buffer = None
+    buffer_start = 0
+    emitted = 0
+    for block in frames:
+        if buffer is None:
+            buffer = block
+
+        else:
+            buffer = numpy.concatenate((buffer, block), axis=-1)
+
+        total = buffer_start + buffer.shape[-1]
+        if buffer.shape[-1] < width or total - half <= emitted:
+            continue
+
+        delta = librosa.feature.delta(buffer, width=width, order=order, axis=-1)
+        yield delta[..., emitted - buffer_start:total - half - buffer_start]
+        emitted = total - half
+
+        # Keep left context for the next frames, and full window for the end of the signal
+        keep_from = max(buffer_start, min(emitted - half, total - width))
+        buffer = buffer[..., keep_from - buffer_start:]
+        buffer_start = keep_from
+
+    if buffer is not None and buffer_start + buffer.shape[-1] > emitted:
+        delta = librosa.feature.delta(buffer, width=width, order=order, axis=-1)
+        yield delta[..., emitted - buffer_start:]
+
+
+class FilterbankCache(object):
+    """Process-wide cache of mel filterbanks, window functions and DCT matrices.
+
+    Feature extractors with the same parameters share the same matrices instead of constructing them for each
+    extractor instance. Least recently used matrices are removed when the cache is full. Cached matrices are
+    read-only, as they are shared between extractors.
+
+    """
+
+    def __init__(self, size=64):
+        """Constructor
+
+        Parameters
+        ----------
+        size : int
+            Maximum amount of cached matrices
+            Default value 64
+
+        """
+
+        self.size = size
+
+        self.hits = {}
+        self.misses = {}
+
+        self._items = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, kind, key, builder):
+        """Get matrix from the cache, construct and store it if not cached.
+
+        Parameters
+        ----------
+        kind : str
+            Matrix type, used in the cache key and hit counters
+
+        key : tuple
+            Parameters defining the matrix
+
+        builder : callable
+            Function without parameters to construct the matrix
+
+        Returns
+        -------
+        numpy.ndarray
+            Read-only matrix
+
+        """
+
+        cache_key = (kind,) + tuple(key)
+
+        with self._lock:
+            item = self._items.get(cache_key)
+            if item is not None:
+                # Mark item as recently used
+                self._items[cache_key] = self._items.pop(cache_key)
+                self.hits[kind] = self.hits.get(kind, 0) + 1
+                return item
+
+            self.misses[kind] = self.misses.get(kind, 0) + 1
+
+        item = numpy.array(builder())
+        item.setflags(write=False)
+
+        with self._lock:
+            self._items[cache_key] = item
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+        return item
+
+    def mel_basis(self, fs, n_fft, n_mels, fmin=0.0, fmax=None, htk=False, normalize_mel_bands=False):
+        """Mel filterbank
+
+        Parameters
+        ----------
+        fs : int
+            Sampling rate
+
+        n_fft : int
+            Length of the FFT window
+
+        n_mels : int
+            Number of mel bands
+
+        fmin : float
+            Lowest frequency in mel bands (in Hz)
+            Default value 0.0
+
+        fmax : float
+            Highest frequency in mel bands (in Hz), if None, fs/2 is used
+            Default value None
+
+        htk : bool
+            Use HTK formula instead of Slaney
+            Default value False
+
+        normalize_mel_bands : bool
+            Normalize mel band to have peak at 1.0
+            Default value False
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mels, 1 + n_fft/2)]
+            Read-only mel filterbank
+
+        """
+
+        def builder():
+            mel_basis = librosa.filters.mel(
+                sr=fs,
+                n_fft=n_fft,
+                n_mels=n_mels,
+                fmin=fmin,
+                fmax=fmax,
+                htk=htk
+            )
+
+            if normalize_mel_bands:
+                mel_basis /= numpy.max(mel_basis, axis=-1)[:, None]
+
+            return mel_basis
+
+        return self.get(
+            kind='mel',
+            key=(fs, n_fft, n_mels, fmin, fmax, htk, normalize_mel_bands),
+            builder=builder
+        )
+
+    def dct_basis(self, n_mfcc, n_mels):
+        """Orthonormal DCT-II matrix
+
+        Multiplying log mel energies with the matrix gives the same coefficients as `librosa.feature.mfcc`.
+
+        Parameters
+        ----------
+        n_mfcc : int
+            Number of coefficients
+
+        n_mels : int
+            Number of mel bands
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mfcc, n_mels)]
+            Read-only DCT matrix
+
+        """
+
+        def builder():
+            basis = numpy.cos(
+                numpy.pi / n_mels * numpy.outer(numpy.arange(n_mfcc), numpy.arange(n_mels) + 0.5)
+            ) * numpy.sqrt(2.0 / n_mels)
+            basis[0, :] /= numpy.sqrt(2.0)
+
+            return basis
+
+        return self.get(
+            kind='dct',
+            key=(n_mfcc, n_mels),
+            builder=builder
+        )
+
+    def info(self):
+        """Cache hit and miss counts
+
+        Returns
+        -------
+        dict
+            Hit and miss counts per matrix type, and amount of cached matrices
+
+        """
+
+        with self._lock:
+            return {
+                'hits': dict(self.hits),
+                'misses': dict(self.misses),
+                'size': len(self._items)
+            }
+
+    def clear(self):
+        """Remove all matrices from the cache and reset the counters.
+
+        Returns
+        -------
+        nothing
+
+        """
+
+        with self._lock:
+            self._items.clear()
+            self.hits = {}
+            self.misses = {}
+
+
+#: Process-wide filterbank cache used by the feature extractors
+filterbank_cache = FilterbankCache()
+
+
+class FeatureGraph(object):
+    """Feature computation graph for one audio signal, or for multiple equal-length signals.
+
+    Extractors declare the intermediate results they depend on (spectrogram, mel band energies, log mel band
+    energies, MFCC, delta), and request them from the graph with a key identifying the result. Each result is
+    computed only once, and shared between all extractors requesting it, e.g. MFCC static, delta and acceleration
+    extractors with the same parameters compute the spectrogram, mel band energies, and MFCC only once.
+
+    Results stored in the graph are shared, do not modify them in place.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        graph = dcase_util.features.FeatureGraph(y=audio)
+        features = graph.extract(
+            extractors={
+                'mfcc': {'n_mfcc': 20},
+                'mfcc_delta': {'n_mfcc': 20},
+                'rmse': {}
+            }
+        )
+
+    """
+
+    def __init__(self, y=None, signals=None):
+        """Constructor
+
+        Parameters
+        ----------
+        y : AudioContainer or numpy.ndarray [shape=(n,)]
+            Audio signal
+            Default value None
+
+        signals : list of numpy.ndarray [shape=(n,)] or numpy.ndarray [shape=(b, n)]
+            Audio signals, all with the same length. Used if y is not given, results have signals along the
+            first axis.
+            Default value None
+
+        """
+
+        self.batch = y is None
+        self.y = y if y is not None else signals
+
+        self.nodes = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def get(self, key, builder):
+        """Get result from the graph, compute it if not yet computed.
+
+        Parameters
+        ----------
+        key : tuple
+            Key identifying the result, first item is the name of the result
+
+        builder : callable
+            Function without parameters to compute the result
+
+        Returns
+        -------
+        numpy.ndarray
+
+        """
+
+        if key in self.nodes:
+            self.hits += 1
+
+        else:
+            self.misses += 1
+            self.nodes[key] = builder()
+
+        return self.nodes[key]
+
+    def spectrogram(self, extractor):
+        """Spectrogram for the extractor
+
+        Magnitude spectrogram is computed once per spectrogram key, power spectrogram is derived from it.
+
+        Parameters
+        ----------
+        extractor : SpectralFeatureExtractor
+            Extractor
+
+        Returns
+        -------
+        numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram
+
+        """
+
+        if self.batch:
+            get_spectrogram = extractor.get_spectrogram_batch
+            signal_parameter = 'signals'
+
+        else:
+            get_spectrogram = extractor.get_spectrogram
+            signal_parameter = 'y'
+
+        if extractor.spectrogram_type not in ['magnitude', 'power']:
+            # Unknown type, let spectrogram method handle it
+            return get_spectrogram(center=extractor.center, **{signal_parameter: self.y})
+
+        magnitude_key = ('spectrogram',) + extractor.spectrogram_key
+        magnitude = self.get(
+            key=magnitude_key,
+            builder=lambda: get_spectrogram(
+                n_fft=extractor.n_fft,
+                win_length_samples=extractor.win_length_samples,
+                hop_length_samples=extractor.hop_length_samples,
+                spectrogram_type='magnitude',
+                center=extractor.center,
+                window=extractor.window,
+                **{signal_parameter: self.y}
+            )
+        )
+
+        if extractor.spectrogram_type == 'power':
+            return self.get(
+                key=('power',) + magnitude_key,
+                builder=lambda: magnitude ** 2
+            )
+
+        return magnitude
+
+    def extract(self, extractors):
+        """Extract features with multiple extractors
+
+        Parameters
+        ----------
+        extractors : dict
+            Extractors, label as key and FeatureExtractor or dict of extractor parameters as value. Extractors
+            given with parameters are constructed with `feature_extractor_factory`.
+
+        Returns
+        -------
+        dict
+            Features, label as key
+
+        """
+
+        features = {}
+        for label, extractor in iteritems(extractors):
+            if not isinstance(extractor, FeatureExtractor):
+                extractor = feature_extractor_factory(
+                    feature_extractor_label=label,
+                    **(extractor or {})
+                )
+
+            features[label] = to_compute_dtype(
+                extractor.extract_from_graph(graph=self)
+            )
+
+        return features
+
+
 class FeatureExtractor(ContainerMixin):
     """Feature extractor base class"""
     label = 'extractor_base'  #: Extractor label
@@ -270,11 +752,49 @@ class FeatureExtractor(ContainerMixin):
 
         pass
 
+    def extract_batch(self, signals):
+        """Extract features for multiple audio signals.
+
+        Parameters
+        ----------
+        signals : list of AudioContainer or numpy.ndarray [shape=(n,)]
+            Audio signals
+
+        Returns
+        -------
+        list of numpy.ndarray
+            Features for each signal
+
+        """
+
+        return [self.extract(y=y) for y in signals]
+
+    def extract_from_graph(self, graph):
+        """Extract features for the signal of the feature graph.
+
+        Parameters
+        ----------
+        graph : FeatureGraph
+            Feature graph
+
+        Returns
+        -------
+        numpy.ndarray or list of numpy.ndarray
+            Features, or features for each signal of the graph
+
+        """
+
+        if graph.batch:
+            return self.extract_batch(signals=graph.y)
+
+        return self.extract(y=graph.y)
+
 
 class SpectralFeatureExtractor(FeatureExtractor):
     """Spectral feature extractor base class"""
     label = 'spectrogram'  #: Extractor label
     description = 'Spectral feature extractor base class (Librosa)'  #: Extractor description
+    center = True  #: Center frames by padding the signal
 
     def __init__(self, spectrogram_type='magnitude', n_fft=2048, window_type='hamming_asymmetric', **kwargs):
         """Constructor
@@ -319,9 +839,10 @@ class SpectralFeatureExtractor(FeatureExtractor):
         self.n_fft = n_fft
         self.window_type = window_type
 
-        self.window = self.get_window_function(
-            n=self.win_length_samples,
-            window_type=self.window_type
+        self.window = filterbank_cache.get(
+            kind='window',
+            key=(self.win_length_samples, self.window_type),
+            builder=lambda: self.get_window_function(n=self.win_length_samples, window_type=self.window_type)
         )
 
     def to_string(self, ui=None, indent=0):
@@ -355,6 +876,29 @@ class SpectralFeatureExtractor(FeatureExtractor):
 
         return output
 
+    def __getstate__(self):
+        d = super(SpectralFeatureExtractor, self).__getstate__()
+        d.update({
+            'spectrogram_type': self.spectrogram_type,
+            'n_fft': self.n_fft,
+            'window_type': self.window_type,
+        })
+
+        return d
+
+    def __setstate__(self, d):
+        super(SpectralFeatureExtractor, self).__setstate__(d)
+
+        self.spectrogram_type = d['spectrogram_type']
+        self.n_fft = d['n_fft']
+        self.window_type = d['window_type']
+
+        self.window = filterbank_cache.get(
+            kind='window',
+            key=(self.win_length_samples, self.window_type),
+            builder=lambda: self.get_window_function(n=self.win_length_samples, window_type=self.window_type)
+        )
+
     def get_window_function(self, n, window_type='hamming_asymmetric'):
         """Window function
 
@@ -401,14 +945,49 @@ class SpectralFeatureExtractor(FeatureExtractor):
             self.logger.exception(message)
             raise ValueError(message)
 
-    def get_spectrogram(self, y, n_fft=None, win_length_samples=None, hop_length_samples=None,
-                        window=None, center=True, spectrogram_type=None):
-        """Spectrogram
+    def get_signal(self, y):
+        """Get single channel signal from the input
 
         Parameters
         ----------
-        y : numpy.ndarray
-            Audio data
+        y : AudioContainer or numpy.ndarray [shape=(n,)]
+            Audio signal
+
+        Raises
+        ------
+        ValueError:
+            Input has more than one audio channel
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n,)]
+
+        """
+
+        from dcase_util.containers import AudioContainer
+
+        if isinstance(y, AudioContainer):
+            if y.channels == 1:
+                y = y.data
+
+            else:
+                message = '{name}: Input has more than one audio channel.'.format(
+                    name=self.__class__.__name__
+                )
+
+                self.logger.exception(message)
+                raise ValueError(message)
+
+        return to_compute_dtype(y)
+
+    def get_spectrogram(self, y, n_fft=None, win_length_samples=None, hop_length_samples=None,
+                        window=None, center=True, spectrogram_type=None):
+        """Spectrogram
+
+        Parameters
+        ----------
+        y : numpy.ndarray
+            Audio data
 
         n_fft : int
             FFT size
@@ -456,19 +1035,7 @@ class SpectralFeatureExtractor(FeatureExtractor):
         if spectrogram_type is None:
             spectrogram_type = self.spectrogram_type
 
-        from dcase_util.containers import AudioContainer
-
-        if isinstance(y, AudioContainer):
-            if y.channels == 1:
-                y = y.data
-
-            else:
-                message = '{name}: Input has more than one audio channel.'.format(
-                    name=self.__class__.__name__
-                )
-
-                self.logger.exception(message)
-                raise ValueError(message)
+        y = self.get_signal(y=y)
 
         if spectrogram_type == 'magnitude':
             return numpy.abs(librosa.stft(y + self.eps,
@@ -490,38 +1057,526 @@ class SpectralFeatureExtractor(FeatureExtractor):
         else:
             message = '{name}: Unknown spectrum type [{spectrogram_type}]'.format(
                 name=self.__class__.__name__,
-                spectrogram_type=spectrogram_type
+                spectrogram_type=spectrogram_type
+            )
+
+            self.logger.exception(message)
+            raise ValueError(message)
+
+    def get_spectrogram_batch(self, signals, n_fft=None, win_length_samples=None, hop_length_samples=None,
+                              window=None, center=True, spectrogram_type=None):
+        """Spectrogram for multiple equal-length signals
+
+        Signals are framed into one array and transformed with one vectorized FFT. Output matches
+        `get_spectrogram` called for each signal separately.
+
+        Parameters
+        ----------
+        signals : list of AudioContainer or numpy.ndarray [shape=(n,)], or numpy.ndarray [shape=(b, n)]
+            Audio signals, all with the same length
+
+        n_fft : int
+            FFT size
+            Default value None
+
+        win_length_samples : int
+            Window length in samples
+            Default value None
+
+        hop_length_samples : int
+            Hop length in samples
+            Default value None
+
+        window : numpy.array
+            Window function
+            Default value None
+
+        center : bool
+            If true, input signal is padded so to the frame is centered at hop length
+            Default value True
+
+        spectrogram_type : str
+            Type of spectrogram "magnitude" or "power"
+            Default value None
+
+        Raises
+        ------
+        ValueError:
+            Signals have different lengths, or unknown spectrogram type
+
+        Returns
+        -------
+        numpy.ndarray [shape=(b, 1 + n_fft/2, t)]
+            STFT matrices
+
+        """
+
+        if n_fft is None:
+            n_fft = self.n_fft
+
+        if win_length_samples is None:
+            win_length_samples = self.win_length_samples
+
+        if hop_length_samples is None:
+            hop_length_samples = self.hop_length_samples
+
+        if window is None:
+            window = self.window
+
+        if spectrogram_type is None:
+            spectrogram_type = self.spectrogram_type
+
+        if spectrogram_type not in ['magnitude', 'power']:
+            message = '{name}: Unknown spectrum type [{spectrogram_type}]'.format(
+                name=self.__class__.__name__,
+                spectrogram_type=spectrogram_type
+            )
+
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        signals = [self.get_signal(y=y) for y in signals]
+
+        if len(set([len(y) for y in signals])) > 1:
+            message = '{name}: Signals should have the same length.'.format(
+                name=self.__class__.__name__
+            )
+
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        # Stacking makes a copy, eps can be added in place
+        y = numpy.stack(signals)
+        y += self.eps
+
+        if center:
+            y = numpy.pad(y, [(0, 0), (n_fft // 2, n_fft // 2)], mode=stft_pad_mode())
+
+        if window is None:
+            window = numpy.ones(win_length_samples)
+
+        dtype = y.dtype if numpy.issubdtype(y.dtype, numpy.floating) else numpy.float64
+
+        # Pad window to FFT size
+        fft_window = numpy.zeros(n_fft, dtype=dtype)
+        window_start = (n_fft - len(window)) // 2
+        fft_window[window_start:window_start + len(window)] = window
+
+        frames = frame_signals(y, frame_length=n_fft, hop_length=hop_length_samples)
+        frame_count = frames.shape[-2]
+
+        # Frames are processed for all signals at once in blocks fitting into the cache (as in librosa.stft), FFT
+        # along the contiguous frame axis
+        spectrogram = numpy.empty(y.shape[:-1] + (frame_count, n_fft // 2 + 1), dtype=dtype)
+        block_length = max(1, librosa.util.MAX_MEM_BLOCK // (n_fft * frames.itemsize * len(y)))
+        for block_start in range(0, frame_count, block_length):
+            block_stop = min(block_start + block_length, frame_count)
+            numpy.abs(
+                numpy.fft.rfft(frames[..., block_start:block_stop, :] * fft_window, axis=-1),
+                out=spectrogram[..., block_start:block_stop, :]
+            )
+
+        # Frequency axis is moved to match get_spectrogram output
+        spectrogram = numpy.swapaxes(spectrogram, -1, -2)
+
+        if spectrogram_type == 'power':
+            spectrogram **= 2
+
+        return spectrogram
+
+    @property
+    def spectrogram_key(self):
+        """Key identifying the magnitude spectrogram used by the extractor
+
+        Extractors with the same key can share the spectrogram calculated for an audio signal.
+
+        Returns
+        -------
+        tuple
+
+        """
+
+        return self.n_fft, self.win_length_samples, self.hop_length_samples, self.window_type, self.center
+
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
+
+        Parameters
+        ----------
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
+
+        Returns
+        -------
+        numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            spectrum
+        """
+
+        return spectrogram
+
+    def extract_from_graph(self, graph):
+        """Extract features for the signal of the feature graph, spectrogram is shared through the graph.
+
+        Parameters
+        ----------
+        graph : FeatureGraph
+            Feature graph
+
+        Returns
+        -------
+        numpy.ndarray [shape=(..., t)] or [shape=(b, ..., t)]
+            Features
+
+        """
+
+        return self.extract_from_spectrogram(
+            spectrogram=graph.spectrogram(extractor=self)
+        )
+
+    def extract(self, y):
+        """Extract features for the audio signal.
+
+        Parameters
+        ----------
+        y : AudioContainer or numpy.ndarray [shape=(n,)]
+            Audio signal
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_fft, t)]
+            spectrum
+        """
+
+        return to_compute_dtype(
+            self.extract_from_spectrogram(
+                spectrogram=self.get_spectrogram(
+                    y=y,
+                    n_fft=self.n_fft,
+                    win_length_samples=self.win_length_samples,
+                    hop_length_samples=self.hop_length_samples,
+                    spectrogram_type=self.spectrogram_type,
+                    center=self.center,
+                    window=self.window
+                )
+            )
+        )
+
+    def extract_batch(self, signals):
+        """Extract features for multiple audio signals.
+
+        Signals with the same length are processed together with one batched spectrogram calculation, which is
+        considerably faster than extracting the signals one by one. Memory usage grows with the batch size.
+
+        Parameters
+        ----------
+        signals : list of AudioContainer or numpy.ndarray [shape=(n,)]
+            Audio signals
+
+        Returns
+        -------
+        list of numpy.ndarray
+            Features for each signal
+
+        """
+
+        signals = [self.get_signal(y=y) for y in signals]
+
+        # Group signals by length
+        groups = {}
+        for signal_id, y in enumerate(signals):
+            groups.setdefault(len(y), []).append(signal_id)
+
+        output = [None] * len(signals)
+        for length, signal_ids in iteritems(groups):
+            features = to_compute_dtype(
+                self.extract_from_spectrogram(
+                    spectrogram=self.get_spectrogram_batch(
+                        signals=[signals[signal_id] for signal_id in signal_ids],
+                        n_fft=self.n_fft,
+                        win_length_samples=self.win_length_samples,
+                        hop_length_samples=self.hop_length_samples,
+                        spectrogram_type=self.spectrogram_type,
+                        center=self.center,
+                        window=self.window
+                    )
+                )
+            )
+
+            for batch_id, signal_id in enumerate(signal_ids):
+                output[signal_id] = features[batch_id]
+
+        return output
+
+    def get_spectrogram_stream(self, blocks, n_fft=None, win_length_samples=None, hop_length_samples=None,
+                               window=None, center=True, spectrogram_type=None):
+        """Spectrogram for a signal given in consecutive blocks
+
+        Overlapping part of the signal is carried over the block boundaries and signal edges are padded the same
+        way as in `get_spectrogram`, concatenated output is identical to the spectrogram of the whole signal.
+
+        Parameters
+        ----------
+        blocks : iterable of numpy.ndarray [shape=(n,)]
+            Consecutive signal blocks
+
+        n_fft : int
+            FFT size
+            Default value None
+
+        win_length_samples : int
+            Window length in samples
+            Default value None
+
+        hop_length_samples : int
+            Hop length in samples
+            Default value None
+
+        window : numpy.array
+            Window function
+            Default value None
+
+        center : bool
+            If true, input signal is padded so to the frame is centered at hop length
+            Default value True
+
+        spectrogram_type : str
+            Type of spectrogram "magnitude" or "power"
+            Default value None
+
+        Raises
+        ------
+        ValueError:
+            Unknown spectrogram type
+
+        Yields
+        ------
+        numpy.ndarray [shape=(1 + n_fft/2, t)]
+            Spectrogram frames completed by the block, t can be zero
+
+        """
+
+        if n_fft is None:
+            n_fft = self.n_fft
+
+        if win_length_samples is None:
+            win_length_samples = self.win_length_samples
+
+        if hop_length_samples is None:
+            hop_length_samples = self.hop_length_samples
+
+        if window is None:
+            window = self.window
+
+        if spectrogram_type is None:
+            spectrogram_type = self.spectrogram_type
+
+        if spectrogram_type not in ['magnitude', 'power']:
+            message = '{name}: Unknown spectrum type [{spectrogram_type}]'.format(
+                name=self.__class__.__name__,
+                spectrogram_type=spectrogram_type
+            )
+
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        def spectrogram(y, center):
+            s = numpy.abs(librosa.stft(
+                y,
+                n_fft=n_fft,
+                win_length=win_length_samples,
+                hop_length=hop_length_samples,
+                center=center,
+                window=window
+            ))
+
+            if spectrogram_type == 'power':
+                return s ** 2
+
+            return s
+
+        padding = n_fft // 2 if center else 0
+        pad_mode = stft_pad_mode()
+
+        # Signal not yet framed, starting from the next frame
+        buffer = numpy.zeros((0, ))
+
+        # Last samples of the signal, needed for the padding at the end
+        history = numpy.zeros((0, ))
+
+        started = not center
+        for block in blocks:
+            block = numpy.asarray(self.get_signal(y=block)) + self.eps
+            buffer = numpy.concatenate((buffer, block))
+            history = numpy.concatenate((history, block))[-(padding + 1):]
+
+            if not started:
+                if len(buffer) <= padding:
+                    # Not enough signal to pad the start
+                    continue
+
+                buffer = numpy.concatenate((
+                    numpy.pad(buffer[:padding + 1], (padding, 0), mode=pad_mode)[:padding],
+                    buffer
+                ))
+                started = True
+
+            if len(buffer) >= n_fft:
+                frame_count = 1 + (len(buffer) - n_fft) // hop_length_samples
+                yield spectrogram(y=buffer[:(frame_count - 1) * hop_length_samples + n_fft], center=False)
+
+                buffer = buffer[frame_count * hop_length_samples:]
+
+        if not started:
+            # Signal was shorter than the padding, process it at once
+            if len(buffer):
+                yield spectrogram(y=buffer, center=center)
+
+            return
+
+        if padding:
+            buffer = numpy.concatenate((
+                buffer,
+                numpy.pad(history, (0, padding), mode=pad_mode)[-padding:]
+            ))
+
+        if len(buffer) >= n_fft:
+            frame_count = 1 + (len(buffer) - n_fft) // hop_length_samples
+            yield spectrogram(y=buffer[:(frame_count - 1) * hop_length_samples + n_fft], center=False)
+
+    def extract_stream(self, blocks=None, filename=None, block_length_samples=65536):
+        """Extract features incrementally for a signal given in consecutive blocks or read from a file in blocks.
+
+        Memory usage is bounded by the block length, making it possible to process arbitrarily long recordings.
+        Output concatenated along the time axis is identical to `extract` for the whole signal.
+
+        Parameters
+        ----------
+        blocks : iterable of numpy.ndarray [shape=(n,)]
+            Consecutive signal blocks
+            Default value None
+
+        filename : str
+            Audio file to read in blocks, used if blocks are not given. Multi-channel audio is mixed down. Sampling
+            rate of the file should match the extractor.
+            Default value None
+
+        block_length_samples : int
+            Block length used when reading the file
+            Default value 65536
+
+        Raises
+        ------
+        ValueError:
+            Sampling rate of the file does not match, or no input given
+
+        Yields
+        ------
+        numpy.ndarray [shape=(n_features, t)]
+            Features for the frames completed by the block
+
+        """
+
+        if blocks is None:
+            if filename is None:
+                message = '{name}: No blocks or filename given.'.format(
+                    name=self.__class__.__name__
+                )
+                self.logger.exception(message)
+                raise ValueError(message)
+
+            blocks = self.read_blocks(filename=filename, block_length_samples=block_length_samples)
+
+        for spectrogram in self.get_spectrogram_stream(
+                blocks=blocks,
+                n_fft=self.n_fft,
+                win_length_samples=self.win_length_samples,
+                hop_length_samples=self.hop_length_samples,
+                spectrogram_type=self.spectrogram_type,
+                center=self.center,
+                window=self.window):
+
+            if spectrogram.shape[-1]:
+                yield to_compute_dtype(self.extract_from_spectrogram(spectrogram=spectrogram))
+
+    def read_blocks(self, filename, block_length_samples=65536):
+        """Read mono audio from a file in blocks
+
+        Parameters
+        ----------
+        filename : str
+            Audio file
+
+        block_length_samples : int
+            Block length
+            Default value 65536
+
+        Raises
+        ------
+        ValueError:
+            Sampling rate of the file does not match the extractor
+
+        Yields
+        ------
+        numpy.ndarray [shape=(n,)]
+
+        """
+
+        import soundfile
+
+        info = soundfile.info(filename)
+        if info.samplerate != self.fs:
+            message = '{name}: Sampling rate of the file [{file_fs}] does not match the extractor [{fs}], file [{file}]'.format(
+                name=self.__class__.__name__,
+                file_fs=info.samplerate,
+                fs=self.fs,
+                file=filename
             )
-
             self.logger.exception(message)
             raise ValueError(message)
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+        dtype = compute_dtype(default=numpy.float64).name
+        for block in soundfile.blocks(filename, blocksize=block_length_samples, dtype=dtype, always_2d=True):
+            yield numpy.mean(block, axis=1)
+
+
+class MelSpectrumMixin(object):
+    """Mel band energies shared through the feature graph, for extractors with mel filterbank (mel_basis)"""
+
+    @property
+    def mel_key(self):
+        """Key identifying the mel band energies in the feature graph
+
+        Returns
+        -------
+        tuple
+
+        """
+
+        return ('mel', self.spectrogram_type, self.fs, self.n_mels, self.fmin, self.fmax, self.htk,
+                self.normalize_mel_bands) + self.spectrogram_key
+
+    def get_mel_spectrum(self, graph):
+        """Mel band energies, shared through the feature graph
 
         Parameters
         ----------
-        y : AudioContainer or numpy.ndarray [shape=(n,)]
-            Audio signal
+        graph : FeatureGraph
+            Feature graph
 
         Returns
         -------
-        numpy.ndarray [shape=(n_fft, t)]
-            spectrum
+        numpy.ndarray [shape=(n_mels, t)] or [shape=(b, n_mels, t)]
+            mel band energies
+
         """
 
-        return self.get_spectrogram(
-            y=y,
-            n_fft=self.n_fft,
-            win_length_samples=self.win_length_samples,
-            hop_length_samples=self.hop_length_samples,
-            spectrogram_type=self.spectrogram_type,
-            center=True,
-            window=self.window
+        return graph.get(
+            key=self.mel_key,
+            builder=lambda: numpy.matmul(self.mel_basis, graph.spectrogram(extractor=self))
         )
 
 
-class MelExtractor(SpectralFeatureExtractor):
+class MelExtractor(MelSpectrumMixin, SpectralFeatureExtractor):
     """Feature extractor class to extract mel band energy features"""
     label = 'mel'  #: Extractor label
     description = 'Mel band energy (Librosa)'  #: Extractor description
@@ -617,18 +1672,16 @@ class MelExtractor(SpectralFeatureExtractor):
         self.htk = htk
         self.logarithmic = logarithmic
 
-        self.mel_basis = librosa.filters.mel(
-            sr=self.fs,
+        self.mel_basis = filterbank_cache.mel_basis(
+            fs=self.fs,
             n_fft=self.n_fft,
             n_mels=self.n_mels,
             fmin=self.fmin,
             fmax=self.fmax,
-            htk=self.htk
+            htk=self.htk,
+            normalize_mel_bands=self.normalize_mel_bands
         )
 
-        if self.normalize_mel_bands:
-            self.mel_basis /= numpy.max(self.mel_basis, axis=-1)[:, None]
-
     def to_string(self, ui=None, indent=0):
         """Get container information in a string
 
@@ -686,42 +1739,53 @@ class MelExtractor(SpectralFeatureExtractor):
         self.htk = d['htk']
         self.logarithmic = d['logarithmic']
 
-        self.mel_basis = librosa.filters.mel(
-            sr=self.fs,
+        self.mel_basis = filterbank_cache.mel_basis(
+            fs=self.fs,
             n_fft=self.n_fft,
             n_mels=self.n_mels,
             fmin=self.fmin,
             fmax=self.fmax,
-            htk=self.htk
+            htk=self.htk,
+            normalize_mel_bands=self.normalize_mel_bands
         )
 
-        if self.normalize_mel_bands:
-            self.mel_basis /= numpy.max(self.mel_basis, axis=-1)[:, None]
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+        Parameters
+        ----------
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mels, t)] or [shape=(b, n_mels, t)]
+            mel band energies
+        """
+
+        mel_spectrum = numpy.matmul(self.mel_basis, spectrogram)
+
+        if self.logarithmic:
+            mel_spectrum = numpy.log(mel_spectrum + self.eps)
+
+        return mel_spectrum
+
+    def extract_from_graph(self, graph):
+        """Extract features for the signal of the feature graph, mel band energies are shared through the graph.
 
         Parameters
         ----------
-        y : AudioContainer or numpy.ndarray [shape=(n,)]
-            Audio signal
+        graph : FeatureGraph
+            Feature graph
 
         Returns
         -------
-        numpy.ndarray [shape=(n_mels, t)]
+        numpy.ndarray [shape=(n_mels, t)] or [shape=(b, n_mels, t)]
             mel band energies
+
         """
 
-        spectrogram = self.get_spectrogram(
-            y=y,
-            n_fft=self.n_fft,
-            win_length_samples=self.win_length_samples,
-            hop_length_samples=self.hop_length_samples,
-            spectrogram_type=self.spectrogram_type,
-            center=True,
-            window=self.window
-        )
-        mel_spectrum = numpy.dot(self.mel_basis, spectrogram)
+        mel_spectrum = self.get_mel_spectrum(graph=graph)
 
         if self.logarithmic:
             mel_spectrum = numpy.log(mel_spectrum + self.eps)
@@ -729,7 +1793,7 @@ class MelExtractor(SpectralFeatureExtractor):
         return mel_spectrum
 
 
-class MfccStaticExtractor(SpectralFeatureExtractor):
+class MfccStaticExtractor(MelSpectrumMixin, SpectralFeatureExtractor):
     """Feature extractor class to extract static MFCC features"""
     label = 'mfcc'  #: Extractor label
     description = 'MFCC (Librosa)'  #: Extractor description
@@ -832,17 +1896,20 @@ class MfccStaticExtractor(SpectralFeatureExtractor):
         self.n_mfcc = n_mfcc
         self.omit_zeroth = omit_zeroth
 
-        self.mel_basis = librosa.filters.mel(
-            sr=self.fs,
+        self.mel_basis = filterbank_cache.mel_basis(
+            fs=self.fs,
             n_fft=self.n_fft,
             n_mels=self.n_mels,
             fmin=self.fmin,
             fmax=self.fmax,
-            htk=self.htk
+            htk=self.htk,
+            normalize_mel_bands=self.normalize_mel_bands
         )
 
-        if self.normalize_mel_bands:
-            self.mel_basis /= numpy.max(self.mel_basis, axis=-1)[:, None]
+        self.dct_basis = filterbank_cache.dct_basis(
+            n_mfcc=self.n_mfcc,
+            n_mels=self.n_mels
+        )
 
     def to_string(self, ui=None, indent=0):
         """Get container information in a string
@@ -903,55 +1970,255 @@ class MfccStaticExtractor(SpectralFeatureExtractor):
         self.n_mfcc = d['n_mfcc']
         self.omit_zeroth = d['omit_zeroth']
 
-        self.mel_basis = librosa.filters.mel(
-            sr=self.fs,
+        self.mel_basis = filterbank_cache.mel_basis(
+            fs=self.fs,
             n_fft=self.n_fft,
             n_mels=self.n_mels,
             fmin=self.fmin,
             fmax=self.fmax,
-            htk=self.htk
+            htk=self.htk,
+            normalize_mel_bands=self.normalize_mel_bands
+        )
+
+        self.dct_basis = filterbank_cache.dct_basis(
+            n_mfcc=self.n_mfcc,
+            n_mels=self.n_mels
         )
 
-        if self.normalize_mel_bands:
-            self.mel_basis /= numpy.max(self.mel_basis, axis=-1)[:, None]
+    @property
+    def mfcc_key(self):
+        """Key identifying the MFCC (all coefficients) in the feature graph
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+        Returns
+        -------
+        tuple
+
+        """
+
+        return ('mfcc', self.n_mfcc) + self.mel_key
+
+    @staticmethod
+    def log_mel_spectrum(mel_spectrum):
+        """Decibel scaled mel band energies
 
         Parameters
         ----------
-        y : numpy.ndarray [shape=(n,)]
-            Audio signal
+        mel_spectrum : numpy.ndarray [shape=(n_mels, t)] or [shape=(b, n_mels, t)]
+            Mel band energies
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mels, t)] or [shape=(b, n_mels, t)]
+            log mel band energies
+
+        """
+
+        if mel_spectrum.ndim == 3:
+            # Decibel scaling is clipped relative to the maximum of the signal, process signals separately
+            return numpy.stack([
+                librosa.power_to_db(current_mel_spectrum) for current_mel_spectrum in mel_spectrum
+            ])
+
+        return librosa.power_to_db(mel_spectrum)
+
+    def get_mfcc(self, graph):
+        """MFCC with all coefficients, shared through the feature graph
+
+        Parameters
+        ----------
+        graph : FeatureGraph
+            Feature graph
 
         Returns
         -------
-        numpy.ndarray [shape=(n_mels, t)]
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
             mfccs
 
         """
 
-        spectrogram = self.get_spectrogram(
-            y=y,
-            n_fft=self.n_fft,
-            win_length_samples=self.win_length_samples,
-            hop_length_samples=self.hop_length_samples,
-            spectrogram_type=self.spectrogram_type,
-            center=True,
-            window=self.window
-        )
+        def builder():
+            log_mel_spectrum = graph.get(
+                key=('log_mel',) + self.mel_key,
+                builder=lambda: self.log_mel_spectrum(mel_spectrum=self.get_mel_spectrum(graph=graph))
+            )
+
+            return numpy.matmul(self.dct_basis, log_mel_spectrum)
+
+        return graph.get(key=self.mfcc_key, builder=builder)
+
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
+
+        Parameters
+        ----------
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
+            mfccs
+
+        """
 
-        mel_spectrum = numpy.dot(self.mel_basis, spectrogram)
-        mfccs = librosa.feature.mfcc(
-            S=librosa.power_to_db(mel_spectrum),
-            n_mfcc=self.n_mfcc
+        mfccs = numpy.matmul(
+            self.dct_basis,
+            self.log_mel_spectrum(mel_spectrum=numpy.matmul(self.mel_basis, spectrogram))
         )
 
         if self.omit_zeroth:
             # Remove first coefficient
-            mfccs = mfccs[1:, :]
+            mfccs = mfccs[..., 1:, :]
+
+        return mfccs
+
+    def extract_from_graph(self, graph):
+        """Extract features for the signal of the feature graph, MFCC is shared through the graph.
+
+        Parameters
+        ----------
+        graph : FeatureGraph
+            Feature graph
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
+            mfccs
+
+        """
+
+        mfccs = self.get_mfcc(graph=graph)
+
+        if self.omit_zeroth:
+            # Remove first coefficient
+            mfccs = mfccs[..., 1:, :]
 
         return mfccs
 
+    def extract_stream(self, blocks=None, filename=None, block_length_samples=65536):
+        """Extract features incrementally for a signal given in consecutive blocks or read from a file in blocks.
+
+        See `get_mfcc_stream` for the decibel scaling.
+
+        Parameters
+        ----------
+        blocks : iterable of numpy.ndarray [shape=(n,)]
+            Consecutive signal blocks
+            Default value None
+
+        filename : str
+            Audio file to read in blocks, used if blocks are not given.
+            Default value None
+
+        block_length_samples : int
+            Block length used when reading the file
+            Default value 65536
+
+        Raises
+        ------
+        ValueError:
+            Sampling rate of the file does not match, or no input given
+
+        Yields
+        ------
+        numpy.ndarray [shape=(n_mfcc, t)]
+            mfccs
+
+        """
+
+        for mfccs in self.get_mfcc_stream(blocks=blocks, filename=filename,
+                                          block_length_samples=block_length_samples):
+            yield to_compute_dtype(mfccs)
+
+    def get_mfcc_stream(self, blocks=None, filename=None, block_length_samples=65536, top_db=80.0):
+        """Static MFCC for a signal given in consecutive blocks or read from a file in blocks.
+
+        Decibel scaling is clipped relative to the maximum of the signal. When reading from a file, the maximum
+        is found with a first pass over the file, and the output is identical to `extract` for the whole signal.
+        For blocks, frames are clipped relative to the running maximum of the frames since the signal start,
+        output does not depend on the block length.
+
+        Parameters
+        ----------
+        blocks : iterable of numpy.ndarray [shape=(n,)]
+            Consecutive signal blocks
+            Default value None
+
+        filename : str
+            Audio file to read in blocks, used if blocks are not given.
+            Default value None
+
+        block_length_samples : int
+            Block length used when reading the file
+            Default value 65536
+
+        top_db : float
+            Threshold for the decibel scaling relative to the maximum, if None, decibel scaling is not clipped.
+            Default value 80.0
+
+        Raises
+        ------
+        ValueError:
+            Sampling rate of the file does not match, or no input given
+
+        Yields
+        ------
+        numpy.ndarray [shape=(n_mfcc, t)]
+            mfccs
+
+        """
+
+        db_max = None
+        if blocks is None:
+            if filename is None:
+                message = '{name}: No blocks or filename given.'.format(
+                    name=self.__class__.__name__
+                )
+                self.logger.exception(message)
+                raise ValueError(message)
+
+            if top_db is not None:
+                # First pass for the maximum of the mel band energies
+                mel_max = 1e-10
+                for spectrogram in self.get_spectrogram_stream(
+                        blocks=self.read_blocks(filename=filename, block_length_samples=block_length_samples),
+                        center=self.center):
+
+                    if spectrogram.shape[-1]:
+                        mel_max = max(mel_max, numpy.max(numpy.matmul(self.mel_basis, spectrogram)))
+
+                db_max = 10.0 * numpy.log10(mel_max)
+
+            blocks = self.read_blocks(filename=filename, block_length_samples=block_length_samples)
+
+        running_db_max = -numpy.inf
+        for spectrogram in self.get_spectrogram_stream(blocks=blocks, center=self.center):
+            if not spectrogram.shape[-1]:
+                continue
+
+            # Decibel scaling as in librosa.power_to_db
+            log_mel_spectrum = 10.0 * numpy.log10(numpy.maximum(1e-10, numpy.matmul(self.mel_basis, spectrogram)))
+
+            if top_db is not None:
+                if db_max is None:
+                    reference = numpy.maximum.accumulate(
+                        numpy.maximum(log_mel_spectrum.max(axis=0), running_db_max)
+                    )
+                    running_db_max = reference[-1]
+
+                else:
+                    reference = db_max
+
+                log_mel_spectrum = numpy.maximum(log_mel_spectrum, reference - top_db)
+
+            mfccs = numpy.matmul(self.dct_basis, log_mel_spectrum)
+
+            if self.omit_zeroth:
+                # Remove first coefficient
+                mfccs = mfccs[..., 1:, :]
+
+            yield mfccs
+
 
 class MfccDeltaExtractor(MfccStaticExtractor):
     """Feature extractor class to extract MFCC delta features"""
@@ -1090,24 +2357,100 @@ class MfccDeltaExtractor(MfccStaticExtractor):
         output += ui.data(indent=indent + 2, field='width', value=self.width) + '\n'
         return output
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+    def __getstate__(self):
+        d = super(MfccDeltaExtractor, self).__getstate__()
+        d.update({
+            'width': self.width
+        })
+
+        return d
+
+    def __setstate__(self, d):
+        super(MfccDeltaExtractor, self).__setstate__(d)
+
+        self.width = d['width']
+
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
 
         Parameters
         ----------
-        y : numpy.ndarray [shape=(n,)]
-            Audio signal
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
 
         Returns
         -------
-        numpy.ndarray [shape=(1, t)]
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
             MFCC delta
 
         """
 
-        mfccs = super(MfccDeltaExtractor, self).extract(y=y)
+        mfccs = super(MfccDeltaExtractor, self).extract_from_spectrogram(spectrogram=spectrogram)
         return librosa.feature.delta(mfccs, width=self.width, order=1, axis=-1)
 
+    def extract_from_graph(self, graph):
+        """Extract features for the signal of the feature graph, MFCC is shared through the graph.
+
+        Parameters
+        ----------
+        graph : FeatureGraph
+            Feature graph
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
+            MFCC delta
+
+        """
+
+        mfccs = graph.get(
+            key=('delta', 1, self.width) + self.mfcc_key,
+            builder=lambda: librosa.feature.delta(self.get_mfcc(graph=graph), width=self.width, order=1, axis=-1)
+        )
+
+        if self.omit_zeroth:
+            # Remove first coefficient
+            mfccs = mfccs[..., 1:, :]
+
+        return mfccs
+
+    def extract_stream(self, blocks=None, filename=None, block_length_samples=65536):
+        """Extract features incrementally for a signal given in consecutive blocks or read from a file in blocks.
+
+        Static coefficients are buffered until the delta window has enough context. See `get_mfcc_stream` for the
+        decibel scaling.
+
+        Parameters
+        ----------
+        blocks : iterable of numpy.ndarray [shape=(n,)]
+            Consecutive signal blocks
+            Default value None
+
+        filename : str
+            Audio file to read in blocks, used if blocks are not given.
+            Default value None
+
+        block_length_samples : int
+            Block length used when reading the file
+            Default value 65536
+
+        Raises
+        ------
+        ValueError:
+            Sampling rate of the file does not match, or no input given
+
+        Yields
+        ------
+        numpy.ndarray [shape=(n_mfcc, t)]
+            MFCC delta
+
+        """
+
+        static = self.get_mfcc_stream(blocks=blocks, filename=filename, block_length_samples=block_length_samples)
+
+        for delta in delta_stream(frames=static, width=self.width, order=1):
+            yield to_compute_dtype(delta)
+
 
 class MfccAccelerationExtractor(MfccStaticExtractor):
     """Feature extractor class to extract MFCC acceleration features"""
@@ -1241,27 +2584,103 @@ class MfccAccelerationExtractor(MfccStaticExtractor):
 
         output = super(MfccAccelerationExtractor, self).to_string(ui=ui, indent=indent)
 
-        output += ui.line(field='Acceleration', indent=indent) + '\n'
-        output += ui.data(indent=indent + 2, field='width', value=self.width) + '\n'
-        return output
+        output += ui.line(field='Acceleration', indent=indent) + '\n'
+        output += ui.data(indent=indent + 2, field='width', value=self.width) + '\n'
+        return output
+
+    def __getstate__(self):
+        d = super(MfccAccelerationExtractor, self).__getstate__()
+        d.update({
+            'width': self.width
+        })
+
+        return d
+
+    def __setstate__(self, d):
+        super(MfccAccelerationExtractor, self).__setstate__(d)
+
+        self.width = d['width']
+
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
+
+        Parameters
+        ----------
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
+            MFCC acceleration
+
+        """
+
+        mfccs = super(MfccAccelerationExtractor, self).extract_from_spectrogram(spectrogram=spectrogram)
+        return librosa.feature.delta(mfccs, width=self.width, order=2, axis=-1)
+
+    def extract_from_graph(self, graph):
+        """Extract features for the signal of the feature graph, MFCC is shared through the graph.
+
+        Parameters
+        ----------
+        graph : FeatureGraph
+            Feature graph
+
+        Returns
+        -------
+        numpy.ndarray [shape=(n_mfcc, t)] or [shape=(b, n_mfcc, t)]
+            MFCC acceleration
+
+        """
+
+        mfccs = graph.get(
+            key=('delta', 2, self.width) + self.mfcc_key,
+            builder=lambda: librosa.feature.delta(self.get_mfcc(graph=graph), width=self.width, order=2, axis=-1)
+        )
+
+        if self.omit_zeroth:
+            # Remove first coefficient
+            mfccs = mfccs[..., 1:, :]
+
+        return mfccs
+
+    def extract_stream(self, blocks=None, filename=None, block_length_samples=65536):
+        """Extract features incrementally for a signal given in consecutive blocks or read from a file in blocks.
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+        Static coefficients are buffered until the delta window has enough context. See `get_mfcc_stream` for the
+        decibel scaling.
 
         Parameters
         ----------
-        y : numpy.ndarray [shape=(n,)]
-            Audio signal
+        blocks : iterable of numpy.ndarray [shape=(n,)]
+            Consecutive signal blocks
+            Default value None
 
-        Returns
-        -------
-        numpy.ndarray [shape=(1, t)]
+        filename : str
+            Audio file to read in blocks, used if blocks are not given.
+            Default value None
+
+        block_length_samples : int
+            Block length used when reading the file
+            Default value 65536
+
+        Raises
+        ------
+        ValueError:
+            Sampling rate of the file does not match, or no input given
+
+        Yields
+        ------
+        numpy.ndarray [shape=(n_mfcc, t)]
             MFCC acceleration
 
         """
 
-        mfccs = super(MfccAccelerationExtractor, self).extract(y=y)
-        return librosa.feature.delta(mfccs, width=self.width, order=2, axis=-1)
+        static = self.get_mfcc_stream(blocks=blocks, filename=filename, block_length_samples=block_length_samples)
+
+        for delta in delta_stream(frames=static, width=self.width, order=2):
+            yield to_compute_dtype(delta)
 
 
 class ZeroCrossingRateExtractor(FeatureExtractor):
@@ -1378,12 +2797,14 @@ class ZeroCrossingRateExtractor(FeatureExtractor):
         if isinstance(y, AudioContainer):
             y = y.data
 
-        return librosa.feature.zero_crossing_rate(
-            y=y,
-            frame_length=self.win_length_samples,
-            hop_length=self.hop_length_samples,
-            center=self.center
-        ).reshape((1, -1))
+        return to_compute_dtype(
+            librosa.feature.zero_crossing_rate(
+                y=to_compute_dtype(y),
+                frame_length=self.win_length_samples,
+                hop_length=self.hop_length_samples,
+                center=self.center
+            ).reshape((1, -1))
+        )
 
 
 class RMSEnergyExtractor(SpectralFeatureExtractor):
@@ -1501,30 +2922,23 @@ class RMSEnergyExtractor(SpectralFeatureExtractor):
 
         self.center = d['center']
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
 
         Parameters
         ----------
-        y : numpy.ndarray [shape=(n,)]
-            Audio signal
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
 
         Returns
         -------
-        numpy.ndarray [shape=(1, t)]
+        numpy.ndarray [shape=(1, t)] or [shape=(b, 1, t)]
             rmse
 
         """
 
-        spectrogram = self.get_spectrogram(
-            y=y,
-            n_fft=self.n_fft,
-            win_length_samples=self.win_length_samples,
-            hop_length_samples=self.hop_length_samples,
-            spectrogram_type=self.spectrogram_type,
-            center=self.center,
-            window=self.window
-        )
+        if spectrogram.ndim == 3:
+            return numpy.stack([self.extract_from_spectrogram(spectrogram=current) for current in spectrogram])
 
         return librosa.feature.rms(
             S=spectrogram
@@ -1554,130 +2968,650 @@ class SpectralCentroidExtractor(SpectralFeatureExtractor):
             Window length in samples.
             Default value None
 
-        hop_length_samples : int
-            Hop length in samples.
+        hop_length_samples : int
+            Hop length in samples.
+            Default value None
+
+        win_length_seconds : float
+            Window length in seconds.
+            Default value 0.04
+
+        hop_length_seconds : float
+            Hop length in seconds.
+            Default value 0.02
+
+        spectrogram_type : str
+            Spectrogram type, magnitude or power spectrogram.
+            Default value 'magnitude'
+
+        n_fft : int
+            Length of the FFT window.
+            Default value 2048
+
+        window_type : str
+            Window function type.
+            Default value 'hamming_asymmetric'
+
+        center : bool
+            If true, input signal is padded so to the frame is centered at hop length
+            Default value True
+
+        """
+
+        # Inject parameters for the parent classes back to kwargs. For the convenience they are expose explicitly here.
+        kwargs.update({
+            'fs': fs,
+            'win_length_samples': win_length_samples,
+            'hop_length_samples': hop_length_samples,
+            'win_length_seconds': win_length_seconds,
+            'hop_length_seconds': hop_length_seconds,
+            'spectrogram_type': spectrogram_type,
+            'n_fft': n_fft,
+            'window_type': window_type
+        })
+
+        # Run SpectralFeatureExtractor init
+        SpectralFeatureExtractor.__init__(self, **kwargs)
+
+        super(SpectralCentroidExtractor, self).__init__(**kwargs)
+
+        self.spectrogram_type = 'magnitude'
+        self.center = center
+
+    def to_string(self, ui=None, indent=0):
+        """Get container information in a string
+
+        Parameters
+        ----------
+        ui : FancyStringifier or FancyHTMLStringifier
+            Stringifier class
+            Default value FancyStringifier
+
+        indent : int
+            Amount of indention used
+            Default value 0
+
+        Returns
+        -------
+        str
+
+        """
+
+        if ui is None:
+            ui = FancyStringifier()
+
+        output = super(SpectralCentroidExtractor, self).to_string(ui=ui, indent=indent)
+
+        output += ui.line(field='SpectralCentroid', indent=indent) + '\n'
+        output += ui.data(indent=indent + 2, field='center', value=self.center) + '\n'
+
+        return output
+
+    def __getstate__(self):
+        d = super(SpectralCentroidExtractor, self).__getstate__()
+        d.update({
+            'center': self.center
+        })
+
+        return d
+
+    def __setstate__(self, d):
+        super(SpectralCentroidExtractor, self).__setstate__(d)
+
+        self.center = d['center']
+
+    def extract_from_spectrogram(self, spectrogram):
+        """Extract features from the spectrogram.
+
+        Parameters
+        ----------
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)] or [shape=(b, 1 + n_fft/2, t)]
+            Spectrogram, or spectrograms of multiple signals
+
+        Returns
+        -------
+        numpy.ndarray [shape=(1, t)] or [shape=(b, 1, t)]
+            spectral centroid
+
+        """
+
+        if spectrogram.ndim == 3:
+            return numpy.stack([self.extract_from_spectrogram(spectrogram=current) for current in spectrogram])
+
+        return librosa.feature.spectral_centroid(
+            S=spectrogram).reshape((1, -1))
+
+
+class StreamingFeatureExtractor(ContainerMixin):
+    """Stateful frame-by-frame feature extractor for real-time processing
+
+    Audio is pushed in blocks of arbitrary length, and features for each frame are returned as soon as its window is
+    complete. Frames are not centered, first frame covers the first `n_fft` samples. Signal and frame history are
+    kept in preallocated ring buffers.
+
+    For MfccDeltaExtractor and MfccAccelerationExtractor a causal delta with fixed lookahead is used: delta for the
+    frame is returned once `lookahead` following frames are available, and frames before the signal start are
+    replaced with the first frame. With `lookahead` of `width // 2` output equals to the offline delta except for
+    the first and last frames. For MFCC based features decibel scaling of each frame is clipped relative to the
+    running maximum of the frames since the signal start instead of the maximum of the whole signal, output does
+    not depend on the block length.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        stream = dcase_util.features.StreamingFeatureExtractor(
+            extractor=dcase_util.features.MelExtractor(fs=16000)
+        )
+        for block in audio_blocks:
+            features = stream.push(block)
+
+    """
+
+    def __init__(self, extractor=None, lookahead=None, top_db=80.0, max_frames=64, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        extractor : SpectralFeatureExtractor
+            Feature extractor
+
+        lookahead : int
+            Delta lookahead in frames, used with MfccDeltaExtractor and MfccAccelerationExtractor.
+            If None, `width // 2` is used.
+            Default value None
+
+        top_db : float
+            Threshold for the decibel scaling of MFCC based features, relative to the running maximum. If None,
+            decibel scaling is not clipped.
+            Default value 80.0
+
+        max_frames : int
+            Maximum amount of frames processed at once, frame buffers are preallocated for it. Frames of longer
+            pushes are processed in chunks.
+            Default value 64
+
+        Raises
+        ------
+        ValueError:
+            Extractor is not spectral feature extractor, lookahead outside the delta window, or max_frames
+            less than one
+
+        """
+
+        super(StreamingFeatureExtractor, self).__init__(**kwargs)
+
+        if not isinstance(extractor, SpectralFeatureExtractor):
+            message = '{name}: Spectral feature extractor required.'.format(
+                name=self.__class__.__name__
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        if extractor.hop_length_samples > extractor.n_fft:
+            message = '{name}: Hop length [{hop}] should not exceed FFT size [{n_fft}].'.format(
+                name=self.__class__.__name__,
+                hop=extractor.hop_length_samples,
+                n_fft=extractor.n_fft
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        if max_frames < 1:
+            message = '{name}: Maximum amount of frames [{max_frames}] should be at least one.'.format(
+                name=self.__class__.__name__,
+                max_frames=max_frames
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        self.extractor = extractor
+        self.top_db = top_db
+        self.max_frames = int(max_frames)
+
+        self.delta_order = None
+        self.delta_coefficients = None
+        self.lookahead = 0
+        if isinstance(extractor, MfccDeltaExtractor):
+            self.delta_order = 1
+
+        elif isinstance(extractor, MfccAccelerationExtractor):
+            self.delta_order = 2
+
+        if self.delta_order:
+            if lookahead is None:
+                lookahead = extractor.width // 2
+
+            if not 0 <= lookahead < extractor.width:
+                message = '{name}: Lookahead [{lookahead}] should be between 0 and {max_lookahead}.'.format(
+                    name=self.__class__.__name__,
+                    lookahead=lookahead,
+                    max_lookahead=extractor.width - 1
+                )
+                self.logger.exception(message)
+                raise ValueError(message)
+
+            self.lookahead = lookahead
+
+            # Savitzky-Golay derivative evaluated at the position of the output frame within the window
+            self.delta_coefficients = scipy.signal.savgol_coeffs(
+                extractor.width,
+                polyorder=self.delta_order,
+                deriv=self.delta_order,
+                pos=extractor.width - 1 - lookahead,
+                use='dot'
+            )
+
+        n_fft = extractor.n_fft
+        n_bins = n_fft // 2 + 1
+
+        # Data type of the buffers and output, following the data type policy at construction
+        self.dtype = compute_dtype(default=numpy.float64)
+
+        if self.delta_order:
+            self.delta_coefficients = self.delta_coefficients.astype(self.dtype)
+
+        # Window padded to FFT size
+        window = extractor.window if extractor.window is not None else numpy.ones(extractor.win_length_samples)
+        self.fft_window = numpy.zeros(n_fft, dtype=self.dtype)
+        window_start = (n_fft - len(window)) // 2
+        self.fft_window[window_start:window_start + len(window)] = window
+
+        # Frame buffers are stored frame-major, so that the frames of a chunk are a contiguous block
+        if isinstance(extractor, MfccStaticExtractor):
+            self._dct_basis = extractor.dct_basis[1:] if extractor.omit_zeroth else extractor.dct_basis
+            self._mel = numpy.zeros((self.max_frames, extractor.mel_basis.shape[0]), dtype=self.dtype)
+            self._db = numpy.zeros(self.max_frames, dtype=self.dtype)
+
+        # Running maximum of the decibel scaled mel band energies, used to clip MFCC based features
+        self._db_max = -numpy.inf
+
+        self.n_features = self.extract_static(numpy.ones((n_bins, 1))).shape[0]
+
+        # Signal ring buffer, samples are written twice so that the latest frame is always a contiguous view
+        self._signal = numpy.zeros(2 * n_fft, dtype=self.dtype)
+
+        # Windowed frames, spectrum and static features of the current chunk
+        self._frames = numpy.zeros((self.max_frames, n_fft), dtype=self.dtype)
+        self._spectrum = numpy.zeros((self.max_frames, n_bins), dtype=numpy.result_type(self.dtype, numpy.complex64))
+        self._spectrogram = numpy.zeros((self.max_frames, n_bins), dtype=self.dtype)
+        self._static = numpy.zeros((self.max_frames, self.n_features), dtype=self.dtype)
+
+        # numpy.fft supports output buffers from numpy 2.0 on
+        self._rfft_out = numpy.lib.NumpyVersion(numpy.__version__) >= '2.0.0'
+
+        if self.delta_order:
+            # Static feature ring buffer, written twice like the signal buffer
+            self._history = numpy.zeros((self.n_features, 2 * extractor.width), dtype=self.dtype)
+            self._delta = numpy.zeros(self.n_features, dtype=self.dtype)
+
+        self.reset()
+
+    def to_string(self, ui=None, indent=0):
+        """Get container information in a string
+
+        Parameters
+        ----------
+        ui : FancyStringifier or FancyHTMLStringifier
+            Stringifier class
+            Default value FancyStringifier
+
+        indent : int
+            Amount of indention used
+            Default value 0
+
+        Returns
+        -------
+        str
+
+        """
+
+        if ui is None:
+            ui = FancyStringifier()
+
+        output = ''
+        output += ui.class_name(self.__class__.__name__, indent=indent) + '\n'
+        output += ui.data(indent=indent + 2, field='Extractor', value=self.extractor.__class__.__name__) + '\n'
+        output += ui.data(indent=indent + 2, field='n_features', value=self.n_features) + '\n'
+        output += ui.data(indent=indent + 2, field='lookahead', value=self.lookahead, unit='frames') + '\n'
+        output += ui.data(indent=indent + 2, field='top_db', value=self.top_db, unit='dB') + '\n'
+        output += ui.data(indent=indent + 2, field='max_frames', value=self.max_frames) + '\n'
+        output += ui.data(indent=indent + 2, field='latency', value=self.latency_seconds, unit='sec') + '\n'
+
+        return output
+
+    @property
+    def latency_samples(self):
+        """Samples needed after the frame start until its features are returned
+
+        Returns
+        -------
+        int
+
+        """
+
+        return self.extractor.n_fft + self.lookahead * self.extractor.hop_length_samples
+
+    @property
+    def latency_seconds(self):
+        """Samples needed after the frame start until its features are returned, in seconds
+
+        Returns
+        -------
+        float
+
+        """
+
+        return self.latency_samples / float(self.extractor.fs)
+
+    def reset(self):
+        """Reset the stream state
+
+        Returns
+        -------
+        self
+
+        """
+
+        self._signal[:] = 0
+        self._position = 0
+        self._samples_to_frame = self.extractor.n_fft
+        self._frame_count = 0
+        self._db_max = -numpy.inf
+
+        if self.delta_order:
+            self._history[:] = 0
+            self._history_position = 0
+
+        return self
+
+    def extract_static(self, spectrogram, out=None):
+        """Extract features, without delta, from the spectrogram frames
+
+        Parameters
+        ----------
+        spectrogram : numpy.ndarray [shape=(1 + n_fft/2, t)]
+            Spectrogram frames
+
+        out : numpy.ndarray [shape=(n_features, t)]
+            Output buffer, if None new array is allocated.
             Default value None
 
-        win_length_seconds : float
-            Window length in seconds.
-            Default value 0.04
+        Returns
+        -------
+        numpy.ndarray [shape=(n_features, t)]
 
-        hop_length_seconds : float
-            Hop length in seconds.
-            Default value 0.02
+        """
 
-        spectrogram_type : str
-            Spectrogram type, magnitude or power spectrogram.
-            Default value 'magnitude'
+        length = spectrogram.shape[-1]
 
-        n_fft : int
-            Length of the FFT window.
-            Default value 2048
+        if isinstance(self.extractor, MfccStaticExtractor):
+            if out is None:
+                out = numpy.empty((length, self._dct_basis.shape[0]), dtype=self.dtype).T
 
-        window_type : str
-            Window function type.
-            Default value 'hamming_asymmetric'
+            if length <= self.max_frames:
+                mel = self._mel[:length]
+                db_max = self._db[:length]
 
-        center : bool
-            If true, input signal is padded so to the frame is centered at hop length
-            Default value True
+            else:
+                mel = numpy.empty((length, self._mel.shape[1]), dtype=self.dtype)
+                db_max = numpy.empty(length, dtype=self.dtype)
 
-        """
+            # Decibel scaling as in librosa.power_to_db, clipped relative to the running maximum
+            numpy.matmul(spectrogram.T, self.extractor.mel_basis.T, out=mel)
+            numpy.maximum(mel, 1e-10, out=mel)
+            numpy.log10(mel, out=mel)
+            mel *= 10.0
 
-        # Inject parameters for the parent classes back to kwargs. For the convenience they are expose explicitly here.
-        kwargs.update({
-            'fs': fs,
-            'win_length_samples': win_length_samples,
-            'hop_length_samples': hop_length_samples,
-            'win_length_seconds': win_length_seconds,
-            'hop_length_seconds': hop_length_seconds,
-            'spectrogram_type': spectrogram_type,
-            'n_fft': n_fft,
-            'window_type': window_type
-        })
+            if length:
+                numpy.max(mel, axis=1, out=db_max)
+                numpy.maximum(db_max, self._db_max, out=db_max)
+                numpy.maximum.accumulate(db_max, out=db_max)
+                self._db_max = db_max[-1]
 
-        # Run SpectralFeatureExtractor init
-        SpectralFeatureExtractor.__init__(self, **kwargs)
+                if self.top_db is not None:
+                    db_max -= self.top_db
+                    numpy.maximum(mel, db_max[:, None], out=mel)
 
-        super(SpectralCentroidExtractor, self).__init__(**kwargs)
+            numpy.matmul(mel, self._dct_basis.T, out=out.T)
+            return out
 
-        self.spectrogram_type = 'magnitude'
-        self.center = center
+        if isinstance(self.extractor, MelExtractor):
+            if out is None:
+                out = numpy.empty((length, self.extractor.mel_basis.shape[0]), dtype=self.dtype).T
 
-    def to_string(self, ui=None, indent=0):
-        """Get container information in a string
+            numpy.matmul(spectrogram.T, self.extractor.mel_basis.T, out=out.T)
+
+            if self.extractor.logarithmic:
+                out += self.extractor.eps
+                numpy.log(out, out=out)
+
+            return out
+
+        features = self.extractor.extract_from_spectrogram(spectrogram=spectrogram)
+        if out is None:
+            return features
+
+        out[:] = features
+        return out
+
+    def push(self, y, out=None):
+        """Push audio samples into the stream
 
         Parameters
         ----------
-        ui : FancyStringifier or FancyHTMLStringifier
-            Stringifier class
-            Default value FancyStringifier
+        y : numpy.ndarray [shape=(n,)]
+            Audio samples
 
-        indent : int
-            Amount of indention used
-            Default value 0
+        out : numpy.ndarray [shape=(n_features, t)]
+            Output buffer, with at least as many frames as are returned. If None, new array is allocated.
+            Default value None
 
         Returns
         -------
-        str
+        numpy.ndarray [shape=(n_features, t)]
+            Features for the frames completed, t can be zero
 
         """
 
-        if ui is None:
-            ui = FancyStringifier()
+        y = numpy.asarray(y).ravel()
+        n_fft = self.extractor.n_fft
 
-        output = super(SpectralCentroidExtractor, self).to_string(ui=ui, indent=indent)
+        if len(y) >= self._samples_to_frame:
+            frame_total = 1 + (len(y) - self._samples_to_frame) // self.extractor.hop_length_samples
 
-        output += ui.line(field='SpectralCentroid', indent=indent) + '\n'
-        output += ui.data(indent=indent + 2, field='center', value=self.center) + '\n'
+        else:
+            frame_total = 0
+
+        out = self._get_output(frame_total=frame_total, out=out)
+
+        output_count = 0
+        frame_count = 0
+        offset = 0
+        while offset < len(y):
+            # Write samples until the next frame is complete
+            length = min(len(y) - offset, self._samples_to_frame, n_fft - self._position)
+            block = y[offset:offset + length]
+
+            numpy.add(block, self.extractor.eps, out=self._signal[self._position:self._position + length])
+            numpy.add(block, self.extractor.eps, out=self._signal[self._position + n_fft:self._position + n_fft + length])
+
+            offset += length
+            self._position = (self._position + length) % n_fft
+            self._samples_to_frame -= length
+
+            if self._samples_to_frame == 0:
+                numpy.multiply(
+                    self._signal[self._position:self._position + n_fft],
+                    self.fft_window,
+                    out=self._frames[frame_count]
+                )
 
-        return output
+                frame_count += 1
+                self._samples_to_frame = self.extractor.hop_length_samples
 
-    def __getstate__(self):
-        d = super(SpectralCentroidExtractor, self).__getstate__()
-        d.update({
-            'center': self.center
-        })
+                if frame_count == self.max_frames:
+                    output_count = self._push_frames(frame_count=frame_count, out=out, output_count=output_count)
+                    frame_count = 0
 
-        return d
+        if frame_count:
+            output_count = self._push_frames(frame_count=frame_count, out=out, output_count=output_count)
 
-    def __setstate__(self, d):
-        super(SpectralCentroidExtractor, self).__setstate__(d)
+        return out[:, :output_count]
 
-        self.center = d['center']
+    def flush(self, out=None):
+        """Return the features held back by the delta lookahead
 
-    def extract(self, y):
-        """Extract features for the audio signal.
+        Frames after the signal end are replaced with the last frame. Incomplete frame at the end is discarded.
+        Call `reset` before pushing a new signal.
 
         Parameters
         ----------
-        y : numpy.ndarray [shape=(n,)]
-            Audio signal
+        out : numpy.ndarray [shape=(n_features, t)]
+            Output buffer, with at least as many frames as are returned. If None, new array is allocated.
+            Default value None
 
         Returns
         -------
-        numpy.ndarray [shape=(1, t)]
-            spectral centroid
+        numpy.ndarray [shape=(n_features, t)]
 
         """
-        spectrogram = self.get_spectrogram(
-            y=y,
-            n_fft=self.n_fft,
-            win_length_samples=self.win_length_samples,
-            hop_length_samples=self.hop_length_samples,
-            spectrogram_type=self.spectrogram_type,
-            center=self.center,
-            window=self.window
-        )
 
-        return librosa.feature.spectral_centroid(
-            S=spectrogram).reshape((1, -1))
+        if not self.delta_order or not self._frame_count:
+            return self._get_output(frame_total=0, out=out)[:, :0]
+
+        out = self._get_output(frame_total=self.lookahead, out=out)
+
+        width = self.extractor.width
+        last = self._history[:, (self._history_position - 1) % width].copy()
+
+        output_count = 0
+        for i in range(0, self.lookahead):
+            output_count = self._push_static(features=last[:, None], out=out, output_count=output_count)
+
+        return out[:, :output_count]
+
+    def _get_output(self, frame_total, out=None):
+        # Output buffer for features of the frame_total frames completed next
+        if self.delta_order:
+            frame_total = max(0, self._frame_count + frame_total - self.lookahead) - \
+                max(0, self._frame_count - self.lookahead)
+
+        if out is None:
+            return numpy.empty((frame_total, self.n_features), dtype=self.dtype).T
+
+        if out.ndim != 2 or out.shape[0] != self.n_features or out.shape[1] < frame_total:
+            message = '{name}: Output buffer shape {shape} should be at least ({n_features}, {frames}).'.format(
+                name=self.__class__.__name__,
+                shape=out.shape,
+                n_features=self.n_features,
+                frames=frame_total
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        return out
+
+    def _push_frames(self, frame_count, out, output_count):
+        # Features for the windowed frames of the chunk
+        if self._rfft_out:
+            spectrum = numpy.fft.rfft(self._frames[:frame_count], axis=-1, out=self._spectrum[:frame_count])
+
+        else:
+            spectrum = numpy.fft.rfft(self._frames[:frame_count], axis=-1)
+
+        spectrogram = numpy.abs(spectrum, out=self._spectrogram[:frame_count])
+        if self.extractor.spectrogram_type == 'power':
+            numpy.square(spectrogram, out=spectrogram)
+
+        if self.delta_order:
+            static = self._static[:frame_count].T
+
+        else:
+            # Static features are written directly to the output
+            static = out[:, output_count:output_count + frame_count]
+
+        static = self.extract_static(spectrogram=spectrogram.T, out=static)
+
+        return self._push_static(features=static, out=out, output_count=output_count)
+
+    def _push_static(self, features, out, output_count):
+        if not self.delta_order:
+            self._frame_count += features.shape[1]
+            return output_count + features.shape[1]
+
+        width = self.extractor.width
+        for frame in features.T:
+            if self._frame_count == 0:
+                # Frames before the signal start are replaced with the first frame
+                self._history[:] = frame[:, None]
+
+            self._history[:, self._history_position] = frame
+            self._history[:, self._history_position + width] = frame
+            self._history_position = (self._history_position + 1) % width
+            self._frame_count += 1
+
+            if self._frame_count > self.lookahead:
+                numpy.dot(
+                    self._history[:, self._history_position:self._history_position + width],
+                    self.delta_coefficients,
+                    out=self._delta
+                )
+                out[:, output_count] = self._delta
+                output_count += 1
+
+        return output_count
+
+
+# Embedding models loaded in the current process
+_embedding_models = {}
+_embedding_models_lock = threading.Lock()
+_embedding_models_pid = [os.getpid()]
+
+
+def load_embedding_model(loader, **kwargs):
+    """Load embedding model once per process
+
+    Models are cached by the loader function and its parameters, extractors with the same model parameters share
+    the loaded model. Cache is emptied in forked processes, as deep learning frameworks cannot use models
+    loaded in the parent process.
+
+    Parameters
+    ----------
+    loader : callable
+        Model loading function, e.g. `openl3.models.load_audio_embedding_model`
+
+    kwargs : dict
+        Parameters for the loading function
+
+    Returns
+    -------
+    object
+        Loaded model
+
+    """
+
+    key = (getattr(loader, '__module__', None), getattr(loader, '__name__', repr(loader))) + \
+        tuple(sorted(iteritems(kwargs)))
+
+    with _embedding_models_lock:
+        if _embedding_models_pid[0] != os.getpid():
+            _embedding_models.clear()
+            _embedding_models_pid[0] = os.getpid()
+
+        if key not in _embedding_models:
+            _embedding_models[key] = loader(**kwargs)
+
+        return _embedding_models[key]
 
 
 class EmbeddingExtractor(FeatureExtractor):
     """Embedding extractor base class"""
     label = 'embedding'  #: Extractor label
     description = 'Embedding extractor base class'  #: Extractor description
+    backend = None  #: Deep learning framework used by the extractor, 'tensorflow' or 'torch'
 
     def __init__(self, **kwargs):
         """Constructor
@@ -1716,6 +3650,49 @@ class EmbeddingExtractor(FeatureExtractor):
 
         return output
 
+    def set_threads(self, n_threads=None):
+        """Set amount of CPU threads used by the deep learning framework for inference
+
+        Threads are set for the whole process. TensorFlow accepts the setting only before it is initialized.
+
+        Parameters
+        ----------
+        n_threads : int
+            Amount of threads, if None, `n_threads` of the extractor is used. If both are None, framework default
+            is used.
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        if n_threads is None:
+            n_threads = getattr(self, 'n_threads', None)
+
+        if not n_threads:
+            return self
+
+        if self.backend == 'tensorflow':
+            import tensorflow as tf
+            try:
+                tf.config.threading.set_intra_op_parallelism_threads(n_threads)
+                tf.config.threading.set_inter_op_parallelism_threads(n_threads)
+
+            except RuntimeError:
+                self.logger.warning(
+                    '{name}: TensorFlow already initialized, unable to set amount of threads.'.format(
+                        name=self.__class__.__name__
+                    )
+                )
+
+        elif self.backend == 'torch':
+            import torch
+            torch.set_num_threads(n_threads)
+
+        return self
+
     def extract(self, y):
         """Extract features for the audio signal.
 
@@ -1737,11 +3714,12 @@ class OpenL3Extractor(EmbeddingExtractor):
     """OpenL3 Embedding extractor class"""
     label = 'openl3'  #: Extractor label
     description = 'OpenL3 (embedding)'  #: Extractor description
+    backend = 'tensorflow'  #: Deep learning framework used by the extractor
 
     def __init__(self, fs=48000, hop_length_samples=None, hop_length_seconds=0.02,
                  model=None, input_repr='mel256', content_type='music',
                  embedding_size=6144,
-                 center=True, batch_size=32, verbose=False,
+                 center=True, batch_size=32, n_threads=None, verbose=False,
                  **kwargs):
         """Constructor
 
@@ -1785,6 +3763,10 @@ class OpenL3Extractor(EmbeddingExtractor):
             Batch size used for input to embedding model
             Default value 32
 
+        n_threads : int
+            Amount of CPU threads used for inference, if None, framework default is used.
+            Default value None
+
         verbose : bool
             If True, prints verbose messages.
             Default value False
@@ -1810,6 +3792,7 @@ class OpenL3Extractor(EmbeddingExtractor):
         self.embedding_size = embedding_size
         self.center = center
         self.batch_size = batch_size
+        self.n_threads = n_threads
         self.verbose = verbose
 
         try:
@@ -1828,9 +3811,12 @@ class OpenL3Extractor(EmbeddingExtractor):
             self.logger.exception(message)
             raise ImportError(message)
 
+        self.set_threads()
+
         if self.model is None:
-            self.model = openl3.models.load_audio_embedding_model(
-                input_repr=self.input_repr ,
+            self.model = load_embedding_model(
+                loader=openl3.models.load_audio_embedding_model,
+                input_repr=self.input_repr,
                 content_type=self.content_type,
                 embedding_size=self.embedding_size
             )
@@ -1865,6 +3851,7 @@ class OpenL3Extractor(EmbeddingExtractor):
         output += ui.data(indent=indent + 2, field='embedding_size', value=self.embedding_size) + '\n'
         output += ui.data(indent=indent + 2, field='center', value=self.center) + '\n'
         output += ui.data(indent=indent + 2, field='batch_size', value=self.batch_size) + '\n'
+        output += ui.data(indent=indent + 2, field='n_threads', value=self.n_threads) + '\n'
         output += ui.data(indent=indent + 2, field='verbose', value=self.verbose) + '\n'
 
         return output
@@ -1877,6 +3864,7 @@ class OpenL3Extractor(EmbeddingExtractor):
             'embedding_size': self.embedding_size,
             'center': self.center,
             'batch_size': self.batch_size,
+            'n_threads': self.n_threads,
             'verbose': self.verbose
         })
 
@@ -1889,6 +3877,7 @@ class OpenL3Extractor(EmbeddingExtractor):
         self.embedding_size =  d['embedding_size']
         self.center =  d['center']
         self.batch_size =  d['batch_size']
+        self.n_threads = d.get('n_threads')
         self.verbose =  d['verbose']
 
         try:
@@ -1901,7 +3890,10 @@ class OpenL3Extractor(EmbeddingExtractor):
             self.logger.exception(message)
             raise ImportError(message)
 
-        self.model = openl3.models.load_audio_embedding_model(
+        self.set_threads()
+
+        self.model = load_embedding_model(
+            loader=openl3.models.load_audio_embedding_model,
             input_repr=self.input_repr,
             content_type=self.content_type,
             embedding_size=self.embedding_size
@@ -1942,17 +3934,61 @@ class OpenL3Extractor(EmbeddingExtractor):
         )
         return embedding.T
 
+    def extract_batch(self, signals):
+        """Extract features for multiple audio signals.
+
+        Frames of all signals are concatenated and the model is run on batches of `batch_size` frames,
+        embeddings are split back per signal.
+
+        Parameters
+        ----------
+        signals : list of numpy.ndarray [shape=(n,)]
+            Audio signals
+
+        Returns
+        -------
+        list of numpy.ndarray [shape=(D, T)]
+            Embeddings for each signal
+
+        """
+
+        try:
+            import openl3
+
+        except ImportError:
+            message = '{name}: Unable to import OpenL3 module. You can install it with `pip install openl3`.'.format(
+                name=self.__class__.__name__
+            )
+            self.logger.exception(message)
+            raise ImportError(message)
+
+        signals = list(signals)
+        if not signals:
+            return []
+
+        embeddings, timestamps = openl3.get_audio_embedding(
+            audio=signals,
+            sr=self.fs,
+            model=self.model,
+            center=self.center,
+            hop_size=self.hop_length_seconds,
+            batch_size=self.batch_size,
+            verbose=self.verbose
+        )
+        return [embedding.T for embedding in embeddings]
+
 
 class TorchOpenL3Extractor(EmbeddingExtractor):
     """TorchOpenL3 Embedding extractor class"""
     label = 'torchopenl3'  #: Extractor label
     description = 'TorchOpenL3 (embedding)'  #: Extractor description
+    backend = 'torch'  #: Deep learning framework used by the extractor
 
     def __init__(self, fs=48000, hop_length_samples=None, hop_length_seconds=0.02,
                  model=None, input_repr='mel256', content_type="music",
                  embedding_size=6144,
                  center=True, batch_size=32, sampler="resampy",
-                 verbose=False,
+                 n_threads=None, verbose=False,
                  **kwargs):
         """Constructor
 
@@ -2000,6 +4036,10 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
             Resampling library to be used. Possible values are "resampy" or "julian"
             Default value "resampy"
 
+        n_threads : int
+            Amount of CPU threads used for inference, if None, framework default is used.
+            Default value None
+
         verbose : bool
             If True, prints verbose messages.
             Default value False
@@ -2025,6 +4065,7 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
         self.embedding_size = embedding_size
         self.center = center
         self.batch_size = batch_size
+        self.n_threads = n_threads
         self.sampler = sampler
         self.verbose = verbose
 
@@ -2038,9 +4079,12 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
             self.logger.exception(message)
             raise ImportError(message)
 
+        self.set_threads()
+
         if self.model is None:
-            self.model = torchopenl3.models.load_audio_embedding_model(
-                input_repr=self.input_repr ,
+            self.model = load_embedding_model(
+                loader=torchopenl3.models.load_audio_embedding_model,
+                input_repr=self.input_repr,
                 content_type=self.content_type,
                 embedding_size=self.embedding_size
             )
@@ -2075,6 +4119,7 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
         output += ui.data(indent=indent + 2, field='embedding_size', value=self.embedding_size) + '\n'
         output += ui.data(indent=indent + 2, field='center', value=self.center) + '\n'
         output += ui.data(indent=indent + 2, field='batch_size', value=self.batch_size) + '\n'
+        output += ui.data(indent=indent + 2, field='n_threads', value=self.n_threads) + '\n'
         output += ui.data(indent=indent + 2, field='sampler', value=self.sampler) + '\n'
         output += ui.data(indent=indent + 2, field='verbose', value=self.verbose) + '\n'
 
@@ -2088,6 +4133,7 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
             'embedding_size': self.embedding_size,
             'center': self.center,
             'batch_size': self.batch_size,
+            'n_threads': self.n_threads,
             'sampler': self.sampler,
             'verbose': self.verbose
         })
@@ -2101,6 +4147,7 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
         self.embedding_size =  d['embedding_size']
         self.center =  d['center']
         self.batch_size =  d['batch_size']
+        self.n_threads = d.get('n_threads')
         self.sampler = d['sampler']
         self.verbose =  d['verbose']
 
@@ -2114,7 +4161,10 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
             self.logger.exception(message)
             raise ImportError(message)
 
-        self.model = torchopenl3.models.load_audio_embedding_model(
+        self.set_threads()
+
+        self.model = load_embedding_model(
+            loader=torchopenl3.models.load_audio_embedding_model,
             input_repr=self.input_repr,
             content_type=self.content_type,
             embedding_size=self.embedding_size
@@ -2156,6 +4206,50 @@ class TorchOpenL3Extractor(EmbeddingExtractor):
         )
         return embedding.T.cpu().detach().numpy()
 
+    def extract_batch(self, signals):
+        """Extract features for multiple audio signals.
+
+        Frames of all signals are concatenated and the model is run on batches of `batch_size` frames,
+        embeddings are split back per signal.
+
+        Parameters
+        ----------
+        signals : list of numpy.ndarray [shape=(n,)]
+            Audio signals
+
+        Returns
+        -------
+        list of numpy.ndarray [shape=(D, T)]
+            Embeddings for each signal
+
+        """
+
+        try:
+            import torchopenl3
+
+        except ImportError:
+            message = '{name}: Unable to import OpenL3 module. You can install it with `pip install torchopenl3`.'.format(
+                name=self.__class__.__name__
+            )
+            self.logger.exception(message)
+            raise ImportError(message)
+
+        signals = list(signals)
+        if not signals:
+            return []
+
+        embeddings, timestamps = torchopenl3.get_audio_embedding(
+            audio=signals,
+            sr=self.fs,
+            model=self.model,
+            center=self.center,
+            hop_size=self.hop_length_seconds,
+            batch_size=self.batch_size,
+            sampler=self.sampler,
+            verbose=self.verbose
+        )
+        return [embedding.T.cpu().detach().numpy() for embedding in embeddings]
+
     def forward(self, y):
         """Extract features for the audio signal, using torch.Tensors
 
@@ -2197,10 +4291,11 @@ class EdgeL3Extractor(EmbeddingExtractor):
     """EdgeL3 Embedding extractor class"""
     label = 'edgel3'  #: Extractor label
     description = 'EdgeL3 (embedding)'  #: Extractor description
+    backend = 'tensorflow'  #: Deep learning framework used by the extractor
 
     def __init__(self, fs=48000, hop_length_samples=None, hop_length_seconds=0.02,
                  model=None, retrain_type='ft', sparsity=95.45,
-                 center=True, verbose=False,
+                 center=True, batch_size=32, n_threads=None, verbose=False,
                  **kwargs):
         """Constructor
 
@@ -2235,6 +4330,14 @@ class EdgeL3Extractor(EmbeddingExtractor):
             If True, pads beginning of signal so timestamps correspond to center of window.
             Default value True
 
+        batch_size : int
+            Batch size used for input to embedding model in `extract_batch`
+            Default value 32
+
+        n_threads : int
+            Amount of CPU threads used for inference, if None, framework default is used.
+            Default value None
+
         verbose : bool
             If True, prints verbose messages.
             Default value False
@@ -2259,6 +4362,8 @@ class EdgeL3Extractor(EmbeddingExtractor):
         self.retrain_type = retrain_type
         self.sparsity = sparsity
         self.center = center
+        self.batch_size = batch_size
+        self.n_threads = n_threads
         self.verbose = verbose
 
         try:
@@ -2277,9 +4382,12 @@ class EdgeL3Extractor(EmbeddingExtractor):
             self.logger.exception(message)
             raise ImportError(message)
 
+        self.set_threads()
+
         if self.model is None:
-            self.model = edgel3.models.load_embedding_model(
-                retrain_type=self.retrain_type ,
+            self.model = load_embedding_model(
+                loader=edgel3.models.load_embedding_model,
+                retrain_type=self.retrain_type,
                 sparsity=self.sparsity
             )
 
@@ -2311,6 +4419,8 @@ class EdgeL3Extractor(EmbeddingExtractor):
         output += ui.data(indent=indent + 2, field='retrain_type', value=self.retrain_type) + '\n'
         output += ui.data(indent=indent + 2, field='sparsity', value=self.sparsity) + '\n'
         output += ui.data(indent=indent + 2, field='center', value=self.center) + '\n'
+        output += ui.data(indent=indent + 2, field='batch_size', value=self.batch_size) + '\n'
+        output += ui.data(indent=indent + 2, field='n_threads', value=self.n_threads) + '\n'
         output += ui.data(indent=indent + 2, field='verbose', value=self.verbose) + '\n'
 
         return output
@@ -2321,6 +4431,8 @@ class EdgeL3Extractor(EmbeddingExtractor):
             'retrain_type': self.retrain_type,
             'sparsity': self.sparsity,
             'center': self.center,
+            'batch_size': self.batch_size,
+            'n_threads': self.n_threads,
             'verbose': self.verbose
         })
 
@@ -2331,6 +4443,8 @@ class EdgeL3Extractor(EmbeddingExtractor):
         self.retrain_type = d['retrain_type']
         self.sparsity = d['sparsity']
         self.center = d['center']
+        self.batch_size = d.get('batch_size', 32)
+        self.n_threads = d.get('n_threads')
         self.verbose = d['verbose']
 
         try:
@@ -2343,7 +4457,10 @@ class EdgeL3Extractor(EmbeddingExtractor):
             self.logger.exception(message)
             raise ImportError(message)
 
-        self.model = edgel3.models.load_embedding_model(
+        self.set_threads()
+
+        self.model = load_embedding_model(
+            loader=edgel3.models.load_embedding_model,
             retrain_type=self.retrain_type,
             sparsity=self.sparsity
         )
@@ -2382,3 +4499,81 @@ class EdgeL3Extractor(EmbeddingExtractor):
             verbose=self.verbose
         )
         return embedding.T
+
+    def get_frames(self, y):
+        """Model input frames for the audio signal
+
+        Signal is framed the same way as in `edgel3.get_embedding`: one second frames, beginning padded with half
+        a frame if `center` is set, and end padded to cover the whole signal.
+
+        Parameters
+        ----------
+        y : numpy.ndarray [shape=(n,)]
+            Audio signal, sampled at 48kHz
+
+        Returns
+        -------
+        numpy.ndarray [shape=(T, frame_length)]
+            Frames
+
+        """
+
+        # Model input is sampled at 48kHz
+        frame_length = 48000
+        hop_length = int(self.hop_length_seconds * 48000)
+
+        if self.center:
+            y = numpy.pad(y, (frame_length // 2, 0), mode='constant')
+
+        if len(y) < frame_length:
+            pad_length = frame_length - len(y)
+
+        else:
+            pad_length = int(numpy.ceil((len(y) - frame_length) / float(hop_length))) * hop_length - \
+                (len(y) - frame_length)
+
+        if pad_length > 0:
+            y = numpy.pad(y, (0, pad_length), mode='constant')
+
+        return frame_signals(y, frame_length=frame_length, hop_length=hop_length)
+
+    def extract_batch(self, signals):
+        """Extract features for multiple audio signals.
+
+        Frames of all signals are concatenated and the model is run on batches of `batch_size` frames,
+        embeddings are split back per signal. Signals not sampled at 48kHz are first resampled with the same
+        resampling filter as in `edgel3.get_embedding`.
+
+        Parameters
+        ----------
+        signals : list of numpy.ndarray [shape=(n,)]
+            Audio signals
+
+        Returns
+        -------
+        list of numpy.ndarray [shape=(D, T)]
+            Embeddings for each signal
+
+        """
+
+        signals = list(signals)
+        if not signals:
+            return []
+
+        if self.fs != 48000:
+            signals = [resample(y=y, orig_sr=self.fs, target_sr=48000, res_type='kaiser_best') for y in signals]
+
+        frames = [self.get_frames(y=y) for y in signals]
+        embedding = self.model.predict(
+            numpy.concatenate(frames)[:, None, :],
+            batch_size=self.batch_size,
+            verbose=self.verbose
+        )
+
+        embeddings = []
+        frame_start = 0
+        for signal_frames in frames:
+            embeddings.append(embedding[frame_start:frame_start + len(signal_frames)].T)
+            frame_start += len(signal_frames)
+
+        return embeddings
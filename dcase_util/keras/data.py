@@ -250,39 +250,38 @@ def get_keras_data_sequence_class():
             batch_buffer_data = []
             batch_buffer_meta = []
 
-            for item_index in range(start_index, stop_index):
-                if item_index < len(self.item_list):
-                    item = self.item_list[item_index]
-
-                    # Load item data
-                    data, meta = self.process_item(item=item)
-
-                    if self.transformer_callbacks:
-                        # Apply transformer callbacks
-                        for callback in self.transformer_callbacks:
-                            data, meta = callback(
-                                data=data,
-                                meta=meta
-                            )
+            # Load item data
+            items = self.process_items(
+                items=self.item_list[start_index:stop_index]
+            )
 
-                    # Collect data
-                    batch_buffer_data.append(data.data)
+            for data, meta in items:
+                if self.transformer_callbacks:
+                    # Apply transformer callbacks
+                    for callback in self.transformer_callbacks:
+                        data, meta = callback(
+                            data=data,
+                            meta=meta
+                        )
 
-                    # Collect meta
-                    if self.target_format == 'single_target_per_sequence':
-                        # Collect single target per sequence
-                        for i in range(0, data.shape[data.sequence_axis]):
-                            batch_buffer_meta.append(meta.data[:, 0])
+                # Collect data
+                batch_buffer_data.append(data.data)
 
-                    elif self.target_format == 'same':
-                        # Collect single target per sequence
-                        batch_buffer_meta.append(
-                            numpy.repeat(
-                                a=meta.data,
-                                repeats=data.length,
-                                axis=1
-                            )
+                # Collect meta
+                if self.target_format == 'single_target_per_sequence':
+                    # Collect single target per sequence
+                    for i in range(0, data.shape[data.sequence_axis]):
+                        batch_buffer_meta.append(meta.data[:, 0])
+
+                elif self.target_format == 'same':
+                    # Collect single target per sequence
+                    batch_buffer_meta.append(
+                        numpy.repeat(
+                            a=meta.data,
+                            repeats=data.length,
+                            axis=1
                         )
+                    )
 
             if len(data.shape) == 2:
                 # Prepare 2D data, stack along time_axis
@@ -409,6 +408,57 @@ def get_keras_data_sequence_class():
 
             return data, meta
 
+        def process_items(self, items):
+            """Process items through the processing chains as a batch, see `ProcessingChain.process_batch`.
+
+            If `process_item` is overridden in a subclass, items are processed one by one with it.
+
+            Parameters
+            ----------
+            items : list of dict
+                Items
+
+            Returns
+            -------
+            list of tuple
+                Data and meta for each item
+
+            """
+
+            if getattr(self.process_item, '__func__', None) is not getattr(
+                    KerasDataSequence.process_item, '__func__', KerasDataSequence.process_item):
+                return [self.process_item(item=item) for item in items]
+
+            output = [None] * len(items)
+            missing = []
+            for item_index, item in enumerate(items):
+                if self.data_buffer is not None and self.data_buffer.key_exists(key=item):
+                    # Fetch data and meta through internal buffer
+                    output[item_index] = self.data_buffer.get(key=item)
+
+                else:
+                    missing.append(item_index)
+
+            if missing:
+                data = self.data_processing_chain.process_batch(
+                    items=[items[item_index]['data'] for item_index in missing]
+                )
+                meta = self.meta_processing_chain.process_batch(
+                    items=[items[item_index]['meta'] for item_index in missing]
+                )
+
+                for item_index, item_data, item_meta in zip(missing, data, meta):
+                    if self.data_buffer is not None:
+                        self.data_buffer.set(
+                            key=items[item_index],
+                            data=item_data,
+                            meta=item_meta
+                        )
+
+                    output[item_index] = (item_data, item_meta)
+
+            return output
+
         def on_epoch_end(self):
             if self.data_processing_chain_callback_on_epoch_end:
                 for callback_parameters in self.data_processing_chain_callback_on_epoch_end:
@@ -438,11 +488,13 @@ def data_collector(item_list=None,
                    target_format='single_target_per_sequence',
                    channel_dimension='channels_last',
                    verbose=True,
-                   print_indent=2
+                   print_indent=2,
+                   batch_size=32
                    ):
     """Data collector
 
-    Collects data and meta into matrices while processing them through processing chains.
+    Collects data and meta into matrices while processing them through processing chains. Items are processed
+    in batches with `ProcessingChain.process_batch`.
 
     Parameters
     ----------
@@ -477,6 +529,10 @@ def data_collector(item_list=None,
     print_indent : int
         Default value 2
 
+    batch_size : int
+        Amount of items processed together through the processing chains.
+        Default value 32
+
     Returns
     -------
     numpy.ndarray
@@ -495,37 +551,39 @@ def data_collector(item_list=None,
         X = []
         Y = []
 
-        for item in item_list:
-            data = data_processing_chain.process(**item['data'])
-            meta = meta_processing_chain.process(**item['meta'])
+        for batch_start in range(0, len(item_list), batch_size):
+            batch = item_list[batch_start:batch_start + batch_size]
+            for data, meta in zip(
+                    data_processing_chain.process_batch(items=[item['data'] for item in batch]),
+                    meta_processing_chain.process_batch(items=[item['meta'] for item in batch])):
 
-            X.append(data.data)
+                X.append(data.data)
 
-            # Collect meta
-            if target_format == 'single_target_per_sequence':
-                # Collect single target per sequence
-                for i in range(0, data.shape[data.sequence_axis]):
-                    Y.append(meta.data[:, 0])
+                # Collect meta
+                if target_format == 'single_target_per_sequence':
+                    # Collect single target per sequence
+                    for i in range(0, data.shape[data.sequence_axis]):
+                        Y.append(meta.data[:, 0])
 
-            elif target_format == 'same':
-                # Collect same target per each element (frame)
-                if data.time_axis != meta.time_axis:
-                    Y.append(
-                        numpy.repeat(
-                            a=meta.data,
-                            repeats=data.length,
-                            axis=meta.time_axis
-                        ).T
-                    )
+                elif target_format == 'same':
+                    # Collect same target per each element (frame)
+                    if data.time_axis != meta.time_axis:
+                        Y.append(
+                            numpy.repeat(
+                                a=meta.data,
+                                repeats=data.length,
+                                axis=meta.time_axis
+                            ).T
+                        )
 
-                else:
-                    Y.append(
-                        numpy.repeat(
-                            a=meta.data,
-                            repeats=data.length,
-                            axis=meta.time_axis
+                    else:
+                        Y.append(
+                            numpy.repeat(
+                                a=meta.data,
+                                repeats=data.length,
+                                axis=meta.time_axis
+                            )
                         )
-                    )
 
         data_size = {}
 
@@ -34,6 +34,12 @@ ProcessingChain
     ProcessingChain.log_chain
     ProcessingChain.push_processor
     ProcessingChain.process
+    ProcessingChain.process_batch
+    ProcessingChain.map
+    ProcessingChain.benchmark_in_place
+    ProcessingChain.enable_step_cache
+    ProcessingChain.disable_step_cache
+    ProcessingChain.deterministic_prefix_length
     ProcessingChain.processor_exists
     ProcessingChain.processor_class_reference
     ProcessingChain.processor_class
@@ -41,6 +47,39 @@ ProcessingChain
     ProcessingChain.chain_item
     ProcessingChain.call_method
 
+ProcessingChainProfiler
+-----------------------
+
+*dcase_util.processors.ProcessingChainProfiler*
+
+.. autosummary::
+    :toctree: generated/
+
+    ProcessingChainProfiler
+    ProcessingChainProfiler.start
+    ProcessingChainProfiler.stop
+    ProcessingChainProfiler.reset
+    ProcessingChainProfiler.report
+    ProcessingChainProfiler.to_chrome_trace
+    ProcessingChainProfiler.save_json
+    ProcessingChainProfiler.save_chrome_trace
+
+ProcessingChainCache
+--------------------
+
+*dcase_util.processors.ProcessingChainCache*
+
+.. autosummary::
+    :toctree: generated/
+
+    ProcessingChainCache
+    ProcessingChainCache.key
+    ProcessingChainCache.get
+    ProcessingChainCache.set
+    ProcessingChainCache.size
+    ProcessingChainCache.evict
+    ProcessingChainCache.clear
+
 Audio
 :::::
 
@@ -54,6 +93,7 @@ AudioReadingProcessor
 
     AudioReadingProcessor
     AudioReadingProcessor.process
+    AudioReadingProcessor.process_batch
 
 MonoAudioReadingProcessor
 -------------------------
@@ -65,6 +105,7 @@ MonoAudioReadingProcessor
 
     MonoAudioReadingProcessor
     MonoAudioReadingProcessor.process
+    MonoAudioReadingProcessor.process_batch
 
 AudioWritingProcessor
 ---------------------
@@ -303,6 +344,11 @@ RepositoryFeatureExtractorProcessor
 
     RepositoryFeatureExtractorProcessor
     RepositoryFeatureExtractorProcessor.process
+    RepositoryFeatureExtractorProcessor.extract
+    RepositoryFeatureExtractorProcessor.extract_batch
+    RepositoryFeatureExtractorProcessor.get_processor
+    RepositoryFeatureExtractorProcessor.get_processors
+    RepositoryFeatureExtractorProcessor.get_feature_cache
 
 FeatureExtractorProcessor
 -------------------------
@@ -314,6 +360,8 @@ FeatureExtractorProcessor
 
     FeatureExtractorProcessor
     FeatureExtractorProcessor.process
+    FeatureExtractorProcessor.process_batch
+    FeatureExtractorProcessor.get_feature_cache
 
 RepositoryFeatureExtractorProcessor
 -----------------------------------
@@ -336,6 +384,7 @@ MelExtractorProcessor
 
     MelExtractorProcessor
     MelExtractorProcessor.process
+    MelExtractorProcessor.process_batch
 
 MfccStaticExtractorProcessor
 ----------------------------
@@ -347,6 +396,7 @@ MfccStaticExtractorProcessor
 
     MfccStaticExtractorProcessor
     MfccStaticExtractorProcessor.process
+    MfccStaticExtractorProcessor.process_batch
 
 MfccDeltaExtractorProcessor
 ---------------------------
@@ -358,6 +408,7 @@ MfccDeltaExtractorProcessor
 
     MfccDeltaExtractorProcessor
     MfccDeltaExtractorProcessor.process
+    MfccDeltaExtractorProcessor.process_batch
 
 MfccAccelerationExtractorProcessor
 ----------------------------------
@@ -369,6 +420,7 @@ MfccAccelerationExtractorProcessor
 
     MfccAccelerationExtractorProcessor
     MfccAccelerationExtractorProcessor.process
+    MfccAccelerationExtractorProcessor.process_batch
 
 ZeroCrossingRateExtractorProcessor
 ----------------------------------
@@ -380,6 +432,7 @@ ZeroCrossingRateExtractorProcessor
 
     ZeroCrossingRateExtractorProcessor
     ZeroCrossingRateExtractorProcessor.process
+    ZeroCrossingRateExtractorProcessor.process_batch
 
 RMSEnergyExtractorProcessor
 ---------------------------
@@ -391,6 +444,7 @@ RMSEnergyExtractorProcessor
 
     RMSEnergyExtractorProcessor
     RMSEnergyExtractorProcessor.process
+    RMSEnergyExtractorProcessor.process_batch
 
 
 SpectralCentroidExtractorProcessor
@@ -403,6 +457,7 @@ SpectralCentroidExtractorProcessor
 
     SpectralCentroidExtractorProcessor
     SpectralCentroidExtractorProcessor.process
+    SpectralCentroidExtractorProcessor.process_batch
 
 OpenL3ExtractorProcessor
 ------------------------
@@ -414,6 +469,7 @@ OpenL3ExtractorProcessor
 
     OpenL3ExtractorProcessor
     OpenL3ExtractorProcessor.process
+    OpenL3ExtractorProcessor.process_batch
 
 TorchOpenL3ExtractorProcessor
 ------------------------
@@ -425,6 +481,7 @@ TorchOpenL3ExtractorProcessor
 
     TorchOpenL3ExtractorProcessor
     TorchOpenL3ExtractorProcessor.process
+    TorchOpenL3ExtractorProcessor.process_batch
 
 EdgeL3ExtractorProcessor
 ------------------------
@@ -436,6 +493,25 @@ EdgeL3ExtractorProcessor
 
     EdgeL3ExtractorProcessor
     EdgeL3ExtractorProcessor.process
+    EdgeL3ExtractorProcessor.process_batch
+
+Batch processing
+::::::::::::::::
+
+BatchFeatureExtractor
+---------------------
+
+*dcase_util.processors.BatchFeatureExtractor*
+
+Feature extraction for a list of audio files with a process pool.
+
+.. autosummary::
+    :toctree: generated/
+
+    BatchFeatureExtractor
+    BatchFeatureExtractor.extract
+    BatchFeatureExtractor.output_filename
+    BatchFeatureExtractor.is_up_to_date
 
 Metadata
 ::::::::
@@ -469,11 +545,14 @@ Processor
 """
 
 from .processing_chain import *
+from .profiler import *
+from .cache import *
 from .processor import *
 from .data import *
 from .encoders import *
 from .metadata import *
 from .audio import *
 from .features import *
+from .batch import *
 
 __all__ = [_ for _ in dir() if not _.startswith('_')]
@@ -2,18 +2,21 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import print_function, absolute_import
-import copy
 import numpy
+import six
 from dcase_util.containers import AudioContainer
 from dcase_util.processors import Processor, ProcessingChainItemType, ProcessingChain, SequencingProcessor
 from dcase_util.data import Sequencer
+from dcase_util.utils import copy_unless_in_place
 
 class AudioReadingProcessor(Processor):
     input_type = ProcessingChainItemType.NONE  #: Input data type
     output_type = ProcessingChainItemType.AUDIO  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
-    def __init__(self, data=None, fs=44100,
+    def __init__(self, data=None, fs=None,
                  focus_start_samples=None, focus_stop_samples=None, focus_channel=None, mono=False,
+                 res_type='kaiser_best', resample_cache_path=None,
                  **kwargs):
         """Constructor
 
@@ -23,7 +26,8 @@ class AudioReadingProcessor(Processor):
             Data to initialize the container
 
         fs : int
-            Target sampling rate when reading audio
+            Target sampling rate when reading audio, if None, audio is read at its native sampling rate.
+            Default value None
 
         focus_start_samples : int
             Sample id of the focus segment start
@@ -37,6 +41,14 @@ class AudioReadingProcessor(Processor):
         mono : bool
             Mixdown multi-channel audio in during the reading stage.
 
+        res_type : str
+            Resample type, see `dcase_util.utils.resampler_list`.
+            Default value 'kaiser_best'
+
+        resample_cache_path : str
+            Path to store resampled audio, if None, cache is not used.
+            Default value None
+
         """
 
         # Inject initialization parameters back to kwargs
@@ -47,7 +59,9 @@ class AudioReadingProcessor(Processor):
                 'focus_start_samples': focus_start_samples,
                 'focus_stop_samples': focus_stop_samples,
                 'focus_channel': focus_channel,
-                'mono': mono
+                'mono': mono,
+                'res_type': res_type,
+                'resample_cache_path': resample_cache_path
             }
         )
 
@@ -108,56 +122,189 @@ class AudioReadingProcessor(Processor):
             if filename:
                 audio_container.load(
                     filename=filename,
-                    mono=self.init_parameters.get('mono')
+                    fs=self.init_parameters.get('fs') or 'native',
+                    mono=self.init_parameters.get('mono'),
+                    res_type=self.init_parameters.get('res_type', 'kaiser_best'),
+                    resample_cache_path=self.init_parameters.get('resample_cache_path')
                 )
 
-            # Set focus segment and channel
-            audio_container.set_focus(
-                start=focus_start_samples,
-                stop=focus_stop_samples,
-                duration=focus_duration_samples,
-                start_seconds=focus_start_seconds,
-                stop_seconds=focus_stop_seconds,
-                duration_seconds=focus_duration_seconds,
-                channel=focus_channel
+            return self._finalize(
+                audio_container=audio_container,
+                filename=filename,
+                focus_start_samples=focus_start_samples,
+                focus_stop_samples=focus_stop_samples,
+                focus_duration_samples=focus_duration_samples,
+                focus_start_seconds=focus_start_seconds,
+                focus_stop_seconds=focus_stop_seconds,
+                focus_duration_seconds=focus_duration_seconds,
+                focus_channel=focus_channel,
+                store_processing_chain=store_processing_chain
             )
 
-            if store_processing_chain:
-                processing_chain_item = self.get_processing_chain_item()
+        else:
+            message = '{name}: Wrong input data type, type required [{input_type}].'.format(
+                name=self.__class__.__name__,
+                input_type=self.input_type)
+
+            self.logger.exception(message)
+            raise ValueError(message)
+
+    def process_batch(self, items, n_jobs=4, ordered=True, max_in_flight=None, store_processing_chain=False):
+        """Audio reading for many items with a thread pool
 
-                if 'process_parameters' not in processing_chain_item:
-                    processing_chain_item['process_parameters'] = {}
+        Files are read with `AudioContainer.load_batch`, decoding runs in worker threads while at most
+        max_in_flight items are read ahead of the consumer.
+
+        Parameters
+        ----------
+        items : list of str or list of dict
+            Filenames, or dicts with process parameters (filename, focus_start_samples, focus_stop_samples,
+            focus_duration_samples, focus_start_seconds, focus_stop_seconds, focus_duration_seconds, focus_channel).
+            If audio is given in the data field instead of filename, items are processed with process method.
+
+        n_jobs : int
+            Amount of worker threads.
+            Default value 4
+
+        ordered : bool
+            Yield containers in the item order. If False, tuples (item index, container) are yielded in the
+            completion order.
+            Default value True
+
+        max_in_flight : int, optional
+            Maximum amount of items read ahead, if None two times n_jobs is used.
+            Default value None
 
-                processing_chain_item['process_parameters']['filename'] = filename
+        store_processing_chain : bool
+            Store processing chain to data container returned
+            Default value False
 
-                processing_chain_item['process_parameters']['focus_start_samples'] = focus_start_samples
-                processing_chain_item['process_parameters']['focus_stop_samples'] = focus_stop_samples
-                processing_chain_item['process_parameters']['focus_duration_samples'] = focus_duration_samples
+        Returns
+        -------
+        generator of AudioContainer, or generator of tuple (int, AudioContainer)
 
-                processing_chain_item['process_parameters']['focus_start_seconds'] = focus_start_seconds
-                processing_chain_item['process_parameters']['focus_stop_seconds'] = focus_stop_seconds
-                processing_chain_item['process_parameters']['focus_duration_seconds'] = focus_duration_seconds
+        """
 
-                processing_chain_item['process_parameters']['focus_channel'] = focus_channel
+        items = [{'filename': item} if isinstance(item, six.string_types) else dict(item) for item in items]
 
-                # Push chain item into processing chain stored in the container
+        if not all([item.get('filename') for item in items]):
+            # Audio given directly, process items one by one
+            for index, item in enumerate(items):
+                audio_container = self.process(store_processing_chain=store_processing_chain, **item)
 
-                # Create processing chain to be stored in the container, and push chain item into it
-                if hasattr(audio_container, 'processing_chain'):
-                    audio_container.processing_chain.push_processor(**processing_chain_item)
+                if ordered:
+                    yield audio_container
 
                 else:
-                    audio_container.processing_chain = ProcessingChain().push_processor(**processing_chain_item)
+                    yield index, audio_container
+
+            return
+
+        containers = AudioContainer.load_batch(
+            items=[
+                {
+                    'filename': item['filename'],
+                    'fs': self.init_parameters.get('fs'),
+                    'mono': self.init_parameters.get('mono')
+                } for item in items
+            ],
+            n_jobs=n_jobs,
+            ordered=ordered,
+            max_in_flight=max_in_flight,
+            res_type=self.init_parameters.get('res_type', 'kaiser_best'),
+            resample_cache_path=self.init_parameters.get('resample_cache_path')
+        )
 
-            return audio_container
+        if ordered:
+            containers = enumerate(containers)
 
-        else:
-            message = '{name}: Wrong input data type, type required [{input_type}].'.format(
-                name=self.__class__.__name__,
-                input_type=self.input_type)
+        for index, loaded_container in containers:
+            # Container with the processor parameters, data from the loaded one
+            audio_container = AudioContainer(**self.init_parameters)
+            audio_container.filename = loaded_container.filename
+            audio_container.fs = loaded_container.fs
+            audio_container.data = loaded_container.data
+            audio_container.data_synced_with_file = True
+
+            item = items[index]
+            audio_container = self._finalize(
+                audio_container=audio_container,
+                filename=item.get('filename'),
+                focus_start_samples=item.get('focus_start_samples'),
+                focus_stop_samples=item.get('focus_stop_samples'),
+                focus_duration_samples=item.get('focus_duration_samples'),
+                focus_start_seconds=item.get('focus_start_seconds'),
+                focus_stop_seconds=item.get('focus_stop_seconds'),
+                focus_duration_seconds=item.get('focus_duration_seconds'),
+                focus_channel=item.get('focus_channel'),
+                store_processing_chain=store_processing_chain
+            )
 
-            self.logger.exception(message)
-            raise ValueError(message)
+            if ordered:
+                yield audio_container
+
+            else:
+                yield index, audio_container
+
+    def _finalize(self, audio_container, filename=None,
+                  focus_start_samples=None, focus_stop_samples=None, focus_duration_samples=None,
+                  focus_start_seconds=None, focus_stop_seconds=None, focus_duration_seconds=None,
+                  focus_channel=None,
+                  store_processing_chain=False):
+        """Set focus segment and store processing chain to the read container
+
+        Parameters
+        ----------
+        audio_container : AudioContainer
+            Read audio
+
+        See process for the other parameters.
+
+        Returns
+        -------
+        AudioContainer
+
+        """
+
+        # Set focus segment and channel
+        audio_container.set_focus(
+            start=focus_start_samples,
+            stop=focus_stop_samples,
+            duration=focus_duration_samples,
+            start_seconds=focus_start_seconds,
+            stop_seconds=focus_stop_seconds,
+            duration_seconds=focus_duration_seconds,
+            channel=focus_channel
+        )
+
+        if store_processing_chain:
+            processing_chain_item = self.get_processing_chain_item()
+
+            if 'process_parameters' not in processing_chain_item:
+                processing_chain_item['process_parameters'] = {}
+
+            processing_chain_item['process_parameters']['filename'] = filename
+
+            processing_chain_item['process_parameters']['focus_start_samples'] = focus_start_samples
+            processing_chain_item['process_parameters']['focus_stop_samples'] = focus_stop_samples
+            processing_chain_item['process_parameters']['focus_duration_samples'] = focus_duration_samples
+
+            processing_chain_item['process_parameters']['focus_start_seconds'] = focus_start_seconds
+            processing_chain_item['process_parameters']['focus_stop_seconds'] = focus_stop_seconds
+            processing_chain_item['process_parameters']['focus_duration_seconds'] = focus_duration_seconds
+
+            processing_chain_item['process_parameters']['focus_channel'] = focus_channel
+
+            # Push chain item into processing chain stored in the container
+
+            # Create processing chain to be stored in the container, and push chain item into it
+            if hasattr(audio_container, 'processing_chain'):
+                audio_container.processing_chain.push_processor(**processing_chain_item)
+
+            else:
+                audio_container.processing_chain = ProcessingChain().push_processor(**processing_chain_item)
+
+        return audio_container
 
 
 class MonoAudioReadingProcessor(AudioReadingProcessor):
@@ -165,8 +312,9 @@ class MonoAudioReadingProcessor(AudioReadingProcessor):
     output_type = ProcessingChainItemType.AUDIO  #: Output data type
 
     def __init__(self,
-                 data=None, fs=44100,
+                 data=None, fs=None,
                  focus_start_samples=None, focus_stop_samples=None, focus_channel=None,
+                 res_type='kaiser_best', resample_cache_path=None,
                  **kwargs):
         """Constructor
 
@@ -176,7 +324,8 @@ class MonoAudioReadingProcessor(AudioReadingProcessor):
             Data to initialize the container
 
         fs : int
-            Target sampling rate when reading audio
+            Target sampling rate when reading audio, if None, audio is read at its native sampling rate.
+            Default value None
 
         focus_start_samples : int
             Sample id of the focus segment start
@@ -187,8 +336,13 @@ class MonoAudioReadingProcessor(AudioReadingProcessor):
         focus_channel : int or str
             Focus segment channel
 
-        mono : bool
-            Mixdown multi-channel audio in during the reading stage.
+        res_type : str
+            Resample type, see `dcase_util.utils.resampler_list`.
+            Default value 'kaiser_best'
+
+        resample_cache_path : str
+            Path to store resampled audio, if None, cache is not used.
+            Default value None
 
         """
 
@@ -199,7 +353,9 @@ class MonoAudioReadingProcessor(AudioReadingProcessor):
                 'focus_start_samples': focus_start_samples,
                 'focus_stop_samples': focus_stop_samples,
                 'focus_channel': focus_channel,
-                'mono': True
+                'mono': True,
+                'res_type': res_type,
+                'resample_cache_path': resample_cache_path
             }
         )
 
@@ -247,7 +403,7 @@ class AudioWritingProcessor(Processor):
         """
 
         if data and isinstance(data, AudioContainer):
-            audio_container = copy.deepcopy(data)
+            audio_container = copy_unless_in_place(data)
 
             if output_filename:
                 audio_container.save(
@@ -305,7 +461,7 @@ class MonoAudioWritingProcessor(Processor):
         """
 
         if data and isinstance(data, AudioContainer):
-            audio_container = copy.deepcopy(data)
+            audio_container = copy_unless_in_place(data)
 
             audio_container.mixdown()
 
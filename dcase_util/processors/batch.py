@@ -0,0 +1,385 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+import os
+import sys
+import copy
+import glob
+import time
+import multiprocessing
+from dcase_util.containers import ObjectContainer
+from dcase_util.processors import ProcessingChain, ProcessingChainItemType
+from dcase_util.utils import Path, is_jupyter
+
+
+# Processing chain of the current worker process, set by the pool initializer
+_worker_processing_chain = None
+
+
+def _init_batch_worker(processing_chain):
+    global _worker_processing_chain
+    _worker_processing_chain = processing_chain
+
+
+def _batch_worker(item):
+    filename, output_filename = item
+
+    start = time.time()
+    try:
+        _worker_processing_chain.process(
+            filename=filename,
+            output_filename=output_filename
+        )
+        error = None
+
+    except Exception as e:
+        error = '{type}: {message}'.format(type=e.__class__.__name__, message=e)
+
+    return {
+        'filename': filename,
+        'worker': os.getpid(),
+        'duration': time.time() - start,
+        'error': error
+    }
+
+
+class BatchFeatureExtractor(ObjectContainer):
+    """Batch feature extractor class to extract features for a list of audio files with a process pool.
+
+    Processing chain given should read the audio and extract features, either a single feature matrix
+    (e.g. MelExtractorProcessor) or a repository (RepositoryFeatureExtractorProcessor). Matching writing processor
+    (FeatureWritingProcessor or RepositoryFeatureWritingProcessor) is appended to the chain automatically.
+    Each worker process initializes the processing chain once and processes files independently.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        extractor = dcase_util.processors.BatchFeatureExtractor(
+            processing_chain=[
+                {
+                    'processor_name': 'dcase_util.processors.MonoAudioReadingProcessor',
+                    'init_parameters': {'fs': 44100}
+                },
+                {
+                    'processor_name': 'dcase_util.processors.MelExtractorProcessor',
+                    'init_parameters': {'fs': 44100}
+                }
+            ],
+            output_path='features',
+            n_jobs=8
+        )
+        extractor.extract(items=db)
+
+    """
+
+    def __init__(self, processing_chain=None, output_path=None, output_extension='cpickle',
+                 n_jobs=1, chunk_size=1, overwrite=False, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        processing_chain : ProcessingChain or list of dict
+            Processing chain to read audio and extract features.
+            Default value None
+
+        output_path : str
+            Path to store the extracted features. Feature filename is formed from audio filename by replacing the
+            extension.
+            Default value None
+
+        output_extension : str
+            Extension of the feature files, defines the storage format ('cpickle' or 'npy').
+            Default value 'cpickle'
+
+        n_jobs : int
+            Amount of worker processes. If 1, files are processed in the current process.
+            Default value 1
+
+        chunk_size : int
+            Amount of files sent to a worker process at once.
+            Default value 1
+
+        overwrite : bool
+            Overwrite existing feature files even if they are up to date.
+            Default value False
+
+        """
+
+        super(BatchFeatureExtractor, self).__init__(**kwargs)
+
+        if isinstance(processing_chain, list) and not isinstance(processing_chain, ProcessingChain):
+            processing_chain = ProcessingChain(processing_chain)
+
+        if not isinstance(processing_chain, ProcessingChain) or not len(processing_chain):
+            message = '{name}: Processing chain is required.'.format(
+                name=self.__class__.__name__
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        # Make local copy of the chain, writer is appended to it
+        self.processing_chain = copy.deepcopy(processing_chain)
+
+        if self.processing_chain[-1]['output_type'] == ProcessingChainItemType.DATA_REPOSITORY:
+            self.processing_chain.push_processor(
+                processor_name='dcase_util.processors.RepositoryFeatureWritingProcessor'
+            )
+
+        elif self.processing_chain[-1]['output_type'] == ProcessingChainItemType.DATA_CONTAINER:
+            self.processing_chain.push_processor(
+                processor_name='dcase_util.processors.FeatureWritingProcessor'
+            )
+
+        else:
+            message = '{name}: Processing chain should output data container or data repository.'.format(
+                name=self.__class__.__name__
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        self.output_path = output_path
+        self.output_extension = output_extension.lstrip('.')
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
+        self.overwrite = overwrite
+
+    def to_string(self, ui=None, indent=0):
+        """Get container information in a string
+
+        Parameters
+        ----------
+        ui : FancyStringifier or FancyHTMLStringifier
+            Stringifier class
+            Default value FancyStringifier
+
+        indent : int
+            Amount of indent
+            Default value 0
+
+        Returns
+        -------
+        str
+
+        """
+
+        if ui is None:
+            from dcase_util.ui import FancyStringifier
+            ui = FancyStringifier()
+
+        output = super(BatchFeatureExtractor, self).to_string(ui=ui, indent=indent)
+
+        output += ui.data(field='output_path', value=self.output_path, indent=indent) + '\n'
+        output += ui.data(field='output_extension', value=self.output_extension, indent=indent) + '\n'
+        output += ui.data(field='n_jobs', value=self.n_jobs, indent=indent) + '\n'
+        output += ui.data(field='chunk_size', value=self.chunk_size, indent=indent) + '\n'
+        output += ui.data(field='overwrite', value=self.overwrite, indent=indent) + '\n'
+        output += ui.line(field='Processing chain', indent=indent) + '\n'
+        output += self.processing_chain.to_string(ui=ui, indent=indent + 2)
+
+        return output
+
+    def output_filename(self, filename):
+        """Get feature filename for the audio file
+
+        Parameters
+        ----------
+        filename : str
+            Audio filename
+
+        Returns
+        -------
+        str
+
+        """
+
+        return os.path.join(
+            self.output_path,
+            os.path.splitext(os.path.basename(filename))[0] + '.' + self.output_extension
+        )
+
+    def is_up_to_date(self, filename, output_filename=None):
+        """Check whether features for the audio file exist and are newer than the audio file
+
+        Repository features split into separate containers (`[base].[label]-[stream].[extension]`) are checked too.
+
+        Parameters
+        ----------
+        filename : str
+            Audio filename
+
+        output_filename : str
+            Feature filename, if None, formed from audio filename.
+            Default value None
+
+        Returns
+        -------
+        bool
+
+        """
+
+        if output_filename is None:
+            output_filename = self.output_filename(filename=filename)
+
+        if os.path.isfile(output_filename):
+            outputs = [output_filename]
+
+        else:
+            filename_base, file_extension = os.path.splitext(output_filename)
+            outputs = glob.glob(filename_base + '.*-*' + file_extension)
+
+        if not outputs:
+            return False
+
+        if os.path.isfile(filename):
+            return min([os.path.getmtime(output) for output in outputs]) >= os.path.getmtime(filename)
+
+        return True
+
+    def extract(self, items, **kwargs):
+        """Extract features for the given audio files
+
+        Parameters
+        ----------
+        items : Dataset or list of str
+            Dataset (all audio files in it are processed) or list of audio filenames
+
+        Raises
+        ------
+        ValueError:
+            Audio files map to the same feature file
+
+        Returns
+        -------
+        dict
+            Extraction report: processed, skipped and failed files, duration, and per-worker throughput.
+
+        """
+
+        if hasattr(items, 'audio_files'):
+            items = items.audio_files
+
+        items = list(items)
+
+        # Feature filenames are formed from the audio file basename, files with same basename would overwrite
+        # each other's features
+        output_filenames = {}
+        for filename in items:
+            output_filename = self.output_filename(filename=filename)
+            if output_filename in output_filenames and output_filenames[output_filename] != filename:
+                message = '{name}: Audio files [{filename1}] and [{filename2}] map to the same feature file [{output_filename}].'.format(
+                    name=self.__class__.__name__,
+                    filename1=output_filenames[output_filename],
+                    filename2=filename,
+                    output_filename=output_filename
+                )
+                self.logger.exception(message)
+                raise ValueError(message)
+
+            output_filenames[output_filename] = filename
+
+        if self.output_path:
+            Path().makedirs(path=self.output_path)
+
+        work = []
+        skipped = []
+        for filename in items:
+            output_filename = self.output_filename(filename=filename)
+            if self.overwrite or not self.is_up_to_date(filename=filename, output_filename=output_filename):
+                work.append((filename, output_filename))
+
+            else:
+                skipped.append(filename)
+
+        if is_jupyter():
+            from tqdm import tqdm_notebook as tqdm
+        else:
+            from tqdm import tqdm
+
+        progress = tqdm(
+            total=len(work),
+            desc="{0: <25s}".format('Extract features'),
+            file=sys.stdout,
+            leave=False,
+            disable=kwargs.get('disable_progress_bar', self.disable_progress_bar),
+            ascii=kwargs.get('use_ascii_progress_bar', self.use_ascii_progress_bar)
+        )
+
+        results = []
+        start = time.time()
+        if self.n_jobs > 1 and len(work) > 1:
+            pool = multiprocessing.Pool(
+                processes=self.n_jobs,
+                initializer=_init_batch_worker,
+                initargs=(self.processing_chain,)
+            )
+            try:
+                for result in pool.imap_unordered(_batch_worker, work, chunksize=self.chunk_size):
+                    results.append(result)
+                    progress.update(1)
+
+                pool.close()
+
+            except BaseException:
+                pool.terminate()
+                raise
+
+            finally:
+                pool.join()
+
+        else:
+            _init_batch_worker(processing_chain=self.processing_chain)
+            for item in work:
+                results.append(_batch_worker(item))
+                progress.update(1)
+
+        progress.close()
+        duration = time.time() - start
+
+        workers = {}
+        for result in results:
+            if result['worker'] not in workers:
+                workers[result['worker']] = {
+                    'files': 0,
+                    'duration': 0.0
+                }
+
+            workers[result['worker']]['files'] += 1
+            workers[result['worker']]['duration'] += result['duration']
+
+        for worker in workers.values():
+            worker['files_per_second'] = worker['files'] / worker['duration'] if worker['duration'] else 0.0
+
+        report = {
+            'processed': [result['filename'] for result in results if result['error'] is None],
+            'skipped': skipped,
+            'failed': dict([(result['filename'], result['error']) for result in results if result['error']]),
+            'duration': duration,
+            'files_per_second': len(results) / duration if duration else 0.0,
+            'workers': workers
+        }
+
+        if self.log_progress:
+            self.ui.data(field='Processed', value=len(report['processed']))
+            self.ui.data(field='Skipped', value=len(report['skipped']))
+            self.ui.data(field='Failed', value=len(report['failed']))
+            self.ui.data(field='Throughput', value='{0:.2f}'.format(report['files_per_second']), unit='files/s')
+            for worker_id, worker in sorted(workers.items()):
+                self.ui.data(
+                    field='Worker [{worker}]'.format(worker=worker_id),
+                    value='{files:d} files, {files_per_second:.2f}'.format(**worker),
+                    unit='files/s',
+                    indent=4
+                )
+
+        for filename, error in sorted(report['failed'].items()):
+            self.logger.error('{name}: Feature extraction failed [{file}]: {error}'.format(
+                name=self.__class__.__name__,
+                file=filename,
+                error=error
+            ))
+
+        return report
@@ -0,0 +1,297 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import os
+import six
+import pickle
+import hashlib
+import threading
+import collections
+import numpy
+from dcase_util.utils import DiskCache, get_parameter_hash
+
+
+class ProcessingChainCache(DiskCache):
+    """Processing chain step cache
+
+    Stores output of the deterministic prefix of a processing chain, keyed by the prefix parameters and the
+    process parameters of the item. Entries are pickled, and kept either in memory or on disk. Disk entries are
+    stored in a `DiskCache`, so concurrent processes and experiments sharing the prefix can share the cache. Least
+    recently used entries are removed when the cache grows over the size limit.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        chain.enable_step_cache(path='step_cache', size_limit=10 * 1024 ** 3)
+        for epoch in range(epochs):
+            for item in items:
+                data = chain.process(**item)  # deterministic prefix is processed only in the first epoch
+
+    """
+
+    extension = '.cpickle'
+
+    def __init__(self, path=None, size_limit=None):
+        """Constructor
+
+        Parameters
+        ----------
+        path : str
+            Cache directory, if None, entries are kept in memory.
+            Default value None
+
+        size_limit : int
+            Maximum size of the cache in bytes, if None, size is not limited.
+            Default value None
+
+        """
+
+        super(ProcessingChainCache, self).__init__(path=path, size_limit=size_limit)
+
+        self._memory = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+        if path is None:
+            # Size of the memory entries
+            self._size = 0
+
+    def __contains__(self, key):
+        if self.path is None:
+            return key in self._memory
+
+        return super(ProcessingChainCache, self).__contains__(key)
+
+    def __len__(self):
+        if self.path is None:
+            return len(self._memory)
+
+        return super(ProcessingChainCache, self).__len__()
+
+    @staticmethod
+    def key(prefix, parameters):
+        """Entry key for the chain prefix and the item
+
+        Parameters
+        ----------
+        prefix : dict
+            Processing chain prefix, processor names and parameters of the steps and processing options
+
+        parameters : dict
+            Process parameters of the item. Modification time and size of the file given with `filename` are
+            included, so the entry is not used once the file changes.
+
+        Returns
+        -------
+        str or None
+            Key, None if parameters cannot be serialized into a key
+
+        """
+
+        from dcase_util import __version__
+
+        parameters = dict(parameters)
+        filename = parameters.get('filename')
+        if filename and os.path.isfile(filename):
+            stat = os.stat(filename)
+            parameters['filename'] = os.path.abspath(filename)
+            parameters['_file'] = [stat.st_mtime, stat.st_size]
+
+        try:
+            return get_parameter_hash({
+                'version': __version__,
+                'prefix': prefix,
+                'parameters': parameters
+            })
+
+        except (TypeError, ValueError):
+            # Parameters not serializable, e.g. arrays given as process parameters
+            return None
+
+    @staticmethod
+    def state(value):
+        """Serializable representation of processor state for the entry key
+
+        Arrays are replaced with their checksum, and strings pointing to existing files are extended with the
+        modification time and size of the file, so the entry is not used once the file changes.
+
+        Parameters
+        ----------
+        value : object
+            Processor, its parameters or state
+
+        Returns
+        -------
+        object
+            Value composed of dicts, lists, strings, and numbers, objects without serializable state are returned
+            as such
+
+        """
+
+        if isinstance(value, numpy.ndarray):
+            return {
+                'dtype': value.dtype.str,
+                'shape': list(value.shape),
+                'md5': hashlib.md5(numpy.ascontiguousarray(value).tobytes()).hexdigest()
+            }
+
+        elif isinstance(value, numpy.generic):
+            return value.item()
+
+        elif isinstance(value, dict):
+            return dict((str(key), ProcessingChainCache.state(item)) for key, item in value.items())
+
+        elif isinstance(value, (list, tuple)):
+            return [ProcessingChainCache.state(item) for item in value]
+
+        elif isinstance(value, six.string_types):
+            if os.path.isfile(value):
+                stat = os.stat(value)
+                return [os.path.abspath(value), stat.st_mtime, stat.st_size]
+
+            return value
+
+        elif value is None or isinstance(value, (bool, float) + six.integer_types):
+            return value
+
+        elif hasattr(value, '__getstate__'):
+            state = value.__getstate__()
+            if isinstance(state, dict):
+                state = dict(state)
+                if hasattr(value, 'init_parameters'):
+                    # Processor parameters after initialization, e.g. statistics loaded from a file
+                    state['init_parameters'] = value.init_parameters
+
+                return {
+                    'class': value.__class__.__name__,
+                    'state': ProcessingChainCache.state(state)
+                }
+
+        return value
+
+    def get(self, key):
+        """Get entry from the cache
+
+        Parameters
+        ----------
+        key : str
+            Entry key
+
+        Returns
+        -------
+        object or None
+            Data, None if not cached
+
+        """
+
+        if self.path is not None:
+            return super(ProcessingChainCache, self).get(key)
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                # Mark entry as recently used
+                self._memory.pop(key)
+                self._memory[key] = entry
+
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+
+        # Unpickled entry is a new object, and can be processed in-place
+        return pickle.loads(entry)
+
+    def set(self, key, data):
+        """Store entry into the cache
+
+        Parameters
+        ----------
+        key : str
+            Entry key
+
+        data : object
+            Data
+
+        Returns
+        -------
+        self
+
+        """
+
+        if self.path is not None:
+            return super(ProcessingChainCache, self).set(key, data)
+
+        entry = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            if key in self._memory:
+                self._size -= len(self._memory.pop(key))
+
+            self._memory[key] = entry
+            self._size += len(entry)
+
+        if self.size_limit is not None and self._size > self.size_limit:
+            self.evict()
+
+        return self
+
+    def size(self):
+        """Total size of the cached entries
+
+        Returns
+        -------
+        int
+            Size in bytes
+
+        """
+
+        if self.path is None:
+            return self._size
+
+        return super(ProcessingChainCache, self).size()
+
+    def evict(self, size_limit=None):
+        """Remove least recently used entries until the cache fits into the size limit
+
+        Cache is reduced to 90% of the limit, to avoid evicting on every write.
+
+        Parameters
+        ----------
+        size_limit : int
+            Size limit in bytes, if None, size limit of the cache is used.
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        if self.path is not None:
+            return super(ProcessingChainCache, self).evict(size_limit=size_limit)
+
+        if size_limit is None:
+            size_limit = self.size_limit
+
+        if size_limit is None:
+            return self
+
+        with self._lock:
+            target = int(size_limit * 0.9) if self._size > size_limit else size_limit
+            while self._memory and self._size > target:
+                key, entry = self._memory.popitem(last=False)
+                self._size -= len(entry)
+
+        return self
+
+    def _read(self, filename):
+        with open(filename, 'rb') as file_handle:
+            return pickle.load(file_handle)
+
+    def _write(self, file_handle, data):
+        pickle.dump(data, file_handle, protocol=pickle.HIGHEST_PROTOCOL)
@@ -14,6 +14,7 @@ class AggregationProcessor(Processor):
     """Data aggregation processor"""
     input_type = ProcessingChainItemType.DATA_CONTAINER  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, win_length_frames=10, hop_length_frames=1, recipe=None, **kwargs):
         """Constructor
@@ -102,6 +103,7 @@ class RepositoryAggregationProcessor(Processor):
     """Data aggregation processor"""
     input_type = ProcessingChainItemType.DATA_REPOSITORY  #: Input data type
     output_type = ProcessingChainItemType.DATA_REPOSITORY  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, win_length_frames=10, hop_length_frames=1, recipe=None, **kwargs):
         """Constructor
@@ -193,6 +195,7 @@ class SequencingProcessor(Processor):
     """Data sequencing processor"""
     input_type = ProcessingChainItemType.DATA_CONTAINER  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = False  #: Sequence shifting changes the output between calls
 
     def __init__(self, sequence_length=10, hop_length=None,
                  padding=None,
@@ -300,6 +303,7 @@ class RepositorySequencingProcessor(Processor):
     """Data sequencing processor"""
     input_type = ProcessingChainItemType.DATA_REPOSITORY  #: Input data type
     output_type = ProcessingChainItemType.DATA_REPOSITORY  #: Output data type
+    deterministic = False  #: Sequence shifting changes the output between calls
 
     def __init__(self, sequence_length=10, hop_length=None, padding=None, shift=0,
                  shift_border='roll', required_data_amount_per_segment=0.9, **kwargs):
@@ -408,6 +412,7 @@ class NormalizationProcessor(Processor):
     """Data normalizer to accumulate data statistics"""
     input_type = ProcessingChainItemType.DATA_CONTAINER  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, n=None, s1=None, s2=None, mean=None, std=None, normalizer=None, filename=None, **kwargs):
         """__init__ method.
@@ -531,6 +536,7 @@ class RepositoryNormalizationProcessor(Processor):
     """Data normalizer to accumulate data statistics inside repository"""
     input_type = ProcessingChainItemType.DATA_REPOSITORY
     output_type = ProcessingChainItemType.DATA_REPOSITORY
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, parameters=None, normalizers=None, filename=None, **kwargs):
         """__init__ method.
@@ -657,6 +663,7 @@ class StackingProcessor(Processor):
     """Data stacking processor"""
     input_type = ProcessingChainItemType.DATA_REPOSITORY  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, recipe=None, hop=1, **kwargs):
         """Constructor
@@ -803,6 +810,7 @@ class DataShapingProcessor(Processor):
     """Data shaping processor"""
     input_type = ProcessingChainItemType.DATA_CONTAINER  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, axis_list=None, time_axis=None, data_axis=None, sequence_axis=None, channel_axis=None, **kwargs):
         """Constructor
@@ -941,6 +949,7 @@ class RepositoryToMatrixProcessor(Processor):
     """Repository converting processor"""
     input_type = ProcessingChainItemType.DATA_REPOSITORY  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, label=None, expanded_dimension='last', **kwargs):
         """Constructor
@@ -13,6 +13,7 @@ class OneHotEncodingProcessor(Processor):
     """One hot encoding processor"""
     input_type = ProcessingChainItemType.METADATA  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, label_list=None, focus_field='scene_label', time_resolution=1.0,
                  length_frames=1, length_seconds=None, allow_unknown_labels=False,
@@ -153,6 +154,7 @@ class ManyHotEncodingProcessor(Processor):
     """Many hot encoding processor"""
     input_type = ProcessingChainItemType.METADATA  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, label_list=None, focus_field='tags', time_resolution=None,
                  length_frames=None, length_seconds=None,
@@ -296,6 +298,7 @@ class EventRollEncodingProcessor(Processor):
     """Event roll encoding processor"""
     input_type = ProcessingChainItemType.METADATA  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, label_list=None, time_resolution=None, focus_field='event_label', **kwargs):
         """Constructor
@@ -401,6 +404,7 @@ class OneHotLabelEncodingProcessor(Processor):
     """One hot label encoding processor"""
     input_type = ProcessingChainItemType.METADATA  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, label_list=None, focus_field='scene_label', time_resolution=1.0,
                  length_frames=1, length_seconds=None,
@@ -3,9 +3,8 @@
 
 from __future__ import print_function, absolute_import
 from six import iteritems
-import copy
-from dcase_util.containers import FeatureContainer, FeatureRepository
-from dcase_util.features import MelExtractor, MfccStaticExtractor, MfccDeltaExtractor, \
+from dcase_util.containers import DataMatrix2DContainer, FeatureContainer, FeatureRepository, FeatureStore
+from dcase_util.features import FeatureGraph, FeatureCache, MelExtractor, MfccStaticExtractor, MfccDeltaExtractor, \
     MfccAccelerationExtractor, ZeroCrossingRateExtractor, RMSEnergyExtractor, SpectralCentroidExtractor, \
     OpenL3Extractor, TorchOpenL3Extractor, EdgeL3Extractor
 from dcase_util.processors import Processor, ProcessingChainItemType, ProcessingChain
@@ -15,13 +14,54 @@ from dcase_util.utils import get_class_inheritors
 class FeatureReadingProcessor(Processor):
     input_type = ProcessingChainItemType.NONE  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
-    def __init__(self, *args, **kwargs):
-        """Constructor"""
+    def __init__(self, memory_map=True, store=None, *args, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        memory_map : bool
+            Open feature matrices stored in NUMPY format or in a FeatureStore as memory-mapped arrays. This way
+            only the focus segment is read from the disk. Parameter has no effect with other formats.
+            Default value True
+
+        store : str
+            Filename of the FeatureStore index. If set, features are read from the store, and filename given to
+            process method is used as item key.
+            Default value None
+
+        """
+
+        # Inject initialization parameters back to kwargs
+        kwargs.update(
+            {
+                'memory_map': memory_map,
+                'store': store
+            }
+        )
 
         # Run super init to call init of mixins too
         super(FeatureReadingProcessor, self).__init__(*args, **kwargs)
 
+    @property
+    def store(self):
+        """Feature store, opened on first access
+
+        Returns
+        -------
+        FeatureStore or None
+
+        """
+
+        if self.init_parameters.get('store') is None:
+            return None
+
+        if getattr(self, '_store', None) is None:
+            self._store = FeatureStore().load(filename=self.init_parameters.get('store'))
+
+        return self._store
+
     def process(self,
                 data=None, filename=None,
                 focus_start=None, focus_stop=None, focus_duration=None,
@@ -77,10 +117,18 @@ class FeatureReadingProcessor(Processor):
         if data is None and self.input_type == ProcessingChainItemType.NONE:
             container = FeatureContainer()
 
-            if filename:
+            if filename and self.store is not None:
+                # Get features from the store
+                container = self.store.get_container(
+                    key=filename,
+                    memory_map=self.init_parameters.get('memory_map')
+                )
+
+            elif filename:
                 # Load features from disk
                 container.load(
-                    filename=filename
+                    filename=filename,
+                    mmap_mode='c' if self.init_parameters.get('memory_map') else None
                 )
 
             if focus_start is not None and focus_duration is not None:
@@ -145,8 +193,29 @@ class FeatureWritingProcessor(Processor):
     input_type = ProcessingChainItemType.DATA_CONTAINER  #: Input data type
     output_type = ProcessingChainItemType.NONE  #: Output data type
 
-    def __init__(self, *args, **kwargs):
-        """Constructor"""
+    def __init__(self, storage_type=None, compression=None, *args, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        storage_type : str
+            Storage type of the feature matrix, 'float16', 'float32', 'float64', or 'int8' or 'uint8' for
+            quantization with per-band scale and offset.
+            Default value None
+
+        compression : str
+            Compression of the feature matrix, 'zlib' or 'lz4'.
+            Default value None
+
+        """
+
+        # Inject initialization parameters back to kwargs
+        kwargs.update(
+            {
+                'storage_type': storage_type,
+                'compression': compression
+            }
+        )
 
         # Run super init to call init of mixins too
         super(FeatureWritingProcessor, self).__init__(*args, **kwargs)
@@ -177,7 +246,17 @@ class FeatureWritingProcessor(Processor):
         """
 
         if data:
-            container = FeatureContainer(data=data)
+            if isinstance(data, DataMatrix2DContainer):
+                # Take feature matrix and timing from the input container
+                container = FeatureContainer(
+                    data=data.data,
+                    stats=data._stats,
+                    metadata=data.metadata,
+                    time_resolution=data.time_resolution
+                )
+
+            else:
+                container = FeatureContainer(data=data)
 
             if store_processing_chain:
                 container.processing_chain = data.processing_chain
@@ -185,7 +264,9 @@ class FeatureWritingProcessor(Processor):
             if output_filename:
                 # Load features from disk
                 container.save(
-                    filename=output_filename
+                    filename=output_filename,
+                    storage_type=self.init_parameters.get('storage_type'),
+                    compression=self.init_parameters.get('compression')
                 )
 
             return container
@@ -202,13 +283,54 @@ class FeatureWritingProcessor(Processor):
 class RepositoryFeatureReadingProcessor(Processor):
     input_type = ProcessingChainItemType.NONE  #: Input data type
     output_type = ProcessingChainItemType.DATA_REPOSITORY  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
-    def __init__(self, *args, **kwargs):
-        """Constructor"""
+    def __init__(self, memory_map=True, store=None, *args, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        memory_map : bool
+            Open feature matrices stored in NUMPY format or in a FeatureStore as memory-mapped arrays. Parameter
+            has no effect with other formats.
+            Default value True
+
+        store : str
+            Filename of the FeatureStore index. If set, features are read from the store, and filename given to
+            process method is used as item key.
+            Default value None
+
+        """
+
+        # Inject initialization parameters back to kwargs
+        kwargs.update(
+            {
+                'memory_map': memory_map,
+                'store': store
+            }
+        )
 
         # Run super init to call init of mixins too
         super(RepositoryFeatureReadingProcessor, self).__init__(*args, **kwargs)
 
+    @property
+    def store(self):
+        """Feature store, opened on first access
+
+        Returns
+        -------
+        FeatureStore or None
+
+        """
+
+        if self.init_parameters.get('store') is None:
+            return None
+
+        if getattr(self, '_store', None) is None:
+            self._store = FeatureStore().load(filename=self.init_parameters.get('store'))
+
+        return self._store
+
     def process(self,
                 data=None, filename=None,
                 store_processing_chain=False,
@@ -237,9 +359,17 @@ class RepositoryFeatureReadingProcessor(Processor):
 
         if data is None and self.input_type == ProcessingChainItemType.NONE:
             container = FeatureRepository()
-            if filename:
+            if filename and self.store is not None:
+                # Get features from the store
+                container = self.store.get_repository(
+                    key=filename,
+                    memory_map=self.init_parameters.get('memory_map')
+                )
+
+            elif filename:
                 container.load(
-                    filename=filename
+                    filename=filename,
+                    mmap_mode='c' if self.init_parameters.get('memory_map') else None
                 )
 
             if store_processing_chain:
@@ -267,8 +397,31 @@ class RepositoryFeatureWritingProcessor(Processor):
     input_type = ProcessingChainItemType.DATA_REPOSITORY  #: Input data type
     output_type = ProcessingChainItemType.NONE  #: Output data type
 
-    def __init__(self, *args, **kwargs):
-        """Constructor"""
+    def __init__(self, storage_type=None, compression=None, *args, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        storage_type : str
+            Storage type of the feature matrices, 'float16', 'float32', 'float64', or 'int8' or 'uint8' for
+            quantization with per-band scale and offset. Repository is saved as separate containers when
+            set.
+            Default value None
+
+        compression : str
+            Compression of the feature matrices, 'zlib' or 'lz4'. Repository is saved as separate containers
+            when set.
+            Default value None
+
+        """
+
+        # Inject initialization parameters back to kwargs
+        kwargs.update(
+            {
+                'storage_type': storage_type,
+                'compression': compression
+            }
+        )
 
         # Run super init to call init of mixins too
         super(RepositoryFeatureWritingProcessor, self).__init__(*args, **kwargs)
@@ -306,8 +459,14 @@ class RepositoryFeatureWritingProcessor(Processor):
 
             if output_filename:
                 # Load features from disk
+                storage_type = self.init_parameters.get('storage_type')
+                compression = self.init_parameters.get('compression')
+
                 repository.save(
-                    filename=output_filename
+                    filename=output_filename,
+                    split_into_containers=storage_type is not None or compression is not None,
+                    storage_type=storage_type,
+                    compression=compression
                 )
 
             return repository
@@ -324,13 +483,46 @@ class RepositoryFeatureWritingProcessor(Processor):
 class FeatureExtractorProcessor(Processor):
     input_type = ProcessingChainItemType.AUDIO  #: Input data type
     output_type = ProcessingChainItemType.DATA_CONTAINER  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, *args, **kwargs):
-        """Constructor"""
+        """Constructor
+
+        Parameters
+        ----------
+        feature_cache_path : str
+            Path to the feature cache shared between experiments, if None, cache is not used. Given as keyword
+            argument to the extractor processors.
+            Default value None
+
+        feature_cache_size : int
+            Maximum size of the feature cache in bytes, if None, size is not limited.
+            Default value None
+
+        """
 
         # Run super init to call init of mixins too
         super(FeatureExtractorProcessor, self).__init__(*args, **kwargs)
 
+    def get_feature_cache(self):
+        """Get feature cache
+
+        Returns
+        -------
+        FeatureCache or None
+
+        """
+
+        if getattr(self, '_feature_cache', None) is None:
+            init_parameters = getattr(self, 'init_parameters', {})
+            if init_parameters.get('feature_cache_path'):
+                self._feature_cache = FeatureCache(
+                    path=init_parameters.get('feature_cache_path'),
+                    size_limit=init_parameters.get('feature_cache_size')
+                )
+
+        return getattr(self, '_feature_cache', None)
+
     def process(self, data=None, store_processing_chain=False, **kwargs):
         """Extract features
 
@@ -378,8 +570,19 @@ class FeatureExtractorProcessor(Processor):
             else:
                 processing_chain = None
 
+            feature_cache = self.get_feature_cache()
+            if feature_cache is not None:
+                key = feature_cache.key(data=data, extractor=self)
+                features = feature_cache.get(key)
+                if features is None:
+                    features = self.extract(y=data.get_focused())
+                    feature_cache.set(key, features)
+
+            else:
+                features = self.extract(y=data.get_focused())
+
             return FeatureContainer(
-                data=self.extract(y=data.get_focused()),
+                data=features,
                 time_resolution=self.hop_length_seconds,
                 processing_chain=processing_chain
             )
@@ -392,12 +595,55 @@ class FeatureExtractorProcessor(Processor):
             self.logger.exception(message)
             raise ValueError(message)
 
+    def process_batch(self, items, store_processing_chain=False):
+        """Extract features for multiple audio items with batched extraction (see `extract_batch`)
+
+        Items are extracted one by one when processing chain is stored, feature cache is used, or audio is not
+        single channel.
+
+        Parameters
+        ----------
+        items : list of dict
+            Parameters for process method for each item, data included
+
+        store_processing_chain : bool
+            Store processing chain to data container returned
+            Default value False
+
+        Returns
+        -------
+        list of FeatureContainer
+
+        """
+
+        from dcase_util.containers import FeatureContainer, AudioContainer
+
+        signals = []
+        for item in items:
+            if isinstance(item.get('data'), AudioContainer):
+                signals.append(item['data'].get_focused())
+
+        if store_processing_chain or self.get_feature_cache() is not None or len(signals) != len(items) or \
+                any([y.ndim != 1 for y in signals]):
+            return super(FeatureExtractorProcessor, self).process_batch(
+                items=items,
+                store_processing_chain=store_processing_chain
+            )
+
+        return [
+            FeatureContainer(
+                data=features,
+                time_resolution=self.hop_length_seconds
+            ) for features in self.extract_batch(signals=signals)
+        ]
+
 
 class RepositoryFeatureExtractorProcessor(Processor):
     input_type = ProcessingChainItemType.AUDIO  #: Input data type
     output_type = ProcessingChainItemType.DATA_REPOSITORY  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
-    def __init__(self, parameters=None, **kwargs):
+    def __init__(self, parameters=None, feature_cache_path=None, feature_cache_size=None, **kwargs):
         """Constructor
 
         Parameters
@@ -405,6 +651,14 @@ class RepositoryFeatureExtractorProcessor(Processor):
         parameters : dict
             Extraction parameters, extractor label as key and parameters as value.
 
+        feature_cache_path : str
+            Path to the feature cache shared between experiments, if None, cache is not used.
+            Default value None
+
+        feature_cache_size : int
+            Maximum size of the feature cache in bytes, if None, size is not limited.
+            Default value None
+
         """
 
         if parameters is None:
@@ -412,7 +666,9 @@ class RepositoryFeatureExtractorProcessor(Processor):
 
         kwargs.update(
             {
-                'parameters': parameters
+                'parameters': parameters,
+                'feature_cache_path': feature_cache_path,
+                'feature_cache_size': feature_cache_size
             }
         )
 
@@ -420,23 +676,167 @@ class RepositoryFeatureExtractorProcessor(Processor):
         super(RepositoryFeatureExtractorProcessor, self).__init__(**kwargs)
 
         self.parameters = kwargs.get('parameters', {})
+        self.feature_cache_path = feature_cache_path
+        self.feature_cache_size = feature_cache_size
+        self.feature_cache = None
 
         self.label_to_class = {}
         for processor in get_class_inheritors(FeatureExtractorProcessor):
             self.label_to_class[processor.label] = processor
 
+        # Extractors, initialized on first use
+        self.processors = {}
+
     def __getstate__(self):
         return {
-            'parameters': self.parameters
+            'parameters': self.parameters,
+            'feature_cache_path': self.feature_cache_path,
+            'feature_cache_size': self.feature_cache_size
         }
 
     def __setstate__(self, d):
         self.parameters = d['parameters']
+        self.feature_cache_path = d.get('feature_cache_path')
+        self.feature_cache_size = d.get('feature_cache_size')
+        self.feature_cache = None
 
         self.label_to_class = {}
         for processor in get_class_inheritors(FeatureExtractorProcessor):
             self.label_to_class[processor.label] = processor
 
+        self.processors = {}
+
+    def get_processor(self, label):
+        """Get feature extractor processor for the label
+
+        Parameters
+        ----------
+        label : str
+            Extractor label
+
+        Raises
+        ------
+        AssertionError:
+            Unknown label
+
+        Returns
+        -------
+        FeatureExtractorProcessor
+
+        """
+
+        if label not in self.processors:
+            if label in self.label_to_class:
+                self.processors[label] = self.label_to_class[label](**self.parameters[label])
+
+            else:
+                message = '{name}: Unknown label [{label}], no corresponding class found.'.format(
+                    name=self.__class__.__name__,
+                    label=label)
+
+                self.logger.exception(message)
+                raise AssertionError(message)
+
+        return self.processors[label]
+
+    def get_processors(self, labels=None):
+        """Get feature extractor processors
+
+        Parameters
+        ----------
+        labels : list of str
+            Extractor labels, if None, all labels are used.
+            Default value None
+
+        Returns
+        -------
+        dict
+            Feature extractor processors, label as key
+
+        """
+
+        if labels is None:
+            labels = list(self.parameters.keys())
+
+        return dict((label, self.get_processor(label=label)) for label in labels)
+
+    def get_feature_cache(self):
+        """Get feature cache
+
+        Returns
+        -------
+        FeatureCache or None
+
+        """
+
+        if self.feature_cache is None and self.feature_cache_path:
+            self.feature_cache = FeatureCache(
+                path=self.feature_cache_path,
+                size_limit=self.feature_cache_size
+            )
+
+        return self.feature_cache
+
+    def extract(self, y, labels=None):
+        """Extract all features for the audio signal
+
+        Features are extracted through a feature graph, intermediate results (spectrogram, mel band energies, MFCC)
+        are calculated only once for extractors sharing the same parameters.
+
+        Parameters
+        ----------
+        y : numpy.ndarray [shape=(n,)]
+            Audio signal
+
+        labels : list of str
+            Extractor labels, if None, all features are extracted.
+            Default value None
+
+        Returns
+        -------
+        dict
+            Features, extractor label as key
+
+        """
+
+        return FeatureGraph(y=y).extract(
+            extractors=self.get_processors(labels=labels)
+        )
+
+    def extract_batch(self, signals, labels=None):
+        """Extract all features for multiple equal-length audio signals, e.g. channels of a recording
+
+        Spectrograms for all signals are calculated with one vectorized FFT, intermediate results are calculated
+        only once for extractors sharing the same parameters, and features are extracted for all signals at once.
+        Memory usage grows with the amount of signals.
+
+        Parameters
+        ----------
+        signals : list of numpy.ndarray [shape=(n,)] or numpy.ndarray [shape=(b, n)]
+            Audio signals, all with the same length
+
+        labels : list of str
+            Extractor labels, if None, all features are extracted.
+            Default value None
+
+        Returns
+        -------
+        list of dict
+            Features for each signal, extractor label as key
+
+        """
+
+        extracted = FeatureGraph(signals=signals).extract(
+            extractors=self.get_processors(labels=labels)
+        )
+
+        features = [{} for signal in signals]
+        for label in extracted:
+            for signal_id, signal_features in enumerate(features):
+                signal_features[label] = extracted[label][signal_id]
+
+        return features
+
     def process(self, data=None, store_processing_chain=False, **kwargs):
         """Extract features
 
@@ -491,66 +891,85 @@ class RepositoryFeatureExtractorProcessor(Processor):
                 processing_chain=processing_chain
             )
 
-            # Make local copy of data
-            current_data = copy.deepcopy(data)
+            feature_cache = self.get_feature_cache()
+            audio_key = None
 
+            # Get focus segment for each stream
             if data.streams == 1:
-                # We have single channel audio input
-                for label, parameters in iteritems(self.parameters):
-                    if label in self.label_to_class:
-                        # Get processor
-                        processor = self.label_to_class[label](**parameters)
-
-                        # Reset processing chain
-                        current_data.processing_chain = ProcessingChain()
+                focused_data = data.get_focused()
+                stream_ids = [None]
 
-                        # Extract features
-                        extracted = processor.process(data=current_data)
+                if feature_cache is not None:
+                    audio_key = feature_cache.audio_key(data=data)
 
-                        repository.set_container(
-                            container=extracted,
-                            label=label
+            else:
+                focus_channel = data.focus_channel
+                try:
+                    # Get focus segment for all channels
+                    data.focus_channel = None
+                    focused_data = data.get_focused()
+
+                    if feature_cache is not None:
+                        audio_key = feature_cache.audio_key(data=data)
+
+                finally:
+                    data.focus_channel = focus_channel
+
+                stream_ids = list(range(0, len(focused_data)))
+
+            features = dict((stream_id, {}) for stream_id in stream_ids)
+
+            # Get cached features, features missing for any of the streams are extracted
+            labels = list(self.parameters.keys())
+            cache_keys = {}
+            if feature_cache is not None:
+                missing = []
+                for label in labels:
+                    cached = {}
+                    for stream_id in stream_ids:
+                        cache_keys[(label, stream_id)] = feature_cache.key(
+                            data=None,
+                            extractor=self.get_processor(label=label),
+                            stream_id=stream_id,
+                            audio_key=audio_key
                         )
+                        cached[stream_id] = feature_cache.get(cache_keys[(label, stream_id)])
 
-                    else:
-                        message = '{name}: Unknown label [{label}], no corresponding class found.'.format(
-                            name=self.__class__.__name__,
-                            label=label)
-
-                        self.logger.exception(message)
-                        raise AssertionError(message)
-
-            elif data.streams > 1:
-                # We have multi-channel audio input
-                for stream_id in range(0, data.streams):
-                    for label, parameters in iteritems(self.parameters):
-                        if label in self.label_to_class:
-                            # Get processor
-                            processor = self.label_to_class[label](**parameters)
+                    if any(stream_features is None for stream_features in cached.values()):
+                        missing.append(label)
 
-                            # Reset processing chain
-                            current_data.processing_chain = ProcessingChain()
-
-                            # Set focus to the current stream
-                            current_data.focus_channel = stream_id
-
-                            # Extract features
-                            extracted = processor.process(data=current_data)
+                    else:
+                        for stream_id, stream_features in iteritems(cached):
+                            features[stream_id][label] = stream_features
 
-                            # Add extracted features to the repository
-                            repository.set_container(
-                                container=extracted,
-                                label=label,
-                                stream_id=stream_id
-                            )
+                labels = missing
 
-                        else:
-                            message = '{name}: Unknown label [{label}], no corresponding class found.'.format(
-                                name=self.__class__.__name__,
-                                label=label)
+            if labels:
+                if stream_ids == [None]:
+                    extracted_features = {None: self.extract(y=focused_data, labels=labels)}
 
-                            self.logger.exception(message)
-                            raise AssertionError(message)
+                else:
+                    # Extract all channels at once
+                    extracted_features = dict(enumerate(self.extract_batch(signals=focused_data, labels=labels)))
+
+                for stream_id, stream_features in iteritems(extracted_features):
+                    features[stream_id].update(stream_features)
+
+                    if feature_cache is not None:
+                        for label, stream_label_features in iteritems(stream_features):
+                            feature_cache.set(cache_keys[(label, stream_id)], stream_label_features)
+
+            for stream_id, stream_features in iteritems(features):
+                for label, extracted in iteritems(stream_features):
+                    # Add extracted features to the repository
+                    repository.set_container(
+                        container=FeatureContainer(
+                            data=extracted,
+                            time_resolution=self.get_processor(label=label).hop_length_seconds
+                        ),
+                        label=label,
+                        stream_id=stream_id
+                    )
 
             return repository
 
@@ -1054,7 +1473,7 @@ class OpenL3ExtractorProcessor(FeatureExtractorProcessor, OpenL3Extractor):
                  hop_length_samples=None, hop_length_seconds=0.02,
                  model=None, input_repr='mel256', content_type="music",
                  embedding_size=6144,
-                 center=True, batch_size=32, verbose=False,
+                 center=True, batch_size=32, n_threads=None, verbose=False,
                  **kwargs):
         """Constructor
 
@@ -1097,6 +1516,10 @@ class OpenL3ExtractorProcessor(FeatureExtractorProcessor, OpenL3Extractor):
             Batch size used for input to embedding model
             Default value 32
 
+        n_threads : int
+            Amount of CPU threads used for inference, if None, framework default is used.
+            Default value None
+
         verbose : bool
             If True, prints verbose messages.
             Default value False
@@ -1113,6 +1536,7 @@ class OpenL3ExtractorProcessor(FeatureExtractorProcessor, OpenL3Extractor):
             'embedding_size': embedding_size,
             'center': center,
             'batch_size': batch_size,
+            'n_threads': n_threads,
             'verbose': verbose,
         })
 
@@ -1132,7 +1556,7 @@ class TorchOpenL3ExtractorProcessor(FeatureExtractorProcessor, TorchOpenL3Extrac
                  hop_length_samples=None, hop_length_seconds=0.02,
                  model=None, input_repr='mel256', content_type="music",
                  embedding_size=6144,
-                 center=True, batch_size=32, verbose=False,
+                 center=True, batch_size=32, n_threads=None, verbose=False,
                  **kwargs):
         """Constructor
 
@@ -1175,6 +1599,10 @@ class TorchOpenL3ExtractorProcessor(FeatureExtractorProcessor, TorchOpenL3Extrac
             Batch size used for input to embedding model
             Default value 32
 
+        n_threads : int
+            Amount of CPU threads used for inference, if None, framework default is used.
+            Default value None
+
         verbose : bool
             If True, prints verbose messages.
             Default value False
@@ -1191,6 +1619,7 @@ class TorchOpenL3ExtractorProcessor(FeatureExtractorProcessor, TorchOpenL3Extrac
             'embedding_size': embedding_size,
             'center': center,
             'batch_size': batch_size,
+            'n_threads': n_threads,
             'verbose': verbose,
         })
 
@@ -1209,14 +1638,16 @@ class EdgeL3ExtractorProcessor(FeatureExtractorProcessor, EdgeL3Extractor):
                  fs=44100,
                  hop_length_samples=None, hop_length_seconds=0.02,
                  model=None, retrain_type='ft', sparsity=95.45,
-                 center=True, verbose=False,
+                 center=True, batch_size=32, n_threads=None, verbose=False,
                  **kwargs):
         """Constructor
 
         Parameters
         ----------
         fs : int
-            Sampling rate of the incoming signal.
+            Sampling rate of the incoming signal. If not 48kHz, audio is resampled to 48kHz before extraction,
+            once per batch with `process_batch`.
+            Default value 44100
 
         hop_length_samples : int
             Hop length in samples.
@@ -1243,6 +1674,14 @@ class EdgeL3ExtractorProcessor(FeatureExtractorProcessor, EdgeL3Extractor):
             If True, pads beginning of signal so timestamps correspond to center of window.
             Default value True
 
+        batch_size : int
+            Batch size used for input to embedding model in `extract_batch`
+            Default value 32
+
+        n_threads : int
+            Amount of CPU threads used for inference, if None, framework default is used.
+            Default value None
+
         verbose : bool
             If True, prints verbose messages.
             Default value False
@@ -1257,6 +1696,8 @@ class EdgeL3ExtractorProcessor(FeatureExtractorProcessor, EdgeL3Extractor):
             'retrain_type': retrain_type,
             'sparsity': sparsity,
             'center': center,
+            'batch_size': batch_size,
+            'n_threads': n_threads,
             'verbose': verbose,
         })
 
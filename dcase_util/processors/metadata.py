@@ -10,6 +10,7 @@ from dcase_util.processors import Processor, ProcessingChainItemType
 class MetadataReadingProcessor(Processor):
     input_type = ProcessingChainItemType.NONE  #: Input data type
     output_type = ProcessingChainItemType.METADATA  #: Output data type
+    deterministic = True  #: Output depends only on the input and parameters
 
     def __init__(self, *args, **kwargs):
         """Constructor"""
@@ -2,10 +2,65 @@
 # -*- coding: utf-8 -*-
 
 from __future__ import print_function, absolute_import
+import sys
+import copy
+import time
 import importlib
+import threading
+import collections
+import numpy
 from dcase_util.containers import DictContainer, ListDictContainer
 from dcase_util.ui import FancyLogger, FancyStringifier
-from dcase_util.utils import FileFormat
+from dcase_util.utils import FileFormat, DtypePolicy, InPlace, copy_statistics, reset_copy_statistics, compute_dtype
+from dcase_util.processors.profiler import _profile_step_start, _profile_step_stop
+from dcase_util.processors.cache import ProcessingChainCache
+
+
+# Processing chain of the current map worker, set by the pool initializer
+_map_worker = threading.local()
+
+
+def _init_map_worker(processing_chain, copy_chain=False):
+    if copy_chain:
+        # Threads share the memory, each worker thread gets its own processor instances
+        processing_chain = copy.deepcopy(processing_chain)
+
+    _map_worker.processing_chain = processing_chain
+
+
+def _map_chunk(chunk, process_parameters, processing_chain=None):
+    if processing_chain is None:
+        processing_chain = _map_worker.processing_chain
+
+    try:
+        # Process chunk as a batch
+        outputs = processing_chain.process_batch(
+            items=[item for index, item in chunk],
+            **process_parameters
+        )
+
+        return [(index, output, None) for (index, item), output in zip(chunk, outputs)]
+
+    except Exception:
+        if len(chunk) == 1:
+            return [(chunk[0][0], None, _map_error())]
+
+    # Process items one by one to find the failing ones
+    results = []
+    for index, item in chunk:
+        try:
+            results.append((index, processing_chain.process_batch(items=[item], **process_parameters)[0], None))
+
+        except Exception:
+            results.append((index, None, _map_error()))
+
+    return results
+
+
+def _map_error():
+    error_type, error, traceback = sys.exc_info()
+
+    return '{type}: {message}'.format(type=error_type.__name__, message=error)
 
 
 class ProcessingChainItemType(object):
@@ -34,6 +89,10 @@ class ProcessingChainItem(DictContainer):
         super(ProcessingChainItem, self).__setstate__(d)
         self.init_processor_class()
 
+    def __reduce__(self):
+        # Item content is needed to initialize the processor class, reconstruct the item through constructor
+        return self.__class__, (dict(self),)
+
     def init_processor_class(self):
         """Initialize processor class
 
@@ -51,9 +110,9 @@ class ProcessingChainItem(DictContainer):
                     processor_name = 'dcase_util.processors.' + processor_name
 
                 processor_module = importlib.import_module('.'.join(processor_name.split('.')[:-1]))
-                self.processor_class = eval('processor_module.' + processor_name.split('.')[-1])(**processor_init_parameters)
+                processor_class = getattr(processor_module, processor_name.split('.')[-1])
 
-            except NameError:
+            except AttributeError:
                 message = '{name}: Processor class was not found [{processor_name}]'.format(
                     name=self.__class__.__name__,
                     processor_name=processor_name
@@ -62,6 +121,8 @@ class ProcessingChainItem(DictContainer):
                 self.logger.exception(message)
                 raise ValueError(message)
 
+            self.processor_class = processor_class(**processor_init_parameters)
+
         return self
 
 
@@ -98,6 +159,9 @@ class ProcessingChain(ListDictContainer):
 
         super(ProcessingChain, self).__init__(*args, **kwargs)
 
+        # Cache for the output of the deterministic prefix, see enable_step_cache
+        self.step_cache = None
+
         # Make sure items are ProcessingChainItems and that their parameters are valid.
         if len(self):
             for item_id, item in enumerate(self):
@@ -134,6 +198,19 @@ class ProcessingChain(ListDictContainer):
                     # Store processing chain item
                     self[item_id] = ProcessingChainItem(item)
 
+    def __getstate__(self):
+        d = super(ProcessingChain, self).__getstate__()
+        d.update({
+            'step_cache': getattr(self, 'step_cache', None)
+        })
+
+        return d
+
+    def __setstate__(self, d):
+        super(ProcessingChain, self).__setstate__(d)
+
+        self.step_cache = d.get('step_cache')
+
     def chain_string(self):
         """Basic info about the items in the chain.
 
@@ -295,7 +372,7 @@ class ProcessingChain(ListDictContainer):
 
     def push_processor(self, processor_name,
                        init_parameters=None, process_parameters=None, preprocessing_callbacks=None,
-                       input_type=None, output_type=None):
+                       input_type=None, output_type=None, deterministic=None):
         """Push processor item to the chain, if item already exists in the processing chain update only parameters.
         Processor name is considered unique in the processing chain.
 
@@ -323,6 +400,11 @@ class ProcessingChain(ListDictContainer):
             Output data type of the processor
             Default value None
 
+        deterministic : bool
+            Output of the processor depends only on its input and parameters, see `enable_step_cache`. If None,
+            `deterministic` attribute of the processor class is used.
+            Default value None
+
         Returns
         -------
         self
@@ -359,6 +441,9 @@ class ProcessingChain(ListDictContainer):
                 'output_type': output_type,
             })
 
+            if deterministic is not None:
+                item['deterministic'] = deterministic
+
             # Check item
             self._check_item(item=item)
 
@@ -386,6 +471,9 @@ class ProcessingChain(ListDictContainer):
             if output_type:
                 item['output_type'] = output_type
 
+            if deterministic is not None:
+                item['deterministic'] = deterministic
+
             # Check item
             self._check_item(item=item)
 
@@ -399,6 +487,11 @@ class ProcessingChain(ListDictContainer):
         processor_name : str
             processor name
 
+        Raises
+        ------
+        ValueError:
+            Processor class was not found
+
         Returns
         -------
         class reference
@@ -411,9 +504,9 @@ class ProcessingChain(ListDictContainer):
 
             processor_module = importlib.import_module('.'.join(processor_name.split('.')[:-1]))
 
-            return eval('processor_module.' + processor_name.split('.')[-1])
+            return getattr(processor_module, processor_name.split('.')[-1])
 
-        except NameError:
+        except AttributeError:
             message = '{name}: Processor class was not found [{processor_name}]'.format(
                 name=self.__class__.__name__,
                 processor_name=processor_name
@@ -430,31 +523,91 @@ class ProcessingChain(ListDictContainer):
         processor_name : str
             processor name
 
+        Raises
+        ------
+        ValueError:
+            Processor class was not found
+
         Returns
         -------
         class
 
         """
 
-        try:
-            # Get module
-            if len(processor_name.split('.')) == 1:
-                processor_name = 'dcase_util.processors.' + processor_name
+        return self.processor_class_reference(processor_name=processor_name)(**kwargs)
 
-            processor_module = importlib.import_module('.'.join(processor_name.split('.')[:-1]))
+    def enable_step_cache(self, path=None, size_limit=None):
+        """Cache output of the deterministic prefix of the chain
 
-            return eval('processor_module.' + processor_name.split('.')[-1])(**kwargs)
+        Steps from the beginning of the chain up to the first non-deterministic step (e.g. random augmentation,
+        sequencer with shifting, or writing processor) form the deterministic prefix. Its output is cached for each
+        item, keyed by the process parameters of the item and parameters of the prefix, and later calls with the
+        same item continue from the cached output. Processors are non-deterministic unless their `deterministic`
+        class attribute is set, built-in readers, feature extractors, normalizers, aggregators, and encoders are
+        deterministic. Parameters and state of the instantiated processors are part of the key, e.g. statistics
+        loaded from a file, as is the modification time of files given as parameters. Processors whose state changes
+        between calls are not deterministic. Items are identified by their parameters, data given directly to the
+        chain is not cached. Disk cache can be shared by experiments using the same prefix.
 
-        except NameError:
-            message = '{name}: Processor class was not found [{processor_name}]'.format(
-                name=self.__class__.__name__,
-                processor_name=processor_name
-            )
+        Parameters
+        ----------
+        path : str
+            Cache directory, if None, cache is kept in memory.
+            Default value None
 
-            self.logger.exception(message)
-            raise ValueError(message)
+        size_limit : int
+            Maximum size of the cache in bytes, if None, size is not limited.
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        self.step_cache = ProcessingChainCache(path=path, size_limit=size_limit)
+
+        return self
 
-    def process(self, data=None, store_processing_chain=False, **kwargs):
+    def disable_step_cache(self):
+        """Stop caching output of the deterministic prefix of the chain
+
+        Returns
+        -------
+        self
+
+        """
+
+        self.step_cache = None
+
+        return self
+
+    def deterministic_prefix_length(self):
+        """Amount of deterministic steps in the beginning of the chain
+
+        Step is deterministic if it is marked deterministic in the chain item or in the processor class, and it
+        has no pre-processing callbacks.
+
+        Returns
+        -------
+        int
+
+        """
+
+        length = 0
+        for step in self:
+            deterministic = step.get('deterministic')
+            if deterministic is None:
+                deterministic = getattr(step.processor_class, 'deterministic', False)
+
+            if not deterministic or step.get('preprocessing_callbacks'):
+                break
+
+            length += 1
+
+        return length
+
+    def process(self, data=None, store_processing_chain=False, dtype=None, in_place=False, **kwargs):
         """Process the data with processing chain
 
         Parameters
@@ -466,6 +619,17 @@ class ProcessingChain(ListDictContainer):
             Store processing chain to data container returned
             Default value False
 
+        dtype : str or numpy.dtype
+            Compute data type used while processing, see `dcase_util.utils.DtypePolicy`. If None, current
+            policy is used.
+            Default value None
+
+        in_place : bool
+            Process intermediate data in-place, see `dcase_util.utils.InPlace`. Processors skip the protective
+            copy of their input once the data is owned by the chain, i.e. it does not share containers or arrays
+            with the input data. Input data is never modified by the in-place processing.
+            Default value False
+
         Returns
         -------
         data : DataContainer
@@ -473,9 +637,51 @@ class ProcessingChain(ListDictContainer):
 
         """
 
+        if dtype is None:
+            return self._process(
+                data=data,
+                store_processing_chain=store_processing_chain,
+                in_place=in_place,
+                **kwargs
+            )
+
+        with DtypePolicy(compute=dtype):
+            return self._process(
+                data=data,
+                store_processing_chain=store_processing_chain,
+                in_place=in_place,
+                **kwargs
+            )
+
+    def _process(self, data=None, store_processing_chain=False, in_place=False, **kwargs):
+        input_data = data
+
+        # Data read by the chain itself is owned by the chain from the start
+        owned = in_place and data is None
+
+        # Continue from the cached output of the deterministic prefix if available
+        prefix_length = self._step_cache_prefix_length()
+        cache_key = self._step_cache_key(
+            prefix_length=prefix_length,
+            data=data,
+            store_processing_chain=store_processing_chain,
+            parameters=kwargs
+        )
+
+        start = 0
+        if cache_key is not None:
+            cached = self.step_cache.get(cache_key)
+            if cached is not None:
+                data = cached
+                start = prefix_length
+                owned = in_place
+
         for step_id, step in enumerate(self):
             # Loop through steps in the processing chain
 
+            if step_id < start:
+                continue
+
             if isinstance(step, ProcessingChainItem):
 
                 if step_id == 0 and data is None:
@@ -503,20 +709,498 @@ class ProcessingChain(ListDictContainer):
                     # Call process method of the processor if it exists
 
                     # Get process parameters from step
-                    process_parameters = step.get('process_parameters', {})
+                    process_parameters = dict(step.get('process_parameters', {}))
 
                     # Update parameters with current parameters given
                     process_parameters.update(kwargs)
 
                     # Do actual processing
-                    data = step.processor_class.process(
-                        data=data,
+                    measurement = _profile_step_start()
+                    with InPlace(enabled=owned):
+                        data = step.processor_class.process(
+                            data=data,
+                            store_processing_chain=store_processing_chain,
+                            **process_parameters
+                        )
+
+                    _profile_step_stop(measurement, label=self._step_label(step_id, step), data=data)
+
+                    if in_place and not owned:
+                        owned = not self._shares_data(data, input_data)
+
+                if cache_key is not None and step_id == prefix_length - 1:
+                    self.step_cache.set(cache_key, data)
+
+        return data
+
+    def process_batch(self, items, store_processing_chain=False, dtype=None, in_place=False):
+        """Process multiple data items with processing chain
+
+        Items are passed through the chain step by step. Audio reading processors read the files of the step with
+        a thread pool, and feature extractor processors project the spectrograms of the step to mel scale with one
+        call (see `extract_batch`). Other processors, e.g. normalization, sequencing, stacking, and encoders,
+        process items one by one.
+
+        Parameters
+        ----------
+        items : list of dict
+            Parameters for process method for each item, e.g. {'filename': 'audio.wav'} or {'data': container}.
+
+        store_processing_chain : bool
+            Store processing chain to data container returned
+            Default value False
+
+        dtype : str or numpy.dtype
+            Compute data type used while processing, see `dcase_util.utils.DtypePolicy`. If None, current
+            policy is used.
+            Default value None
+
+        in_place : bool
+            Process intermediate data in-place, see `process`.
+            Default value False
+
+        Returns
+        -------
+        list
+            Processed data for each item
+
+        """
+
+        if dtype is None:
+            return self._process_batch(
+                items=items,
+                store_processing_chain=store_processing_chain,
+                in_place=in_place
+            )
+
+        with DtypePolicy(compute=dtype):
+            return self._process_batch(
+                items=items,
+                store_processing_chain=store_processing_chain,
+                in_place=in_place
+            )
+
+    def _process_batch(self, items, store_processing_chain=False, in_place=False):
+        items = [dict(item) for item in items]
+        data = [item.pop('data', None) for item in items]
+        input_data = list(data)
+
+        # Data read by the chain itself is owned by the chain from the start
+        owned = [in_place and item_data is None for item_data in data]
+
+        prefix_length = self._step_cache_prefix_length()
+        if prefix_length:
+            # Process deterministic prefix only for the items missing from the step cache
+            keys = [
+                self._step_cache_key(
+                    prefix_length=prefix_length,
+                    data=item_data,
+                    store_processing_chain=store_processing_chain,
+                    parameters=item
+                ) for item, item_data in zip(items, data)
+            ]
+
+            missing = []
+            for item_id, key in enumerate(keys):
+                cached = self.step_cache.get(key) if key is not None else None
+                if cached is not None:
+                    data[item_id] = cached
+                    owned[item_id] = in_place
+
+                else:
+                    missing.append(item_id)
+
+            if missing:
+                missing_data = [data[item_id] for item_id in missing]
+                missing_owned = [owned[item_id] for item_id in missing]
+                for step_id in range(prefix_length):
+                    missing_data, missing_owned = self._process_batch_step(
+                        step_id=step_id,
+                        items=[items[item_id] for item_id in missing],
+                        data=missing_data,
+                        owned=missing_owned,
+                        input_data=[input_data[item_id] for item_id in missing],
                         store_processing_chain=store_processing_chain,
-                        **process_parameters
+                        in_place=in_place
                     )
 
+                for item_id, item_data, item_owned in zip(missing, missing_data, missing_owned):
+                    data[item_id] = item_data
+                    owned[item_id] = item_owned
+                    if keys[item_id] is not None:
+                        self.step_cache.set(keys[item_id], item_data)
+
+        for step_id in range(prefix_length, len(self)):
+            # Loop through steps in the processing chain
+            data, owned = self._process_batch_step(
+                step_id=step_id,
+                items=items,
+                data=data,
+                owned=owned,
+                input_data=input_data,
+                store_processing_chain=store_processing_chain,
+                in_place=in_place
+            )
+
         return data
 
+    def _process_batch_step(self, step_id, items, data, owned, input_data, store_processing_chain=False,
+                            in_place=False):
+        # Process items with one step of the chain
+        step = self[step_id]
+        data = list(data)
+
+        if not isinstance(step, ProcessingChainItem):
+            return data, owned
+
+        if step_id == 0:
+            # Inject data for the first item in the chain
+            for item_id, item in enumerate(items):
+                if data[item_id] is None:
+                    if step.processor_class.input_type == ProcessingChainItemType.DATA_CONTAINER:
+                        from dcase_util.containers import DataMatrix2DContainer
+                        data[item_id] = DataMatrix2DContainer(**item).load()
+
+                    elif step.processor_class.input_type == ProcessingChainItemType.DATA_REPOSITORY:
+                        from dcase_util.containers import DataRepository
+                        data[item_id] = DataRepository(**item).load()
+
+        if 'preprocessing_callbacks' in step and isinstance(step['preprocessing_callbacks'], list):
+            # Handle pre-processing callbacks assigned to current processor
+
+            for method in step['preprocessing_callbacks']:
+                if isinstance(method, dict):
+                    method_name = method.get('method_name')
+                    method_parameters = method.get('parameters')
+                    if hasattr(step.processor_class, method_name):
+                        getattr(step.processor_class, method_name)(**method_parameters)
+
+        if hasattr(step.processor_class, 'process'):
+            # Call process method of the processor if it exists
+            batch = []
+            for item, item_data in zip(items, data):
+                # Get process parameters from step, and update with parameters of the item
+                process_parameters = dict(step.get('process_parameters', {}))
+                process_parameters.update(item)
+                process_parameters['data'] = item_data
+                batch.append(process_parameters)
+
+            # Do actual processing
+            measurement = _profile_step_start()
+            with InPlace(enabled=all(owned)):
+                if hasattr(step.processor_class, 'process_batch'):
+                    data = list(
+                        step.processor_class.process_batch(
+                            items=batch,
+                            store_processing_chain=store_processing_chain
+                        )
+                    )
+
+                else:
+                    data = [
+                        step.processor_class.process(
+                            store_processing_chain=store_processing_chain,
+                            **process_parameters
+                        ) for process_parameters in batch
+                    ]
+
+            _profile_step_stop(
+                measurement,
+                label=self._step_label(step_id, step),
+                data=data,
+                items=len(data)
+            )
+
+            if in_place:
+                owned = [
+                    item_owned or not self._shares_data(item_data, item_input_data)
+                    for item_owned, item_data, item_input_data in zip(owned, data, input_data)
+                ]
+
+        return data, owned
+
+    def map(self, items, workers=None, backend='process', chunk_size=1, max_in_flight=None,
+            store_processing_chain=False, dtype=None, in_place=False):
+        """Process items in parallel workers
+
+        Processing chain is sent to each worker once, and processors stay alive in the workers between the items.
+        Items are processed in chunks with `process_batch`, and results are yielded in the item order. Failing
+        items do not stop the processing, error is logged and None is yielded in place of the result.
+
+        Parameters
+        ----------
+        items : list of dict
+            Parameters for process method for each item, e.g. {'filename': 'audio.wav'} or {'data': container}.
+
+        workers : int
+            Amount of workers, if None, amount of CPUs is used. With one worker, items are processed in the
+            current process.
+            Default value None
+
+        backend : str
+            Worker type, 'process' or 'thread'. Use threads when processors release GIL (e.g. audio decoding
+            and numpy operations) or when data is expensive to transfer between processes.
+            Default value 'process'
+
+        chunk_size : int
+            Amount of items processed together in a worker. If processing of a chunk fails, all its items are
+            processed again one by one to find the failing ones, items processed successfully in the first pass
+            are processed twice. With chunks larger than one, the chain has to be safe to re-run for the same
+            item, e.g. writing processors write their files again.
+            Default value 1
+
+        max_in_flight : int
+            Maximum amount of chunks submitted but not yet yielded, if None two times workers is used.
+            Default value None
+
+        store_processing_chain : bool
+            Store processing chain to data container returned
+            Default value False
+
+        dtype : str or numpy.dtype
+            Compute data type used while processing, see `process`. Data type is given to each worker, policy of
+            the current thread is not changed. If None, global policy is used in the workers.
+            Default value None
+
+        in_place : bool
+            Process intermediate data in-place, see `process`.
+            Default value False
+
+        Raises
+        ------
+        ValueError:
+            Unknown backend
+
+        Returns
+        -------
+        generator
+            Processed data for each item, None for failed items
+
+        """
+
+        if backend not in ['process', 'thread']:
+            message = '{name}: Unknown backend [{backend}], valid backends [process, thread].'.format(
+                name=self.__class__.__name__,
+                backend=backend
+            )
+            self.logger.exception(message)
+            raise ValueError(message)
+
+        if workers is None:
+            import multiprocessing
+            workers = multiprocessing.cpu_count()
+
+        workers = max(workers, 1)
+        chunk_size = max(chunk_size, 1)
+
+        if max_in_flight is None:
+            max_in_flight = 2 * workers
+
+        max_in_flight = max(max_in_flight, 1)
+
+        items = list(enumerate(items))
+        chunks = [items[chunk_start:chunk_start + chunk_size] for chunk_start in range(0, len(items), chunk_size)]
+
+        process_parameters = {
+            'store_processing_chain': store_processing_chain,
+            'dtype': dtype,
+            'in_place': in_place
+        }
+
+        if workers == 1 or len(chunks) < 2:
+            for chunk in chunks:
+                for result in self._map_results(
+                        _map_chunk(chunk=chunk, process_parameters=process_parameters, processing_chain=self)):
+                    yield result
+
+            return
+
+        if backend == 'process':
+            import multiprocessing
+            pool = multiprocessing.Pool(
+                processes=workers,
+                initializer=_init_map_worker,
+                initargs=(self,)
+            )
+
+        else:
+            from multiprocessing.pool import ThreadPool
+            pool = ThreadPool(
+                processes=workers,
+                initializer=_init_map_worker,
+                initargs=(self, True)
+            )
+
+        pending = collections.deque()
+        try:
+            next_chunk = 0
+            while next_chunk < len(chunks) or pending:
+                # Keep the in-flight queue full
+                while next_chunk < len(chunks) and len(pending) < max_in_flight:
+                    pending.append(
+                        pool.apply_async(_map_chunk, (chunks[next_chunk], process_parameters))
+                    )
+                    next_chunk += 1
+
+                for result in self._map_results(pending.popleft().get()):
+                    yield result
+
+        finally:
+            pool.terminate()
+            pool.join()
+
+    def _map_results(self, results):
+        for index, output, error in results:
+            if error is not None:
+                self.logger.error('{name}: Processing failed [item {index}]: {error}'.format(
+                    name=self.__class__.__name__,
+                    index=index,
+                    error=error
+                ))
+
+            yield output
+
+    def _step_cache_prefix_length(self):
+        # Length of the cached prefix, zero if step cache is not used
+        if getattr(self, 'step_cache', None) is None:
+            return 0
+
+        return self.deterministic_prefix_length()
+
+    def _step_cache_key(self, prefix_length, data, store_processing_chain, parameters):
+        # Step cache key for the item, None if the item is not cached
+        if not prefix_length or data is not None:
+            return None
+
+        dtype = compute_dtype()
+
+        return self.step_cache.key(
+            prefix={
+                'steps': [
+                    {
+                        'processor_name': step['processor_name'],
+                        'init_parameters': ProcessingChainCache.state(step.get('init_parameters', {})),
+                        'process_parameters': ProcessingChainCache.state(step.get('process_parameters', {})),
+                        'processor': ProcessingChainCache.state(step.processor_class)
+                    } for step in self[:prefix_length]
+                ],
+                'store_processing_chain': store_processing_chain,
+                'dtype': dtype.name if dtype is not None else None
+            },
+            parameters=parameters
+        )
+
+    @staticmethod
+    def _step_label(step_id, step):
+        # Label identifying the step in profiler reports
+        return '{step_id}:{processor}'.format(
+            step_id=step_id,
+            processor=step.processor_class.__class__.__name__
+        )
+
+    @staticmethod
+    def _data_items(data):
+        # Data object, and containers and arrays reachable from it
+        from dcase_util.containers import RepositoryContainer
+
+        items = [data]
+        if isinstance(data, RepositoryContainer):
+            for label in data:
+                for stream_id in data[label]:
+                    items += ProcessingChain._data_items(data[label][stream_id])
+
+        elif not isinstance(data, numpy.ndarray) and isinstance(getattr(data, 'data', None), numpy.ndarray):
+            items.append(data.data)
+
+        return items
+
+    @staticmethod
+    def _shares_data(data, other):
+        # Data shares a container or array memory with other data
+        if data is None or other is None:
+            return False
+
+        items = ProcessingChain._data_items(data)
+        other_items = ProcessingChain._data_items(other)
+
+        other_ids = set([id(item) for item in other_items])
+        if any([id(item) in other_ids for item in items]):
+            return True
+
+        other_arrays = [item for item in other_items if isinstance(item, numpy.ndarray)]
+        for item in items:
+            if isinstance(item, numpy.ndarray):
+                for other_array in other_arrays:
+                    if numpy.may_share_memory(item, other_array):
+                        return True
+
+        return False
+
+    def benchmark_in_place(self, data=None, repetitions=3, **kwargs):
+        """Benchmark processing with and without in-place mode
+
+        Processing time is the fastest of the repetitions. Copies and copied bytes count the protective copies
+        made by the processors for one item, and peak memory is the largest amount of memory allocated at once
+        while processing one item, measured with tracemalloc in a separate run.
+
+        Parameters
+        ----------
+        data : DataContainer
+            Data
+
+        repetitions : int
+            Amount of repetitions
+            Default value 3
+
+        kwargs
+            Parameters passed to process method
+
+        Returns
+        -------
+        DictContainer
+            Mode ('copy' or 'in_place') as key, and dict with time_sec, copies, copied_bytes, and peak_memory_bytes
+            as value
+
+        """
+
+        import tracemalloc
+
+        results = DictContainer()
+        for in_place in [False, True]:
+            durations = []
+            for repetition in range(repetitions):
+                reset_copy_statistics()
+                start = time.time()
+                self.process(data=data, in_place=in_place, **kwargs)
+                durations.append(time.time() - start)
+
+            statistics = dict(copy_statistics())
+
+            tracing = tracemalloc.is_tracing()
+            if not tracing:
+                tracemalloc.start()
+
+            try:
+                baseline = tracemalloc.get_traced_memory()[0]
+                if hasattr(tracemalloc, 'reset_peak'):
+                    tracemalloc.reset_peak()
+
+                self.process(data=data, in_place=in_place, **kwargs)
+                peak = tracemalloc.get_traced_memory()[1] - baseline
+
+            finally:
+                if not tracing:
+                    tracemalloc.stop()
+
+            results['in_place' if in_place else 'copy'] = {
+                'time_sec': min(durations),
+                'copies': statistics['copies'],
+                'copied_bytes': statistics['bytes'],
+                'peak_memory_bytes': peak
+            }
+
+        return results
+
     def call_method(self, method_name, parameters=None):
         """Call class method in the processing chain items
 
@@ -10,6 +10,8 @@ from dcase_util.processors import ProcessingChainItem
 
 class Processor(ObjectContainer):
     """Data processing chain unit mixin"""
+    deterministic = False  #: Output depends only on the input and parameters, processors opt in to the step cache
+
     def __init__(self, *args, **kwargs):
 
         self.init_parameters = kwargs
@@ -68,6 +70,30 @@ class Processor(ObjectContainer):
 
         return data
 
+    def process_batch(self, items, store_processing_chain=False):
+        """Process multiple data items
+
+        Processors able to process a stacked batch with one call override this method, by default items are
+        processed one by one with process method.
+
+        Parameters
+        ----------
+        items : list of dict
+            Parameters for process method for each item, data included
+
+        store_processing_chain : bool
+            Store processing chain to data container returned
+            Default value False
+
+        Returns
+        -------
+        list
+            Processed data for each item
+
+        """
+
+        return [self.process(store_processing_chain=store_processing_chain, **item) for item in items]
+
     def get_processing_chain_item(self):
         """Get processing chain item with current Processor data.
 
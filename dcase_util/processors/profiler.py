@@ -0,0 +1,452 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+import os
+import json
+import time
+import timeit
+import threading
+import collections
+import numpy
+from dcase_util.containers import ObjectContainer, DictContainer
+from dcase_util.ui import FancyStringifier
+
+if hasattr(time, 'thread_time'):
+    _cpu_time = time.thread_time
+
+elif hasattr(time, 'process_time'):
+    _cpu_time = time.process_time
+
+else:
+    _cpu_time = time.clock
+
+# Profilers currently collecting measurements, shared by all threads
+_active_profilers = []
+_active_profilers_lock = threading.Lock()
+
+
+def _profile_step_start():
+    # Start measuring a processing step, None if no profiler is active
+    if not _active_profilers:
+        return None
+
+    memory = None
+    if any([profiler.memory for profiler in _active_profilers]):
+        import tracemalloc
+        if tracemalloc.is_tracing():
+            memory = tracemalloc.get_traced_memory()[0]
+            if hasattr(tracemalloc, 'reset_peak'):
+                tracemalloc.reset_peak()
+
+    return timeit.default_timer(), _cpu_time(), memory
+
+
+def _profile_step_stop(measurement, label, data, items=1):
+    # Stop measuring a processing step and record it into active profilers
+    if measurement is None:
+        return
+
+    start, cpu_start, memory = measurement
+    wall = timeit.default_timer() - start
+    cpu = _cpu_time() - cpu_start
+
+    peak = None
+    if memory is not None:
+        import tracemalloc
+        peak = max(tracemalloc.get_traced_memory()[1] - memory, 0)
+
+    for profiler in list(_active_profilers):
+        profiler.record(label=label, start=start, wall=wall, cpu=cpu, peak=peak, data=data, items=items)
+
+
+class ProcessingChainProfiler(ObjectContainer):
+    """Processing chain profiler
+
+    While the profiler is active, each step of every processing chain records wall time, CPU time, peak memory
+    allocation (optional), and shape, data type and size of its output. Measurements are aggregated per step
+    into a report, which can be shown as a table, or saved as JSON or as Chrome trace events (open in
+    chrome://tracing or Perfetto).
+
+    Steps processed in other threads are recorded too, steps processed in worker processes
+    (`ProcessingChain.map` with process backend) are not.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        with dcase_util.processors.ProcessingChainProfiler() as profiler:
+            for item in items:
+                chain.process(**item)
+
+        profiler.show()
+        profiler.save_chrome_trace('trace.json')
+
+    """
+
+    def __init__(self, memory=False, max_events=100000, **kwargs):
+        """Constructor
+
+        Parameters
+        ----------
+        memory : bool
+            Measure peak memory allocation of the steps with tracemalloc. Tracing slows down the processing
+            considerably.
+            Default value False
+
+        max_events : int
+            Maximum amount of trace events stored, later steps are aggregated but not stored as events.
+            Default value 100000
+
+        """
+
+        kwargs.update({
+            'memory': memory,
+            'max_events': max_events
+        })
+
+        super(ProcessingChainProfiler, self).__init__(**kwargs)
+
+        self.memory = memory
+        self.max_events = max_events
+
+        self.steps = collections.OrderedDict()
+        self.events = []
+
+        self._lock = threading.Lock()
+        self._start_time = timeit.default_timer()
+        self._tracemalloc_started = False
+
+    def __getstate__(self):
+        return {
+            'memory': self.memory,
+            'max_events': self.max_events,
+            'steps': self.steps,
+            'events': self.events
+        }
+
+    def __setstate__(self, d):
+        self.__init__(memory=d['memory'], max_events=d['max_events'])
+        self.steps = d['steps']
+        self.events = d['events']
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """Start collecting measurements
+
+        Returns
+        -------
+        self
+
+        """
+
+        if self.memory:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc_started = True
+
+        with _active_profilers_lock:
+            if self not in _active_profilers:
+                _active_profilers.append(self)
+
+        return self
+
+    def stop(self):
+        """Stop collecting measurements
+
+        Returns
+        -------
+        self
+
+        """
+
+        with _active_profilers_lock:
+            if self in _active_profilers:
+                _active_profilers.remove(self)
+
+        if self._tracemalloc_started:
+            import tracemalloc
+            tracemalloc.stop()
+            self._tracemalloc_started = False
+
+        return self
+
+    def reset(self):
+        """Remove collected measurements
+
+        Returns
+        -------
+        self
+
+        """
+
+        with self._lock:
+            self.steps = collections.OrderedDict()
+            self.events = []
+            self._start_time = timeit.default_timer()
+
+        return self
+
+    def record(self, label, start, wall, cpu, peak=None, data=None, items=1):
+        """Record measurement of a processing step
+
+        Parameters
+        ----------
+        label : str
+            Step label
+
+        start : float
+            Start time of the step (timeit.default_timer)
+
+        wall : float
+            Wall time in seconds
+
+        cpu : float
+            CPU time of the thread in seconds
+
+        peak : int
+            Peak memory allocation in bytes
+            Default value None
+
+        data :
+            Output of the step
+            Default value None
+
+        items : int
+            Amount of items processed in the step
+            Default value 1
+
+        Returns
+        -------
+        self
+
+        """
+
+        shape, dtype, size = self._describe(data)
+
+        with self._lock:
+            if label not in self.steps:
+                self.steps[label] = {
+                    'wall': [],
+                    'cpu': [],
+                    'peak': [],
+                    'bytes': [],
+                    'items': 0,
+                    'shape': None,
+                    'dtype': None
+                }
+
+            step = self.steps[label]
+            step['wall'].append(wall)
+            step['cpu'].append(cpu)
+            step['bytes'].append(size)
+            step['items'] += items
+            step['shape'] = shape
+            step['dtype'] = dtype
+
+            if peak is not None:
+                step['peak'].append(peak)
+
+            if len(self.events) < self.max_events:
+                self.events.append({
+                    'name': label,
+                    'cat': 'processing_chain',
+                    'ph': 'X',
+                    'ts': (start - self._start_time) * 1e6,
+                    'dur': wall * 1e6,
+                    'pid': os.getpid(),
+                    'tid': threading.current_thread().ident,
+                    'args': {
+                        'cpu_ms': cpu * 1e3,
+                        'peak_bytes': peak,
+                        'shape': shape,
+                        'dtype': dtype,
+                        'bytes': size,
+                        'items': items
+                    }
+                })
+
+        return self
+
+    @staticmethod
+    def _describe(data):
+        # Shape, data type and size of the step output
+        from dcase_util.containers import RepositoryContainer
+
+        if isinstance(data, list):
+            described = [ProcessingChainProfiler._describe(item) for item in data]
+            if not described:
+                return None, None, 0
+
+            return described[0][0], described[0][1], sum([item[2] for item in described])
+
+        if isinstance(data, RepositoryContainer):
+            size = 0
+            for label in data:
+                for stream_id in data[label]:
+                    size += ProcessingChainProfiler._describe(data[label][stream_id])[2]
+
+            return None, None, size
+
+        if not isinstance(data, numpy.ndarray):
+            data = getattr(data, 'data', None)
+
+        if isinstance(data, numpy.ndarray):
+            return list(data.shape), data.dtype.name, int(data.nbytes)
+
+        return None, None, 0
+
+    def report(self):
+        """Aggregated measurements per step
+
+        Times are in seconds, peak memory and output size in bytes.
+
+        Returns
+        -------
+        DictContainer
+            Step label as key, and dict with calls, items, wall_total, wall_mean, wall_p50, wall_p99, cpu_mean,
+            cpu_p50, cpu_p99, peak_mean, peak_max, bytes_mean, shape, and dtype as value
+
+        """
+
+        report = DictContainer()
+        with self._lock:
+            for label, step in self.steps.items():
+                wall = numpy.array(step['wall'])
+                cpu = numpy.array(step['cpu'])
+
+                report[label] = {
+                    'calls': len(wall),
+                    'items': step['items'],
+                    'wall_total': float(numpy.sum(wall)),
+                    'wall_mean': float(numpy.mean(wall)),
+                    'wall_p50': float(numpy.percentile(wall, 50)),
+                    'wall_p99': float(numpy.percentile(wall, 99)),
+                    'cpu_mean': float(numpy.mean(cpu)),
+                    'cpu_p50': float(numpy.percentile(cpu, 50)),
+                    'cpu_p99': float(numpy.percentile(cpu, 99)),
+                    'peak_mean': float(numpy.mean(step['peak'])) if step['peak'] else None,
+                    'peak_max': int(numpy.max(step['peak'])) if step['peak'] else None,
+                    'bytes_mean': float(numpy.mean(step['bytes'])),
+                    'shape': step['shape'],
+                    'dtype': step['dtype']
+                }
+
+        return report
+
+    def to_string(self, ui=None, indent=0):
+        """Get profiler report in a string
+
+        Parameters
+        ----------
+        ui : FancyStringifier or FancyHTMLStringifier
+            Stringifier class
+            Default value FancyStringifier
+
+        indent : int
+            Amount of indent
+            Default value 0
+
+        Returns
+        -------
+        str
+
+        """
+
+        if ui is None:
+            ui = FancyStringifier()
+
+        report = self.report()
+        total = sum([step['wall_total'] for step in report.values()])
+
+        output = ''
+        output += ui.class_name(self.__class__.__name__, indent=indent) + '\n'
+
+        if not report:
+            output += ui.data(field='Steps', value='No measurements', indent=indent + 2) + '\n'
+            return output
+
+        steps = list(report.values())
+        output += ui.table(
+            cell_data=[
+                list(report.keys()),
+                [step['calls'] for step in steps],
+                [step['wall_mean'] * 1e3 for step in steps],
+                [step['wall_p50'] * 1e3 for step in steps],
+                [step['wall_p99'] * 1e3 for step in steps],
+                [step['cpu_mean'] * 1e3 for step in steps],
+                [step['peak_mean'] / 1024.0 ** 2 if step['peak_mean'] is not None else None for step in steps],
+                [
+                    '{shape} {dtype}'.format(shape=step['shape'], dtype=step['dtype'])
+                    if step['shape'] is not None else '-' for step in steps
+                ],
+                [step['wall_total'] / total * 100.0 if total else 0.0 for step in steps]
+            ],
+            column_headers=['Step', 'Calls', 'Mean ms', 'p50 ms', 'p99 ms', 'CPU ms', 'Peak MB', 'Output', 'Time %'],
+            column_types=['str35', 'int', 'float2', 'float2', 'float2', 'float2', 'float2', 'str25', 'float1'],
+            column_separators=[0, 1, 5, 6, 7],
+            indent=indent + 2
+        )
+
+        return output
+
+    def to_chrome_trace(self):
+        """Measurements as Chrome trace events
+
+        Returns
+        -------
+        dict
+
+        """
+
+        with self._lock:
+            return {
+                'traceEvents': list(self.events),
+                'displayTimeUnit': 'ms'
+            }
+
+    def save_json(self, filename):
+        """Save aggregated report as JSON
+
+        Parameters
+        ----------
+        filename : str
+            Filename
+
+        Returns
+        -------
+        self
+
+        """
+
+        with open(filename, 'w') as file_handle:
+            json.dump(dict(self.report()), file_handle, indent=2)
+
+        return self
+
+    def save_chrome_trace(self, filename):
+        """Save measurements as Chrome trace events
+
+        Parameters
+        ----------
+        filename : str
+            Filename
+
+        Returns
+        -------
+        self
+
+        """
+
+        with open(filename, 'w') as file_handle:
+            json.dump(self.to_chrome_trace(), file_handle)
+
+        return self
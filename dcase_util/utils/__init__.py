@@ -24,6 +24,137 @@ General functions
     is_float
     is_jupyter
 
+Resampling
+::::::::::
+
+*dcase_util.utils.* *
+
+Resampling functions with selectable backends. Resample type is selected with ``res_type`` parameter in
+``AudioContainer.load``, ``AudioContainer.resample``, and ``AudioReadingProcessor``. Registered types are
+Librosa resamplers (``kaiser_best``, ``kaiser_fast``, ``fft``, ``scipy``), polyphase filtering
+(``polyphase``, ``scipy.signal.resample_poly``), and soxr quality tiers (``soxr_vhq``, ``soxr_hq``, ``soxr_mq``,
+``soxr_lq``, ``soxr_qq``). Use ``benchmark_resamplers`` to compare speed and quality of them.
+
+.. autosummary::
+    :toctree: generated/
+
+    resample
+    resampler_list
+    register_resampler
+    benchmark_resamplers
+
+Data type policy
+::::::::::::::::
+
+*dcase_util.utils.* *
+
+Data type policy for floating point data. Compute data type (float32 or float64) is used by audio reading,
+feature extractors, data manipulators, and encoders. Storage data type (float16, float32 or float64) is used when
+data containers and feature stores are saved. Policy can be set globally with ``set_dtype_policy``, temporarily
+for the current thread with ``DtypePolicy`` context manager, or for a processing chain with ``dtype`` parameter of
+``ProcessingChain.process``.
+
+.. autosummary::
+    :toctree: generated/
+
+    set_dtype_policy
+    get_dtype_policy
+    compute_dtype
+    storage_dtype
+    to_compute_dtype
+    to_storage_dtype
+    from_storage_dtype
+    is_memory_mapped
+    DtypePolicy
+
+Storage encoding
+::::::::::::::::
+
+*dcase_util.utils.* *
+
+Encoding of data arrays for storage: quantization into 8-bit integers with per-band scale and offset, and
+compression with zlib or lz4.
+
+.. autosummary::
+    :toctree: generated/
+
+    quantize
+    dequantize
+    encode_array
+    decode_array
+
+In-place processing
+:::::::::::::::::::
+
+*dcase_util.utils.* *
+
+In-place processing mode, used by ``ProcessingChain.process`` with ``in_place`` parameter. Inside the mode, data
+manipulators and encoders skip the protective copy of their input.
+
+.. autosummary::
+    :toctree: generated/
+
+    InPlace
+    in_place_enabled
+    copy_unless_in_place
+    copy_statistics
+    reset_copy_statistics
+
+AudioInfoCache
+--------------
+
+*dcase_util.utils.AudioInfoCache*
+
+Audio file information cache keyed by path, and validated with modification time and size of the file.
+``get_audio_info`` and ``get_media_duration`` use the process-wide instance ``dcase_util.utils.audio_info_cache``.
+
+.. autosummary::
+    :toctree: generated/
+
+    AudioInfoCache
+    AudioInfoCache.get
+    AudioInfoCache.media_duration
+    AudioInfoCache.prefetch
+    AudioInfoCache.load
+    AudioInfoCache.save
+    AudioInfoCache.clear
+
+IntervalIndex
+-------------
+
+*dcase_util.utils.IntervalIndex*
+
+Sorted interval index answering overlap queries in logarithmic time, used by ``AudioContainer.segments`` to avoid
+skip segments.
+
+.. autosummary::
+    :toctree: generated/
+
+    IntervalIndex
+    IntervalIndex.from_items
+    IntervalIndex.first_overlap
+    IntervalIndex.overlapping
+
+DiskCache
+---------
+
+*dcase_util.utils.DiskCache*
+
+Base class for disk caches storing one file per entry, with atomic writes, size limit, and least recently used
+eviction. Used by ``dcase_util.features.FeatureCache`` and ``dcase_util.processors.ProcessingChainCache``.
+
+.. autosummary::
+    :toctree: generated/
+
+    DiskCache
+    DiskCache.filename
+    DiskCache.get
+    DiskCache.set
+    DiskCache.entries
+    DiskCache.size
+    DiskCache.evict
+    DiskCache.clear
+
 SuppressStdoutAndStderr
 -----------------------
 
@@ -55,6 +186,7 @@ Files
     argument_file_exists
     filelist_exists
     posix_path
+    replace_file
 
 Path
 ----
@@ -211,5 +343,10 @@ from .logging import *
 from .validators import *
 from .files import *
 from .examples import *
+from .resampling import *
+from .dtype import *
+from .storage import *
+from .ownership import *
+from .cache import *
 
 __all__ = [_ for _ in dir() if not _.startswith('_')]
@@ -0,0 +1,272 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import os
+import uuid
+import logging
+from .files import Path, replace_file
+
+
+class DiskCache(object):
+    """Disk cache with least recently used eviction
+
+    Base class for caches storing one file per entry under the cache directory. Entries are written to a temporary
+    file first and moved in place, so concurrent processes can share the cache. Access time of the entry is updated
+    when it is read, and least recently used entries are removed when the cache grows over the size limit.
+
+    Subclasses define the entry file extension, the key scheme, and the serialization with `_read` and `_write`.
+
+    """
+
+    extension = None  #: Entry file extension
+
+    def __init__(self, path, size_limit=None):
+        """Constructor
+
+        Parameters
+        ----------
+        path : str
+            Cache directory
+
+        size_limit : int
+            Maximum size of the cache in bytes, if None, size is not limited.
+            Default value None
+
+        """
+
+        self.path = path
+        self.size_limit = size_limit
+
+        self.hits = 0
+        self.misses = 0
+
+        # Estimated size of the cache, updated when entries are written
+        self._size = None
+
+    def __getstate__(self):
+        return {
+            'path': self.path,
+            'size_limit': self.size_limit
+        }
+
+    def __setstate__(self, d):
+        self.__init__(**d)
+
+    def __contains__(self, key):
+        return os.path.isfile(self.filename(key))
+
+    def __len__(self):
+        return len(self.entries())
+
+    @property
+    def logger(self):
+        """Logger instance"""
+
+        return logging.getLogger(__name__)
+
+    def filename(self, key):
+        """Entry filename
+
+        Parameters
+        ----------
+        key : str
+            Entry key
+
+        Returns
+        -------
+        str
+
+        """
+
+        return os.path.join(self.path, key[:2], key + self.extension)
+
+    def get(self, key):
+        """Get entry from the cache
+
+        Parameters
+        ----------
+        key : str
+            Entry key
+
+        Returns
+        -------
+        object or None
+            Data, None if not cached
+
+        """
+
+        filename = self.filename(key)
+        try:
+            data = self._read(filename)
+
+        except (IOError, OSError, ValueError):
+            # Missing, or removed by other process
+            self.misses += 1
+            return None
+
+        try:
+            # Mark entry as recently used
+            os.utime(filename, None)
+
+        except OSError:
+            pass
+
+        self.hits += 1
+        return data
+
+    def set(self, key, data):
+        """Store entry into the cache
+
+        Parameters
+        ----------
+        key : str
+            Entry key
+
+        data : object
+            Data
+
+        Returns
+        -------
+        self
+
+        """
+
+        filename = self.filename(key)
+        Path().makedirs(path=os.path.dirname(filename))
+
+        tmp_filename = filename + '.' + uuid.uuid4().hex + '.tmp'
+        try:
+            with open(tmp_filename, 'wb') as file_handle:
+                self._write(file_handle, data)
+
+            replace_file(source=tmp_filename, destination=filename)
+
+        finally:
+            if os.path.isfile(tmp_filename):
+                os.remove(tmp_filename)
+
+        if self.size_limit is not None:
+            if self._size is None:
+                self._size = self.size()
+
+            else:
+                self._size += os.path.getsize(filename)
+
+            if self._size > self.size_limit:
+                self.evict()
+
+        return self
+
+    def entries(self):
+        """Cached entries
+
+        Returns
+        -------
+        list of tuple
+            Filename, size and last access time for each entry
+
+        """
+
+        entries = []
+        if self.path is None or not os.path.isdir(self.path):
+            return entries
+
+        for dir_path, dir_names, files in os.walk(self.path):
+            for name in files:
+                if name.endswith(self.extension):
+                    filename = os.path.join(dir_path, name)
+                    try:
+                        stat = os.stat(filename)
+
+                    except OSError:
+                        continue
+
+                    entries.append((filename, stat.st_size, stat.st_mtime))
+
+        return entries
+
+    def size(self):
+        """Total size of the cached entries
+
+        Returns
+        -------
+        int
+            Size in bytes
+
+        """
+
+        return sum([size for filename, size, access_time in self.entries()])
+
+    def evict(self, size_limit=None):
+        """Remove least recently used entries until the cache fits into the size limit
+
+        Cache is reduced to 90% of the limit, to avoid evicting on every write.
+
+        Parameters
+        ----------
+        size_limit : int
+            Size limit in bytes, if None, size limit of the cache is used.
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        if size_limit is None:
+            size_limit = self.size_limit
+
+        if size_limit is None:
+            return self
+
+        entries = sorted(self.entries(), key=lambda entry: entry[2])
+        size = sum([entry[1] for entry in entries])
+        target = int(size_limit * 0.9) if size > size_limit else size_limit
+
+        for filename, entry_size, access_time in entries:
+            if size <= target:
+                break
+
+            try:
+                os.remove(filename)
+
+            except OSError:
+                # Already removed by other process
+                pass
+
+            size -= entry_size
+
+        self._size = size
+
+        return self
+
+    def clear(self):
+        """Remove all entries and reset the counters
+
+        Returns
+        -------
+        self
+
+        """
+
+        self.evict(size_limit=0)
+
+        self.hits = 0
+        self.misses = 0
+
+        return self
+
+    def _read(self, filename):
+        # Read entry data from the file
+        message = '{name}: Entry reading not implemented.'.format(name=self.__class__.__name__)
+        self.logger.exception(message)
+        raise NotImplementedError(message)
+
+    def _write(self, file_handle, data):
+        # Write entry data into the open file
+        message = '{name}: Entry writing not implemented.'.format(name=self.__class__.__name__)
+        self.logger.exception(message)
+        raise NotImplementedError(message)
@@ -0,0 +1,295 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import mmap
+import logging
+import threading
+import numpy
+
+#: Valid data types for computation
+COMPUTE_DTYPES = ['float32', 'float64']
+
+#: Valid data types for storage
+STORAGE_DTYPES = ['float16', 'float32', 'float64']
+
+_dtype_policy = {
+    'compute': None,
+    'storage': None
+}
+
+# Policy set with DtypePolicy is kept per thread, so that threads processing in parallel cannot modify each
+# others policy. Global policy is used in threads without one.
+_dtype_override = threading.local()
+
+
+def _current_policy():
+    policy = getattr(_dtype_override, 'policy', None)
+    if policy is not None:
+        return policy
+
+    return _dtype_policy
+
+
+def _validate_dtype(dtype, valid_dtypes, field):
+    if dtype is None:
+        return None
+
+    dtype = numpy.dtype(dtype)
+    if dtype.name not in valid_dtypes:
+        message = '{name}: Invalid {field} data type [{dtype}], valid types {valid}.'.format(
+            name=__name__,
+            field=field,
+            dtype=dtype.name,
+            valid=valid_dtypes
+        )
+        logging.getLogger(__name__).exception(message)
+        raise ValueError(message)
+
+    return dtype
+
+
+def set_dtype_policy(compute=None, storage=None):
+    """Set global data type policy
+
+    Audio reading, feature extractors, data manipulators (Normalizer, Aggregator, Sequencer), and encoders produce
+    floating point data in the compute data type. Data containers and feature stores are saved in the storage
+    data type. If data type is None, components use their own default data type (mostly float64).
+
+    Parameters
+    ----------
+    compute : str or numpy.dtype
+        Data type for computation, 'float32' or 'float64'.
+        Default value None
+
+    storage : str or numpy.dtype
+        Data type for storing data into files, 'float16', 'float32', or 'float64'.
+        Default value None
+
+    Raises
+    ------
+    ValueError:
+        Invalid data type
+
+    Returns
+    -------
+    nothing
+
+    """
+
+    _dtype_policy['compute'] = _validate_dtype(dtype=compute, valid_dtypes=COMPUTE_DTYPES, field='compute')
+    _dtype_policy['storage'] = _validate_dtype(dtype=storage, valid_dtypes=STORAGE_DTYPES, field='storage')
+
+
+def get_dtype_policy():
+    """Get data type policy
+
+    Policy set with `DtypePolicy` in the current thread, or the global policy.
+
+    Returns
+    -------
+    dict
+        Dict with compute and storage data types
+
+    """
+
+    return dict(_current_policy())
+
+
+def compute_dtype(default=None):
+    """Data type for computation
+
+    Parameters
+    ----------
+    default : str or numpy.dtype
+        Data type used when policy does not define one.
+        Default value None
+
+    Returns
+    -------
+    numpy.dtype
+
+    """
+
+    dtype = _current_policy()['compute']
+    if dtype is not None:
+        return dtype
+
+    if default is not None:
+        return numpy.dtype(default)
+
+    return None
+
+
+def storage_dtype(default=None):
+    """Data type for storage
+
+    Parameters
+    ----------
+    default : str or numpy.dtype
+        Data type used when policy does not define one.
+        Default value None
+
+    Returns
+    -------
+    numpy.dtype
+
+    """
+
+    dtype = _current_policy()['storage']
+    if dtype is not None:
+        return dtype
+
+    if default is not None:
+        return numpy.dtype(default)
+
+    return None
+
+
+def to_compute_dtype(data):
+    """Convert floating point data into compute data type
+
+    Data is returned as such if the policy does not define compute data type, or data is not a floating point
+    numpy array.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Data
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    dtype = _current_policy()['compute']
+    if dtype is not None and isinstance(data, numpy.ndarray) and numpy.issubdtype(data.dtype, numpy.floating):
+        return data.astype(dtype, copy=False)
+
+    return data
+
+
+def to_storage_dtype(data):
+    """Convert floating point data into storage data type
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Data
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    dtype = _current_policy()['storage']
+    if dtype is not None and isinstance(data, numpy.ndarray) and numpy.issubdtype(data.dtype, numpy.floating):
+        return data.astype(dtype, copy=False)
+
+    return data
+
+
+def from_storage_dtype(data):
+    """Convert stored floating point data for computation
+
+    Data is converted into compute data type. If the policy does not define it, float16 data is converted into
+    float32, as float16 is meant only for storage.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Data
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    if isinstance(data, numpy.ndarray) and numpy.issubdtype(data.dtype, numpy.floating):
+        dtype = compute_dtype(default=numpy.float32 if data.dtype == numpy.float16 else None)
+        if dtype is not None:
+            return data.astype(dtype, copy=False)
+
+    return data
+
+
+def is_memory_mapped(data):
+    """Check if array is memory-mapped from a file
+
+    Views to a memory-mapped array are memory-mapped too, converted copies are not.
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Data
+
+    Returns
+    -------
+    bool
+
+    """
+
+    while data is not None:
+        if isinstance(data, mmap.mmap):
+            return True
+
+        data = getattr(data, 'base', None)
+
+    return False
+
+
+class DtypePolicy(object):
+    """Context manager to set data type policy temporarily
+
+    Policy is set only for the current thread, threads started inside the context use the global policy unless
+    they enter the context themselves.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        with dcase_util.utils.DtypePolicy(compute='float32'):
+            audio = dcase_util.containers.AudioContainer().load(filename)
+            mel = dcase_util.features.MelExtractor().extract(audio)
+
+    """
+
+    def __init__(self, compute=None, storage=None):
+        """Constructor
+
+        Parameters
+        ----------
+        compute : str or numpy.dtype
+            Data type for computation, if None current policy is kept.
+            Default value None
+
+        storage : str or numpy.dtype
+            Data type for storage, if None current policy is kept.
+            Default value None
+
+        """
+
+        self.compute = _validate_dtype(dtype=compute, valid_dtypes=COMPUTE_DTYPES, field='compute')
+        self.storage = _validate_dtype(dtype=storage, valid_dtypes=STORAGE_DTYPES, field='storage')
+        self._previous = []
+
+    def __enter__(self):
+        previous = getattr(_dtype_override, 'policy', None)
+        self._previous.append(previous)
+
+        current = _current_policy()
+        _dtype_override.policy = {
+            'compute': self.compute if self.compute is not None else current['compute'],
+            'storage': self.storage if self.storage is not None else current['storage']
+        }
+
+        return self
+
+    def __exit__(self, *_):
+        _dtype_override.policy = self._previous.pop()
@@ -77,6 +77,42 @@ def posix_path(path):
     return os.path.normpath(path).replace('\\', '/')
 
 
+def replace_file(source, destination):
+    """Rename file, replacing the destination file if it exists
+
+    Replacement is atomic on POSIX systems, so that concurrent readers see either the old or the new file.
+
+    Parameters
+    ----------
+    source : str
+        Source file
+
+    destination : str
+        Destination file
+
+    Returns
+    -------
+    nothing
+
+    """
+
+    if hasattr(os, 'replace'):
+        os.replace(source, destination)
+
+    else:
+        # Python 2
+        try:
+            os.rename(source, destination)
+
+        except OSError:
+            # Windows does not rename over an existing file
+            if not os.path.isfile(destination):
+                raise
+
+            os.remove(destination)
+            os.rename(source, destination)
+
+
 class Path(object):
     """Utility class for paths"""
     def __init__(self, path=None):
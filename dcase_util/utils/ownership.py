@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import copy
+import threading
+import numpy
+
+# Mode is kept per thread, so that chains processed in parallel threads cannot modify each others input
+_in_place = threading.local()
+
+
+def in_place_enabled():
+    """In-place processing mode is enabled in the current thread
+
+    Returns
+    -------
+    bool
+
+    """
+
+    return getattr(_in_place, 'enabled', False)
+
+
+def copy_unless_in_place(data):
+    """Copy of the data to prevent modifications to the original data
+
+    In the in-place processing mode, the data is owned by the processing chain and it is returned as such.
+
+    Parameters
+    ----------
+    data : object
+        Data
+
+    Returns
+    -------
+    object
+
+    """
+
+    if in_place_enabled():
+        return data
+
+    statistics = copy_statistics()
+    statistics['copies'] += 1
+    statistics['bytes'] += _nbytes(data)
+
+    return copy.deepcopy(data)
+
+
+def copy_statistics():
+    """Amount of protective copies made with `copy_unless_in_place` in the current thread
+
+    Returns
+    -------
+    dict
+        Dict with copies and bytes (size of the copied arrays)
+
+    """
+
+    if not hasattr(_in_place, 'statistics'):
+        reset_copy_statistics()
+
+    return _in_place.statistics
+
+
+def reset_copy_statistics():
+    """Reset copy statistics of the current thread
+
+    Returns
+    -------
+    nothing
+
+    """
+
+    _in_place.statistics = {
+        'copies': 0,
+        'bytes': 0
+    }
+
+
+def _nbytes(data):
+    # Size of the arrays in the data, containers and repositories included
+    if isinstance(data, numpy.ndarray):
+        return data.nbytes
+
+    elif isinstance(data, dict):
+        return sum([_nbytes(item) for item in data.values()])
+
+    elif isinstance(getattr(data, 'data', None), numpy.ndarray):
+        return data.data.nbytes
+
+    return 0
+
+
+class InPlace(object):
+    """In-place processing mode context manager
+
+    Data manipulators (Normalizer, Aggregator, Sequencer), decision encoder and audio writing processors make a
+    copy of their input to prevent modifications to the original data. Inside the in-place mode the copy is
+    skipped, and input is modified directly. Mode is used by ``ProcessingChain.process`` with ``in_place``
+    parameter for intermediate data owned by the chain.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        with dcase_util.utils.InPlace():
+            normalized = normalizer.normalize(data)  # data is modified
+
+    """
+
+    def __init__(self, enabled=True):
+        """Constructor
+
+        Parameters
+        ----------
+        enabled : bool
+            In-place mode enabled
+            Default value True
+
+        """
+
+        self.enabled = enabled
+        self._previous = []
+
+    def __enter__(self):
+        self._previous.append(in_place_enabled())
+        _in_place.enabled = self.enabled
+
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _in_place.enabled = self._previous.pop()
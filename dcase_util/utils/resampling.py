@@ -0,0 +1,234 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import time
+import logging
+import numpy
+
+
+def _librosa_resampler(res_type):
+    def resampler(y, orig_sr, target_sr, scale=False):
+        import librosa
+
+        return librosa.resample(
+            y=numpy.asfortranarray(y),
+            orig_sr=orig_sr,
+            target_sr=target_sr,
+            res_type=res_type,
+            scale=scale
+        )
+
+    return resampler
+
+
+def _polyphase_resampler(y, orig_sr, target_sr, scale=False):
+    import scipy.signal
+
+    gcd = numpy.gcd(int(orig_sr), int(target_sr))
+    y_resampled = scipy.signal.resample_poly(
+        y,
+        up=int(target_sr) // gcd,
+        down=int(orig_sr) // gcd,
+        axis=-1
+    )
+
+    if scale:
+        y_resampled /= numpy.sqrt(float(target_sr) / orig_sr)
+
+    return y_resampled.astype(y.dtype, copy=False)
+
+
+def _soxr_resampler(quality):
+    def resampler(y, orig_sr, target_sr, scale=False):
+        import soxr
+
+        # soxr expects time on the first axis
+        y_resampled = soxr.resample(y.T, orig_sr, target_sr, quality=quality).T
+
+        if scale:
+            y_resampled /= numpy.sqrt(float(target_sr) / orig_sr)
+
+        return numpy.ascontiguousarray(y_resampled)
+
+    return resampler
+
+
+#: Registered resamplers, resample type as key and function(y, orig_sr, target_sr, scale) as value
+resamplers = {
+    'kaiser_best': _librosa_resampler('kaiser_best'),
+    'kaiser_fast': _librosa_resampler('kaiser_fast'),
+    'fft': _librosa_resampler('fft'),
+    'scipy': _librosa_resampler('scipy'),
+    'polyphase': _polyphase_resampler,
+    'soxr_vhq': _soxr_resampler('VHQ'),
+    'soxr_hq': _soxr_resampler('HQ'),
+    'soxr_mq': _soxr_resampler('MQ'),
+    'soxr_lq': _soxr_resampler('LQ'),
+    'soxr_qq': _soxr_resampler('QQ'),
+}
+
+
+def register_resampler(res_type, function):
+    """Register resampling function
+
+    Parameters
+    ----------
+    res_type : str
+        Resample type used to select the function
+
+    function : callable
+        Function with signature function(y, orig_sr, target_sr, scale), time along the last axis of y
+
+    """
+
+    resamplers[res_type] = function
+
+
+def resampler_list():
+    """List of registered resample types
+
+    Returns
+    -------
+    list of str
+
+    """
+
+    return sorted(resamplers.keys())
+
+
+def resample(y, orig_sr, target_sr, res_type='kaiser_best', scale=False):
+    """Resample audio signal with the registered resampler
+
+    Resample types not registered are passed to `librosa.resample`.
+
+    Parameters
+    ----------
+    y : numpy.ndarray [shape=(n,) or shape=(channels, n)]
+        Audio signal
+
+    orig_sr : int
+        Original sampling rate
+
+    target_sr : int
+        Target sampling rate
+
+    res_type : str
+        Resample type, see `resampler_list`
+        Default value 'kaiser_best'
+
+    scale : bool
+        Scale the resampled signal to have approximately equal total energy.
+        Default value False
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    if orig_sr == target_sr:
+        return y
+
+    if res_type in resamplers:
+        return resamplers[res_type](y, orig_sr, target_sr, scale=scale)
+
+    return _librosa_resampler(res_type)(y, orig_sr, target_sr, scale=scale)
+
+
+def benchmark_resamplers(res_types=None, orig_sr=44100, target_sr=16000, duration_seconds=10.0, repetitions=3,
+                         logger=None):
+    """Benchmark speed and quality of the resamplers
+
+    Test signal is a sum of tones inside the target band and a tone above the target Nyquist frequency. Quality
+    is measured as signal-to-noise ratio against the ideal output, i.e. the in-band tones generated directly at
+    the target sampling rate. Errors at the signal edges are excluded.
+
+    Parameters
+    ----------
+    res_types : list of str
+        Resample types to benchmark, if None all registered are used.
+        Default value None
+
+    orig_sr : int
+        Original sampling rate
+        Default value 44100
+
+    target_sr : int
+        Target sampling rate
+        Default value 16000
+
+    duration_seconds : float
+        Test signal duration
+        Default value 10.0
+
+    repetitions : int
+        Amount of repetitions, fastest run is reported
+        Default value 3
+
+    logger : Logger class
+        Logger class
+        Default value None
+
+    Returns
+    -------
+    DictContainer
+        Resample type as key, and dict with time_sec, realtime_factor, and snr_db as value
+
+    """
+
+    from dcase_util.containers import DictContainer
+
+    if logger is None:
+        logger = logging.getLogger(__name__)
+
+    if res_types is None:
+        res_types = resampler_list()
+
+    nyquist = min(orig_sr, target_sr) / 2.0
+    # Tone frequencies are chosen not to have whole periods in the signal
+    tones = [nyquist * 0.0123, nyquist * 0.1037, nyquist * 0.5011, nyquist * 0.7919]
+
+    def signal(fs):
+        t = numpy.arange(int(duration_seconds * fs)) / float(fs)
+        return numpy.sum([numpy.sin(2 * numpy.pi * f * t) for f in tones], axis=0) / len(tones)
+
+    y = signal(orig_sr)
+    if target_sr < orig_sr:
+        # Tone to be removed by the anti-aliasing filter
+        t = numpy.arange(len(y)) / float(orig_sr)
+        y += 0.25 * numpy.sin(2 * numpy.pi * min(nyquist * 1.2037, orig_sr / 2.0 * 0.95) * t)
+
+    reference = signal(target_sr)
+    edge = int(0.1 * len(reference))
+
+    results = DictContainer()
+    for res_type in res_types:
+        try:
+            durations = []
+            for repetition in range(repetitions):
+                start = time.time()
+                y_resampled = resample(y=y, orig_sr=orig_sr, target_sr=target_sr, res_type=res_type)
+                durations.append(time.time() - start)
+
+        except ImportError as e:
+            logger.warning('{name}: Resampler [{res_type}] not available: {error}'.format(
+                name=__name__,
+                res_type=res_type,
+                error=e
+            ))
+            continue
+
+        length = min(len(y_resampled), len(reference))
+        error = y_resampled[edge:length - edge] - reference[edge:length - edge]
+        signal_power = numpy.mean(reference[edge:length - edge] ** 2)
+        error_power = numpy.mean(error ** 2)
+
+        results[res_type] = {
+            'time_sec': min(durations),
+            'realtime_factor': duration_seconds / min(durations) if min(durations) else float('inf'),
+            'snr_db': 10 * numpy.log10(signal_power / error_power) if error_power else float('inf')
+        }
+
+    return results
@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+from __future__ import print_function, absolute_import
+
+import zlib
+import logging
+import numpy
+from dcase_util.utils.dtype import compute_dtype
+
+#: Valid storage types for data arrays
+STORAGE_TYPES = ['float16', 'float32', 'float64', 'int8', 'uint8']
+
+#: Valid compression methods for data arrays
+COMPRESSIONS = ['zlib', 'lz4']
+
+
+def _invalid(field, value, valid):
+    message = '{name}: Invalid {field} [{value}], valid values {valid}.'.format(
+        name=__name__,
+        field=field,
+        value=value,
+        valid=valid
+    )
+    logging.getLogger(__name__).exception(message)
+    raise ValueError(message)
+
+
+def quantize(data, dtype='uint8'):
+    """Quantize data into 8-bit integers with per-band scale and offset
+
+    Each band (row along the first axis) is scaled separately to cover the full integer range, maximum
+    quantization error per band is half of its scale. Reconstruct data with `dequantize`.
+
+    Parameters
+    ----------
+    data : numpy.ndarray [shape=(n_bands, ...)]
+        Data
+
+    dtype : str
+        Integer type, 'int8' or 'uint8'.
+        Default value 'uint8'
+
+    Raises
+    ------
+    ValueError:
+        Invalid integer type
+
+    Returns
+    -------
+    numpy.ndarray
+        Quantized data
+
+    numpy.ndarray [shape=(n_bands, 1, ...)]
+        Scale
+
+    numpy.ndarray [shape=(n_bands, 1, ...)]
+        Offset
+
+    """
+
+    if dtype not in ['int8', 'uint8']:
+        _invalid(field='quantization type', value=dtype, valid=['int8', 'uint8'])
+
+    data = numpy.asarray(data, dtype=numpy.float64)
+
+    axis = tuple(range(1, data.ndim)) if data.ndim > 1 else None
+    minimum = numpy.min(data, axis=axis, keepdims=True)
+    maximum = numpy.max(data, axis=axis, keepdims=True)
+
+    scale = (maximum - minimum) / 255.0
+    scale[scale == 0] = 1.0
+
+    quantized = numpy.clip(numpy.rint((data - minimum) / scale), 0, 255)
+
+    if dtype == 'int8':
+        quantized = (quantized - 128).astype(numpy.int8)
+        offset = minimum + 128 * scale
+
+    else:
+        quantized = quantized.astype(numpy.uint8)
+        offset = minimum
+
+    return quantized, scale, offset
+
+
+def dequantize(data, scale, offset, dtype=None):
+    """Reconstruct quantized data
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Quantized data
+
+    scale : numpy.ndarray
+        Scale
+
+    offset : numpy.ndarray
+        Offset
+
+    dtype : str or numpy.dtype
+        Output data type, if None, compute data type of the policy or float32 is used.
+        Default value None
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    if dtype is None:
+        dtype = compute_dtype(default=numpy.float32)
+
+    return (data * numpy.asarray(scale, dtype=dtype) + numpy.asarray(offset, dtype=dtype)).astype(dtype, copy=False)
+
+
+def encode_array(data, storage_type=None, compression=None):
+    """Encode data array for storage
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Data
+
+    storage_type : str
+        Storage type, 'float16', 'float32', 'float64' or 'int8' or 'uint8' for quantized data with per-band
+        scale and offset. If None, data type is kept.
+        Default value None
+
+    compression : str
+        Compression method, 'zlib', or 'lz4' (requires lz4 module). If None, data is not compressed.
+        Default value None
+
+    Raises
+    ------
+    ValueError:
+        Invalid storage type or compression method
+
+    ImportError:
+        lz4 module not installed
+
+    Returns
+    -------
+    numpy.ndarray
+        Encoded data, compressed data as uint8 array
+
+    dict
+        Encoding information needed to decode the data
+
+    """
+
+    if storage_type is not None and storage_type not in STORAGE_TYPES:
+        _invalid(field='storage type', value=storage_type, valid=STORAGE_TYPES)
+
+    if compression is not None and compression not in COMPRESSIONS:
+        _invalid(field='compression', value=compression, valid=COMPRESSIONS)
+
+    data = numpy.asarray(data)
+    info = {
+        'storage_type': storage_type,
+        'compression': compression,
+        'scale': None,
+        'offset': None,
+    }
+
+    if storage_type in ['int8', 'uint8']:
+        encoded, info['scale'], info['offset'] = quantize(data=data, dtype=storage_type)
+
+    elif storage_type is not None:
+        encoded = data.astype(storage_type, copy=False)
+
+    else:
+        encoded = data
+
+    info['dtype'] = encoded.dtype.str
+    info['shape'] = encoded.shape
+
+    if compression == 'zlib':
+        # Fastest compression level, data is read more often than written
+        encoded = numpy.frombuffer(zlib.compress(numpy.ascontiguousarray(encoded).data, 1), dtype=numpy.uint8)
+
+    elif compression == 'lz4':
+        encoded = numpy.frombuffer(_lz4().compress(numpy.ascontiguousarray(encoded).tobytes()), dtype=numpy.uint8)
+
+    return encoded, info
+
+
+def decode_array(data, info):
+    """Decode data array encoded with `encode_array`
+
+    Parameters
+    ----------
+    data : numpy.ndarray
+        Encoded data
+
+    info : dict
+        Encoding information
+
+    Returns
+    -------
+    numpy.ndarray
+
+    """
+
+    compression = info.get('compression')
+    if compression == 'zlib':
+        data = numpy.frombuffer(zlib.decompress(numpy.ascontiguousarray(data).data), dtype=info['dtype'])
+
+    elif compression == 'lz4':
+        data = numpy.frombuffer(_lz4().decompress(numpy.ascontiguousarray(data).tobytes()), dtype=info['dtype'])
+
+    if compression is not None:
+        # Decompressed buffer is read-only
+        data = data.reshape(info['shape']).copy()
+
+    if info.get('storage_type') in ['int8', 'uint8']:
+        data = dequantize(data=data, scale=info['scale'], offset=info['offset'])
+
+    return data
+
+
+def _lz4():
+    try:
+        import lz4.frame
+
+    except ImportError:
+        message = '{name}: Unable to import lz4 module. You can install it with `pip install lz4`.'.format(
+            name=__name__
+        )
+        logging.getLogger(__name__).exception(message)
+        raise ImportError(message)
+
+    return lz4.frame
@@ -5,6 +5,8 @@ from __future__ import print_function, absolute_import
 import six
 
 import os
+import copy
+import bisect
 import sys
 import locale
 import logging
@@ -210,7 +212,7 @@ def is_jupyter():
         return False
 
 
-def get_audio_info(filename, logger=None):
+def get_audio_info(filename, logger=None, use_cache=True):
     """Get information about audio file without opening it.
 
     Parameters
@@ -222,6 +224,11 @@ def get_audio_info(filename, logger=None):
         Logger class
         Default value None
 
+    use_cache : bool
+        Use process-wide audio info cache (`audio_info_cache`), information is read from the file only if the file
+        is not in the cache or it has been modified.
+        Default value True
+
     Returns
     -------
     DictContainer
@@ -229,6 +236,9 @@ def get_audio_info(filename, logger=None):
 
     """
 
+    if use_cache:
+        return audio_info_cache.get(filename=filename, logger=logger)
+
     from dcase_util.utils.files import FileFormat
     from dcase_util.files import File
     from dcase_util.containers import DictContainer
@@ -292,13 +302,13 @@ def get_audio_info(filename, logger=None):
         }
 
         # Map sub type to bit depth
-        if info['subtype'] == 'PCM_16':
+        if info['subtype']['name'] == 'PCM_16':
             info['bit_depth'] = 16
 
-        elif info['subtype'] == 'PCM_24':
+        elif info['subtype']['name'] == 'PCM_24':
             info['bit_depth'] = 24
 
-        elif info['subtype'] == 'PCM_32':
+        elif info['subtype']['name'] == 'PCM_32':
             info['bit_depth'] = 32
 
     elif file.format in [FileFormat.FLAC, FileFormat.OGG,
@@ -367,7 +377,7 @@ def get_audio_info(filename, logger=None):
     return info
 
 
-def get_media_duration(filename, logger=None):
+def get_media_duration(filename, logger=None, use_cache=True):
     """Get media file duration using ffprobe.
 
     Parameters
@@ -379,6 +389,10 @@ def get_media_duration(filename, logger=None):
         Logger class
         Default value None
 
+    use_cache : bool
+        Use process-wide audio info cache (`audio_info_cache`).
+        Default value True
+
     Returns
     -------
     float
@@ -387,6 +401,9 @@ def get_media_duration(filename, logger=None):
     """
     import subprocess
 
+    if use_cache:
+        return audio_info_cache.media_duration(filename=filename, logger=logger)
+
     if logger is None:
         logger = logging.getLogger(__name__)
 
@@ -485,6 +502,427 @@ def merge_media_files(source_a_filename, source_b_filename, target_filename, ove
         raise RuntimeError("command '{}' return with error (code {}): {}".format(e.cmd, e.returncode, e.output))
 
 
+class AudioInfoCache(object):
+    """Audio file information cache
+
+    Information is keyed by the absolute path, and validated with the modification time and size of the file.
+    Cache can be filled for a whole directory at once, and stored to disk to be reused between runs.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        cache = dcase_util.utils.audio_info_cache
+        cache.prefetch(path='datasets/TUT-acoustic-scenes-2017-development/audio', n_jobs=4)
+        cache.save(filename='audio_info.cpickle')
+
+    """
+
+    #: Audio file extensions collected when prefetching a directory
+    audio_extensions = ['.wav', '.flac', '.ogg', '.mp3', '.m4a', '.mp4', '.webm', '.mkv']
+
+    def __init__(self):
+        """Constructor"""
+
+        self.entries = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def __contains__(self, filename):
+        entry = self.entries.get(os.path.abspath(filename))
+        return entry is not None and entry['stamp'] == self.stamp(filename)
+
+    @staticmethod
+    def stamp(filename):
+        """File modification time and size
+
+        Parameters
+        ----------
+        filename : str
+            File path
+
+        Returns
+        -------
+        tuple or None
+            None if file does not exist
+
+        """
+
+        try:
+            stat = os.stat(filename)
+
+        except OSError:
+            return None
+
+        return stat.st_mtime, stat.st_size
+
+    def _entry(self, filename):
+        key = os.path.abspath(filename)
+        stamp = self.stamp(key)
+
+        entry = self.entries.get(key)
+        if entry is not None and stamp is not None and entry['stamp'] == stamp:
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        entry = {
+            'stamp': stamp,
+            'info': None,
+            'media_duration': None
+        }
+        self.entries[key] = entry
+
+        return entry
+
+    def get(self, filename, logger=None):
+        """Get audio file information
+
+        Parameters
+        ----------
+        filename : str
+            File path
+
+        logger : Logger class
+            Logger class
+            Default value None
+
+        Raises
+        ------
+        IOError:
+            File does not exist or format cannot be detected
+
+        Returns
+        -------
+        DictContainer
+            fs, channels, duration, subtype and bit depth
+
+        """
+
+        from dcase_util.containers import DictContainer
+
+        entry = self._entry(filename=filename)
+        if entry['info'] is None:
+            info = get_audio_info(filename=filename, logger=logger, use_cache=False)
+            entry['info'] = dict(info)
+
+        return DictContainer(copy.deepcopy(entry['info']))
+
+    def media_duration(self, filename, logger=None):
+        """Get media file duration
+
+        Parameters
+        ----------
+        filename : str
+            File path
+
+        logger : Logger class
+            Logger class
+            Default value None
+
+        Returns
+        -------
+        float
+            Media duration in seconds
+
+        """
+
+        entry = self._entry(filename=filename)
+        if entry['media_duration'] is None:
+            entry['media_duration'] = get_media_duration(filename=filename, logger=logger, use_cache=False)
+
+        return entry['media_duration']
+
+    def prefetch(self, path=None, filenames=None, n_jobs=1):
+        """Read information for all audio files in the directory or in the list
+
+        Parameters
+        ----------
+        path : str
+            Directory, audio files are collected recursively
+            Default value None
+
+        filenames : list of str
+            Audio files
+            Default value None
+
+        n_jobs : int
+            Amount of threads used to read file information
+            Default value 1
+
+        Returns
+        -------
+        self
+
+        """
+
+        if filenames is None:
+            filenames = []
+
+        else:
+            filenames = list(filenames)
+
+        if path is not None:
+            for dir_path, dir_names, files in os.walk(path):
+                for name in sorted(files):
+                    if os.path.splitext(name)[1].lower() in self.audio_extensions:
+                        filenames.append(os.path.join(dir_path, name))
+
+        filenames = [filename for filename in filenames if filename not in self]
+
+        def fetch(filename):
+            try:
+                return filename, get_audio_info(filename=filename, logger=logging.getLogger(__name__), use_cache=False)
+
+            except IOError:
+                return filename, None
+
+        if n_jobs > 1 and len(filenames) > 1:
+            from multiprocessing.pool import ThreadPool
+
+            pool = ThreadPool(processes=n_jobs)
+            try:
+                results = pool.map(fetch, filenames)
+
+            finally:
+                pool.close()
+                pool.join()
+
+        else:
+            results = [fetch(filename) for filename in filenames]
+
+        for filename, info in results:
+            if info is not None:
+                entry = self._entry(filename=filename)
+                entry['info'] = dict(info)
+
+        return self
+
+    def load(self, filename):
+        """Load cached information from the file, entries are merged into the cache
+
+        Parameters
+        ----------
+        filename : str
+            File path
+
+        Returns
+        -------
+        self
+
+        """
+
+        from dcase_util.files import Serializer
+
+        entries = Serializer.load_cpickle(filename=filename)
+        for key, entry in entries.items():
+            if key not in self.entries:
+                self.entries[key] = entry
+
+        return self
+
+    def save(self, filename, path=None):
+        """Save cached information into the file
+
+        File is written first to a temporary file and then moved in place.
+
+        Parameters
+        ----------
+        filename : str
+            File path
+
+        path : str
+            Save only entries of files under this directory, if None all entries are saved.
+            Default value None
+
+        Returns
+        -------
+        self
+
+        """
+
+        from dcase_util.files import Serializer
+        from dcase_util.utils.files import replace_file
+
+        entries = self.entries
+        if path is not None:
+            path = os.path.join(os.path.abspath(path), '')
+            entries = dict([(key, entry) for key, entry in self.entries.items() if key.startswith(path)])
+
+        tmp_filename = filename + '.' + str(os.getpid()) + '.tmp'
+        Serializer.save_cpickle(filename=tmp_filename, data=entries)
+        replace_file(source=tmp_filename, destination=filename)
+
+        return self
+
+    def clear(self):
+        """Empty the cache
+
+        Returns
+        -------
+        self
+
+        """
+
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+
+        return self
+
+
+#: Process-wide audio info cache used by get_audio_info
+audio_info_cache = AudioInfoCache()
+
+
+class IntervalIndex(object):
+    """Sorted interval index for overlap queries
+
+    Intervals are sorted by onset once, and the running maximum of offsets is stored along them. Overlap queries
+    are answered with binary searches in logarithmic time.
+
+    Examples
+    --------
+
+    .. code-block:: python
+        :linenos:
+
+        index = dcase_util.utils.IntervalIndex(onsets=[0.6, 2.0], offsets=[0.8, 2.5])
+        index.first_overlap(start=0.5, stop=1.0)
+        # 0
+        index.first_overlap(start=0.8, stop=1.9)
+        # None
+
+    """
+
+    def __init__(self, onsets=None, offsets=None):
+        """Constructor
+
+        Parameters
+        ----------
+        onsets : list of float
+            Interval onsets
+            Default value None
+
+        offsets : list of float
+            Interval offsets, same length as onsets.
+            Default value None
+
+        """
+
+        if onsets is None:
+            onsets = []
+
+        if offsets is None:
+            offsets = []
+
+        if len(onsets) != len(offsets):
+            message = '{name}: Onsets and offsets should have the same length.'.format(
+                name=self.__class__.__name__
+            )
+            logging.getLogger(__name__).exception(message)
+            raise ValueError(message)
+
+        order = sorted(range(len(onsets)), key=lambda i: onsets[i])
+
+        self.order = order
+        self.onsets = [onsets[i] for i in order]
+        self.offsets = [offsets[i] for i in order]
+
+        # Running maximum of offsets, non-decreasing, used to locate the first interval ending after a time point
+        self.max_offsets = []
+        max_offset = None
+        for offset in self.offsets:
+            if max_offset is None or offset > max_offset:
+                max_offset = offset
+
+            self.max_offsets.append(max_offset)
+
+    def __len__(self):
+        return len(self.onsets)
+
+    @classmethod
+    def from_items(cls, items):
+        """Build index from items with onset and offset
+
+        Parameters
+        ----------
+        items : list of dict or MetaDataContainer
+            Items with onset and offset fields
+
+        Returns
+        -------
+        IntervalIndex
+
+        """
+
+        return cls(
+            onsets=[item['onset'] for item in items],
+            offsets=[item['offset'] for item in items]
+        )
+
+    def first_overlap(self, start, stop):
+        """First interval, in onset order, overlapping with the query segment
+
+        Interval overlaps when its onset is at or before the segment stop and its offset is after the segment
+        start, i.e. intervals ending exactly at the segment start are not counted.
+
+        Parameters
+        ----------
+        start : float
+            Segment start
+
+        stop : float
+            Segment stop
+
+        Returns
+        -------
+        int or None
+            Position of the interval in the sorted index, None if no overlap.
+
+        """
+
+        # Intervals starting at or before stop
+        candidate_count = bisect.bisect_right(self.onsets, stop)
+
+        # First interval ending after start
+        position = bisect.bisect_right(self.max_offsets, start)
+
+        if position < candidate_count:
+            return position
+
+        return None
+
+    def overlapping(self, start, stop):
+        """Intervals overlapping with the query segment
+
+        Parameters
+        ----------
+        start : float
+            Segment start
+
+        stop : float
+            Segment stop
+
+        Returns
+        -------
+        list of int
+            Positions of the intervals in the sorted index.
+
+        """
+
+        candidate_count = bisect.bisect_right(self.onsets, stop)
+        position = bisect.bisect_right(self.max_offsets, start)
+
+        return [i for i in range(position, candidate_count) if self.offsets[i] > start]
+
+
 class SuppressStdoutAndStderr(object):
     """Context manager to suppress STDOUT and STDERR
 
@@ -5,6 +5,7 @@ import dcase_util
 import os
 import numpy
 import tempfile
+import shutil
 
 
 def test_load():
@@ -282,6 +283,144 @@ def test_container():
     nose.tools.eq_(a.channels, 1)
 
 
+def test_load_segment_cached():
+    a_out = dcase_util.utils.Example.audio_container()
+
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.flac', dir=tempfile.gettempdir(), delete=False)
+    try:
+        a_out.save(filename=tmp.name, bit_depth=16)
+
+        cache = dcase_util.containers.audio_reader_cache
+        cache.close(tmp.name)
+
+        a_in = dcase_util.containers.AudioContainer().load(filename=tmp.name)
+        nose.tools.eq_(tmp.name in cache, True)
+        nose.tools.eq_(cache.info(tmp.name)['duration_samples'], a_out.length)
+
+        # Segments are read from the open file
+        for start in [0.5, 0.0, 1.25]:
+            a_segment = dcase_util.containers.AudioContainer().load(filename=tmp.name, start=start, stop=start + 0.5)
+            nose.tools.eq_(a_segment.shape, (2, 22050))
+            numpy.testing.assert_array_equal(
+                a_segment.data,
+                a_in.data[:, int(start * 44100):int(start * 44100) + 22050]
+            )
+
+        a_segment = dcase_util.containers.AudioContainer().load(
+            filename=tmp.name, start=1.0, stop=1.5, mono=True, fs=22050
+        )
+        nose.tools.eq_(a_segment.shape, (11025,))
+        nose.tools.eq_(a_segment.fs, 22050)
+
+        # Non-aligned offset is truncated as in librosa.load
+        import librosa
+        a_segment = dcase_util.containers.AudioContainer().load(filename=tmp.name, start=1.00002, stop=1.50002)
+        y, sr = librosa.load(tmp.name, sr=None, mono=False, offset=1.00002, duration=0.5)
+        nose.tools.eq_(a_segment.shape, y.shape)
+        numpy.testing.assert_array_almost_equal(a_segment.data, y)
+
+        # Entry closed by another thread after it was fetched
+        reader = cache._get(tmp.name)
+        cache.close(tmp.name)
+        nose.tools.eq_(reader['handle'].closed, True)
+        cache._get = lambda filename: reader
+        try:
+            data, fs = cache.read(filename=tmp.name, start=22050, stop=44100)
+            numpy.testing.assert_array_equal(data.T, a_in.data[:, 22050:44100])
+
+        finally:
+            del cache._get
+
+        # Modified file is reopened
+        dcase_util.containers.AudioContainer(data=a_out.data[:, :44100], fs=44100).save(filename=tmp.name)
+        nose.tools.eq_(dcase_util.containers.AudioContainer().load(filename=tmp.name).length, 44100)
+
+        cache.close(tmp.name)
+        nose.tools.eq_(tmp.name in cache, False)
+
+    finally:
+        try:
+            tmp.close()
+            os.unlink(tmp.name)
+        except:
+            pass
+
+
+def test_load_resample_cache():
+    tmp_path = tempfile.mkdtemp()
+    try:
+        filename = dcase_util.utils.Example.audio_filename()
+        a_ref = dcase_util.containers.AudioContainer().load(filename=filename, fs=16000, res_type='polyphase')
+
+        a_in = dcase_util.containers.AudioContainer().load(
+            filename=filename, fs=16000, res_type='polyphase', resample_cache_path=tmp_path
+        )
+        nose.tools.eq_(len(os.listdir(tmp_path)), 1)
+        nose.tools.eq_(a_in.fs, 16000)
+        numpy.testing.assert_array_almost_equal(a_in.data, a_ref.data)
+
+        # Segment from the cached file
+        a_segment = dcase_util.containers.AudioContainer().load(
+            filename=filename, fs=16000, res_type='polyphase', resample_cache_path=tmp_path,
+            start=1.0, stop=2.0, mono=True
+        )
+        nose.tools.eq_(a_segment.shape, (16000,))
+        numpy.testing.assert_array_almost_equal(a_segment.data, numpy.mean(a_ref.data[:, 16000:32000], axis=0))
+
+        # Other resample type is stored separately
+        dcase_util.containers.AudioContainer().load(
+            filename=filename, fs=16000, res_type='kaiser_fast', resample_cache_path=tmp_path
+        )
+        nose.tools.eq_(len(os.listdir(tmp_path)), 2)
+
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+def test_load_dtype_policy():
+    filename = dcase_util.utils.Example.audio_filename()
+    nose.tools.eq_(dcase_util.containers.AudioContainer().load(filename=filename).data.dtype, numpy.float64)
+
+    with dcase_util.utils.DtypePolicy(compute='float32'):
+        nose.tools.eq_(dcase_util.containers.AudioContainer().load(filename=filename).data.dtype, numpy.float32)
+        nose.tools.eq_(
+            dcase_util.containers.AudioContainer().load(filename=filename, fs=16000, mono=True).data.dtype,
+            numpy.float32
+        )
+        for container in dcase_util.containers.AudioContainer.load_batch(items=[filename, filename], n_jobs=2):
+            nose.tools.eq_(container.data.dtype, numpy.float32)
+
+
+def test_load_batch():
+    filename = dcase_util.utils.Example.audio_filename()
+    items = [
+        (filename, 0.1, 0.3),
+        {'filename': filename, 'fs': 16000, 'mono': True},
+        filename
+    ]
+
+    containers = list(dcase_util.containers.AudioContainer.load_batch(items=items, n_jobs=2, max_in_flight=1))
+    nose.tools.eq_(len(containers), 3)
+    nose.tools.eq_(containers[0].shape, (2, 8820))
+    nose.tools.eq_(containers[1].fs, 16000)
+    numpy.testing.assert_array_equal(
+        containers[1].data,
+        dcase_util.containers.AudioContainer().load(filename=filename, fs=16000, mono=True).data
+    )
+    numpy.testing.assert_array_equal(containers[2].data, dcase_util.containers.AudioContainer().load(filename).data)
+
+    results = list(dcase_util.containers.AudioContainer.load_batch(items=items, n_jobs=3, ordered=False))
+    nose.tools.eq_(sorted([index for index, container in results]), [0, 1, 2])
+    for index, container in results:
+        nose.tools.eq_(container.shape, containers[index].shape)
+
+
+@nose.tools.raises(IOError)
+def test_load_batch_error():
+    with dcase_util.utils.DisableLogger():
+        list(dcase_util.containers.AudioContainer.load_batch(items=['audio.wav']))
+
+
 def test_save():
     a_out = dcase_util.utils.Example.audio_container()
 
@@ -404,11 +543,41 @@ def test_segments():
         }
     ])
 
+    skip_segments = [{'onset': 0.05 + i * 0.2, 'offset': 0.15 + i * 0.2} for i in range(10)]
+    segments, segment_meta = a.segments(
+        segment_length_seconds=0.1,
+        skip_segments=skip_segments[::-1]
+    )
+    nose.tools.eq_(len(segments), 9)
+    for segment in segment_meta:
+        for item in skip_segments:
+            nose.tools.eq_(segment.onset < item['offset'] - 1.0 / a.fs and segment.offset > item['onset'], False)
+
     a = dcase_util.utils.Example.audio_container()
     segments, segment_meta = a.segments(segment_length=1000)
     nose.tools.eq_(len(segments), 88)
     nose.tools.eq_(len(segments), len(segment_meta))
 
+    segment_array, segment_meta = a.segments(segment_length=1000, as_array=True)
+    nose.tools.eq_(segment_array.shape, (2, 88, 1000))
+    nose.tools.eq_(numpy.may_share_memory(segment_array, a.data), True)
+    numpy.testing.assert_array_equal(segment_array, numpy.stack(segments, axis=-2))
+
+    segment_array, segment_meta = a.segments(
+        segment_length_seconds=0.5,
+        skip_segments=[{'onset': 0.6, 'offset': 0.8}],
+        as_array=True
+    )
+    nose.tools.eq_(segment_array.shape, (2, 3, 22050))
+    numpy.testing.assert_array_equal(segment_array[:, 1], a.data[:, 35280:57330])
+
+
+@nose.tools.raises(ValueError)
+def test_segments_as_array_length():
+    with dcase_util.utils.DisableLogger():
+        a = dcase_util.utils.Example.audio_container()
+        a.segments(segments=[{'onset': 0.1, 'offset': 0.2}, {'onset': 0.5, 'offset': 0.8}], as_array=True)
+
 
 def test_frames():
     a = dcase_util.utils.Example.audio_container().mixdown()
@@ -422,6 +591,22 @@ def test_frames():
     nose.tools.eq_(frames.shape[1], 1000)
     nose.tools.eq_(frames.shape[2], 88)
 
+    # View to the audio data
+    nose.tools.eq_(numpy.may_share_memory(frames, a.data), True)
+    nose.tools.eq_(frames.flags.writeable, False)
+    numpy.testing.assert_array_equal(frames[1, :, 3], a.data[1, 3000:4000])
+
+    frames = a.frames(frame_length=1000, hop_length=500, frames_last=False, copy=True)
+    nose.tools.eq_(frames.shape, (2, 175, 1000))
+    nose.tools.eq_(frames.flags.c_contiguous, True)
+    nose.tools.eq_(frames.flags.writeable, True)
+    numpy.testing.assert_array_equal(frames[0, 3], a.data[0, 1500:2500])
+
+    a.set_focus(start=1000, stop=5000)
+    frames = a.frames(frame_length=1000, hop_length=1000)
+    nose.tools.eq_(frames.shape, (2, 1000, 4))
+    numpy.testing.assert_array_equal(frames[0, :, 0], a.data[0, 1000:2000])
+
 
 @nose.tools.raises(ValueError)
 def test_focus_channel():
@@ -0,0 +1,229 @@
+""" Unit tests for FeatureContainer """
+
+import nose.tools
+import dcase_util
+import tempfile
+import os
+import numpy
+
+
+def test_save_load_numpy():
+    container = dcase_util.utils.Example.feature_container()
+
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.npy', dir=tempfile.gettempdir(), delete=False)
+    try:
+        container.save(filename=tmp.name)
+        nose.tools.eq_(os.path.isfile(tmp.name + '.cpickle'), True)
+
+        loaded = dcase_util.containers.FeatureContainer().load(filename=tmp.name)
+        nose.tools.eq_(loaded.shape, container.shape)
+        nose.tools.eq_(loaded.time_resolution, container.time_resolution)
+        nose.tools.eq_(loaded.memory_mapped, False)
+        numpy.testing.assert_array_equal(loaded.data, container.data)
+
+        # Memory-mapped
+        loaded = dcase_util.containers.FeatureContainer().load(filename=tmp.name, mmap_mode='r')
+        nose.tools.eq_(loaded.memory_mapped, True)
+        nose.tools.eq_(loaded.filename, tmp.name)
+        numpy.testing.assert_array_equal(loaded.data, container.data)
+
+        loaded.set_focus(start=10, stop=20)
+        nose.tools.eq_(loaded.get_focused().shape, (container.shape[0], 10))
+        numpy.testing.assert_array_equal(loaded.get_focused(), container.data[:, 10:20])
+
+    finally:
+        try:
+            tmp.close()
+            os.unlink(tmp.name)
+            os.unlink(tmp.name + '.cpickle')
+        except:
+            pass
+
+
+def test_save_load_storage_dtype():
+    container = dcase_util.utils.Example.feature_container()
+
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.npy', dir=tempfile.gettempdir(), delete=False)
+    try:
+        with dcase_util.utils.DtypePolicy(storage='float16'):
+            container.save(filename=tmp.name)
+
+        nose.tools.eq_(container.data.dtype, numpy.float64)
+        nose.tools.eq_(numpy.load(tmp.name).dtype, numpy.float16)
+
+        # Float16 is converted for computation
+        loaded = dcase_util.containers.FeatureContainer().load(filename=tmp.name)
+        nose.tools.eq_(loaded.data.dtype, numpy.float32)
+        numpy.testing.assert_allclose(loaded.data, container.data, rtol=1e-3, atol=1e-3)
+
+        with dcase_util.utils.DtypePolicy(compute='float64'):
+            loaded = dcase_util.containers.FeatureContainer().load(filename=tmp.name)
+            nose.tools.eq_(loaded.data.dtype, numpy.float64)
+
+        # Memory-mapped data is kept in the stored data type
+        loaded = dcase_util.containers.FeatureContainer().load(filename=tmp.name, mmap_mode='r')
+        nose.tools.eq_(loaded.memory_mapped, True)
+        nose.tools.eq_(loaded.data.dtype, numpy.float16)
+
+        with dcase_util.utils.DtypePolicy(compute='float32'):
+            loaded = dcase_util.containers.FeatureContainer().load(filename=tmp.name, mmap_mode='r')
+            nose.tools.eq_(loaded.memory_mapped, True)
+            nose.tools.eq_(loaded.data.dtype, numpy.float16)
+
+        # Converted copy is not memory-mapped
+        loaded._data = loaded.data.astype(numpy.float32)
+        nose.tools.eq_(loaded.memory_mapped, False)
+
+    finally:
+        try:
+            tmp.close()
+            os.unlink(tmp.name)
+            os.unlink(tmp.name + '.cpickle')
+        except:
+            pass
+
+
+def test_repository_save_load_numpy():
+    repository = dcase_util.utils.Example.feature_repository()
+
+    tmp_dir = tempfile.mkdtemp()
+    filename = os.path.join(tmp_dir, 'features.npy')
+    try:
+        repository.save(filename=filename)
+        nose.tools.eq_(os.path.isfile(os.path.join(tmp_dir, 'features.mel-0.npy')), True)
+
+        loaded = dcase_util.containers.FeatureRepository().load(filename=filename, mmap_mode='r')
+        nose.tools.eq_(sorted(loaded.labels), sorted(repository.labels))
+        for label in repository.labels:
+            nose.tools.eq_(loaded.get_container(label=label).memory_mapped, True)
+            numpy.testing.assert_array_equal(
+                loaded.get_container(label=label).data,
+                repository.get_container(label=label).data
+            )
+
+    finally:
+        for item in os.listdir(tmp_dir):
+            os.unlink(os.path.join(tmp_dir, item))
+
+        os.rmdir(tmp_dir)
+
+
+def test_save_load_quantized():
+    container = dcase_util.utils.Example.feature_container()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        for extension in ['.npy', '.cpickle']:
+            filename = os.path.join(tmp_dir, 'features' + extension)
+            container.save(filename=filename, storage_type='uint8', compression='zlib')
+            nose.tools.eq_(os.path.getsize(filename) < container.data.nbytes / 4, True)
+
+            # Storage options are not left into the container
+            nose.tools.eq_(hasattr(container, '_storage_options'), False)
+
+            loaded = dcase_util.containers.FeatureContainer().load(filename=filename)
+            nose.tools.eq_(loaded.shape, container.shape)
+            nose.tools.eq_(loaded.data.dtype, numpy.float32)
+            nose.tools.eq_(hasattr(loaded, '_storage'), False)
+
+            # Quantization error within half of the per-band step
+            step = (container.data.max(axis=1) - container.data.min(axis=1)) / 255.0
+            numpy.testing.assert_array_less(
+                numpy.abs(loaded.data - container.data).max(axis=1),
+                step / 2 + 1e-5
+            )
+
+        repository = dcase_util.utils.Example.feature_repository()
+        filename = os.path.join(tmp_dir, 'repository.npy')
+        repository.save(filename=filename, storage_type='float16')
+        loaded = dcase_util.containers.FeatureRepository().load(filename=filename)
+        for label in repository.labels:
+            nose.tools.eq_(loaded.get_container(label=label).data.dtype, numpy.float32)
+            numpy.testing.assert_allclose(
+                loaded.get_container(label=label).data,
+                repository.get_container(label=label).data,
+                rtol=1e-3, atol=1e-3
+            )
+
+    finally:
+        for item in os.listdir(tmp_dir):
+            os.unlink(os.path.join(tmp_dir, item))
+
+        os.rmdir(tmp_dir)
+
+
+@nose.tools.raises(ValueError)
+def test_repository_save_quantized_single_file():
+    repository = dcase_util.utils.Example.feature_repository()
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.cpickle', dir=tempfile.gettempdir(), delete=False)
+    try:
+        with dcase_util.utils.DisableLogger():
+            repository.save(filename=tmp.name, storage_type='uint8')
+
+    finally:
+        tmp.close()
+        os.unlink(tmp.name)
+
+
+@nose.tools.raises(IOError)
+def test_load_not_found():
+    with dcase_util.utils.DisableLogger():
+        dcase_util.containers.FeatureContainer().load(filename=os.path.join(tempfile.gettempdir(), 'wrong.npy'))
+
+
+def test_store():
+    container = dcase_util.utils.Example.feature_container()
+    repository = dcase_util.utils.Example.feature_repository()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        store = dcase_util.containers.FeatureStore(filename=os.path.join(tmp_dir, 'store.cpickle'))
+        store.set_container(key='file1.wav', container=container)
+        store.set_repository(key='file2.wav', repository=repository)
+        store.save()
+
+        nose.tools.eq_(len(store), 2)
+        nose.tools.eq_(store.keys, ['file1.wav', 'file2.wav'])
+        nose.tools.eq_(len(store.shards), 1)
+
+        store = dcase_util.containers.FeatureStore().load(filename=os.path.join(tmp_dir, 'store.cpickle'))
+        nose.tools.eq_(store.keys, ['file1.wav', 'file2.wav'])
+        nose.tools.eq_(store.get_labels(key='file2.wav'), sorted(repository.labels))
+
+        loaded = store.get_container(key='file1.wav')
+        nose.tools.eq_(loaded.memory_mapped, True)
+        nose.tools.eq_(loaded.time_resolution, container.time_resolution)
+        numpy.testing.assert_array_equal(loaded.data, container.data)
+
+        loaded = store.get_container(key='file1.wav', memory_map=False)
+        nose.tools.eq_(loaded.memory_mapped, False)
+        numpy.testing.assert_array_equal(loaded.data, container.data)
+
+        loaded_repository = store.get_repository(key='file2.wav')
+        for label in repository.labels:
+            numpy.testing.assert_array_equal(
+                loaded_repository.get_container(label=label).data,
+                repository.get_container(label=label).data
+            )
+
+        # Multiple shards
+        store = dcase_util.containers.FeatureStore(
+            filename=os.path.join(tmp_dir, 'store2.cpickle'),
+            shard_size=container.data.nbytes / 1024.0 / 1024.0
+        )
+        store.set_container(key='file1.wav', container=container)
+        store.set_container(key='file2.wav', container=container)
+        nose.tools.eq_(len(store.shards), 2)
+        numpy.testing.assert_array_equal(store.get_container(key='file2.wav').data, container.data)
+
+    finally:
+        for item in os.listdir(tmp_dir):
+            os.unlink(os.path.join(tmp_dir, item))
+
+        os.rmdir(tmp_dir)
+
+
+@nose.tools.raises(ValueError)
+def test_store_item_not_found():
+    with dcase_util.utils.DisableLogger():
+        dcase_util.containers.FeatureStore().get_container(key='file1.wav')
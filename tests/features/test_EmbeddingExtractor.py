@@ -0,0 +1,129 @@
+""" Unit tests for EmbeddingExtractor """
+
+import sys
+import types
+import numpy
+import nose.tools
+import dcase_util
+
+try:
+    from unittest import mock
+
+except ImportError:
+    import mock
+
+
+def _embedding_module(name, **kwargs):
+    # Stand-in for the embedding package, model is given to the extractor directly
+    module = types.ModuleType(name)
+    module.models = types.ModuleType(name + '.models')
+    for key, value in kwargs.items():
+        setattr(module, key, value)
+
+    return module
+
+
+class _Tensor(object):
+    # Minimal stand-in for torch.Tensor
+    def __init__(self, data):
+        self.data = data
+
+    @property
+    def T(self):
+        return _Tensor(self.data.T)
+
+    def cpu(self):
+        return self
+
+    def detach(self):
+        return self
+
+    def numpy(self):
+        return self.data
+
+
+def _get_audio_embedding(calls, tensor=False):
+    def get_audio_embedding(audio, sr, model, center, hop_size, batch_size, verbose, **kwargs):
+        calls.append(audio)
+        # Embedding frame count from signal length, and signal index as embedding value
+        embeddings = [numpy.full((len(y) // 1000, 4), float(index)) for index, y in enumerate(audio)]
+        if tensor:
+            embeddings = [_Tensor(embedding) for embedding in embeddings]
+
+        return embeddings, [None] * len(audio)
+
+    return get_audio_embedding
+
+
+def test_load_embedding_model():
+    calls = []
+
+    def loader(input_repr, embedding_size):
+        calls.append((input_repr, embedding_size))
+        return object()
+
+    model1 = dcase_util.features.load_embedding_model(loader=loader, input_repr='mel128', embedding_size=512)
+    model2 = dcase_util.features.load_embedding_model(loader=loader, embedding_size=512, input_repr='mel128')
+    model3 = dcase_util.features.load_embedding_model(loader=loader, input_repr='mel256', embedding_size=512)
+
+    nose.tools.ok_(model1 is model2)
+    nose.tools.ok_(model1 is not model3)
+    nose.tools.eq_(calls, [('mel128', 512), ('mel256', 512)])
+
+
+def test_set_threads():
+    extractor = dcase_util.features.EmbeddingExtractor()
+    nose.tools.ok_(extractor.set_threads() is extractor)
+
+
+def test_openl3_extract_batch():
+    calls = []
+    module = _embedding_module('openl3', get_audio_embedding=_get_audio_embedding(calls))
+    with mock.patch.dict(sys.modules, {'openl3': module}):
+        extractor = dcase_util.features.OpenL3Extractor(model=object())
+        embeddings = extractor.extract_batch(signals=[numpy.zeros(3000), numpy.zeros(5000)])
+
+    nose.tools.eq_(len(calls), 1)
+    nose.tools.eq_(isinstance(calls[0], list), True)
+    nose.tools.eq_(len(calls[0]), 2)
+    nose.tools.eq_([embedding.shape for embedding in embeddings], [(4, 3), (4, 5)])
+    nose.tools.eq_([embedding[0, 0] for embedding in embeddings], [0.0, 1.0])
+
+
+def test_torchopenl3_extract_batch():
+    calls = []
+    module = _embedding_module('torchopenl3', get_audio_embedding=_get_audio_embedding(calls, tensor=True))
+    with mock.patch.dict(sys.modules, {'torchopenl3': module}):
+        extractor = dcase_util.features.TorchOpenL3Extractor(model=object())
+        embeddings = extractor.extract_batch(signals=[numpy.zeros(3000), numpy.zeros(5000)])
+
+    nose.tools.eq_(len(calls), 1)
+    nose.tools.eq_(len(calls[0]), 2)
+    nose.tools.eq_([embedding.shape for embedding in embeddings], [(4, 3), (4, 5)])
+    nose.tools.eq_([embedding[0, 0] for embedding in embeddings], [0.0, 1.0])
+
+
+def test_edgel3_extract_batch():
+    class Model(object):
+        def __init__(self):
+            self.inputs = []
+
+        def predict(self, x, batch_size, verbose):
+            self.inputs.append(x)
+            # Frame index as embedding value
+            return numpy.repeat(numpy.arange(len(x), dtype=float)[:, None], 3, axis=1)
+
+    with mock.patch.dict(sys.modules, {'edgel3': _embedding_module('edgel3')}):
+        model = Model()
+        extractor = dcase_util.features.EdgeL3Extractor(fs=44100, hop_length_seconds=0.1, model=model)
+        embeddings = extractor.extract_batch(signals=[numpy.zeros(44100), numpy.zeros(88200)])
+
+    # Signals are resampled to 48kHz and run through the model together
+    frame_counts = [
+        len(extractor.get_frames(y=dcase_util.utils.resample(y=numpy.zeros(length), orig_sr=44100, target_sr=48000)))
+        for length in [44100, 88200]
+    ]
+    nose.tools.eq_(len(model.inputs), 1)
+    nose.tools.eq_(model.inputs[0].shape, (sum(frame_counts), 1, 48000))
+    nose.tools.eq_([embedding.shape for embedding in embeddings], [(3, frame_counts[0]), (3, frame_counts[1])])
+    nose.tools.eq_(embeddings[1][0, 0], frame_counts[0])
@@ -0,0 +1,71 @@
+""" Unit tests for FeatureCache """
+
+import nose.tools
+import dcase_util
+import numpy
+import os
+import tempfile
+import shutil
+
+
+def test_get_set():
+    tmp_path = tempfile.mkdtemp()
+    try:
+        cache = dcase_util.features.FeatureCache(path=tmp_path)
+        audio_container = dcase_util.utils.Example.audio_container().mixdown()
+        extractor = dcase_util.features.MelExtractor()
+
+        key = cache.key(data=audio_container, extractor=extractor)
+        nose.tools.eq_(key, cache.key(data=audio_container, extractor=dcase_util.features.MelExtractor()))
+        nose.tools.ok_(key != cache.key(data=audio_container, extractor=dcase_util.features.MelExtractor(n_mels=20)))
+        nose.tools.ok_(key != cache.key(data=audio_container.data * 0.5, extractor=extractor))
+        nose.tools.ok_(cache.get(key) is None)
+
+        mel = extractor.extract(audio_container)
+        cache.set(key, mel)
+        nose.tools.ok_(key in cache)
+        numpy.testing.assert_array_equal(cache.get(key), mel)
+        nose.tools.eq_(cache.hits, 1)
+        nose.tools.eq_(cache.misses, 1)
+
+        # Other cache instance on the same path sees the entry
+        numpy.testing.assert_array_equal(dcase_util.features.FeatureCache(path=tmp_path).get(key), mel)
+
+        # No temporary files left
+        nose.tools.eq_(len(cache.entries()), 1)
+        nose.tools.eq_(sum([len(files) for _, _, files in os.walk(tmp_path)]), 1)
+
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+def test_evict():
+    tmp_path = tempfile.mkdtemp()
+    try:
+        data = numpy.zeros((100, 100))
+        cache = dcase_util.features.FeatureCache(path=tmp_path, size_limit=int(data.nbytes * 3.5))
+
+        for index in range(0, 3):
+            cache.set(str(index) * 32, data)
+            os.utime(cache.filename(str(index) * 32), (index, index))
+
+        # Entry 0 used recently
+        cache.get('0' * 32)
+        cache.set('3' * 32, data)
+
+        nose.tools.ok_(cache.size() <= cache.size_limit)
+        nose.tools.ok_('0' * 32 in cache)
+        nose.tools.ok_('1' * 32 not in cache)
+        nose.tools.ok_('3' * 32 in cache)
+
+        cache.clear()
+        nose.tools.eq_(cache.size(), 0)
+
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+@nose.tools.raises(ValueError)
+def test_unknown_key_type():
+    with dcase_util.utils.DisableLogger():
+        dcase_util.features.FeatureCache(path='cache', key_type='hash')
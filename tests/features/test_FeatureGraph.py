@@ -0,0 +1,77 @@
+""" Unit tests for FeatureGraph """
+
+import nose.tools
+import dcase_util
+import numpy
+
+
+def test_extract():
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+
+    graph = dcase_util.features.FeatureGraph(y=audio_container.data)
+    features = graph.extract(
+        extractors={
+            'mel': {'spectrogram_type': 'power', 'logarithmic': False},
+            'mfcc': {'omit_zeroth': True},
+            'mfcc_delta': {},
+            'mfcc_acceleration': {},
+            'rmse': {},
+            'centroid': {},
+            'zcr': {}
+        }
+    )
+
+    # Spectrogram, power spectrogram, mel from both, log mel, mfcc, delta and acceleration
+    nose.tools.eq_(len(graph), 8)
+
+    numpy.testing.assert_allclose(
+        features['mel'],
+        dcase_util.features.MelExtractor(spectrogram_type='power', logarithmic=False).extract(y=audio_container)
+    )
+    numpy.testing.assert_allclose(
+        features['mfcc'],
+        dcase_util.features.MfccStaticExtractor(omit_zeroth=True).extract(y=audio_container)
+    )
+    numpy.testing.assert_allclose(
+        features['mfcc_delta'],
+        dcase_util.features.MfccDeltaExtractor().extract(y=audio_container)
+    )
+    numpy.testing.assert_allclose(
+        features['mfcc_acceleration'],
+        dcase_util.features.MfccAccelerationExtractor().extract(y=audio_container)
+    )
+    numpy.testing.assert_allclose(
+        features['rmse'],
+        dcase_util.features.RMSEnergyExtractor().extract(y=audio_container)
+    )
+    numpy.testing.assert_allclose(
+        features['centroid'],
+        dcase_util.features.SpectralCentroidExtractor().extract(y=audio_container)
+    )
+    numpy.testing.assert_allclose(
+        features['zcr'],
+        dcase_util.features.ZeroCrossingRateExtractor().extract(y=audio_container)
+    )
+
+
+def test_extract_batch():
+    audio_container = dcase_util.utils.Example.audio_container()
+    signals = audio_container.data
+
+    extractors = {
+        'mfcc': dcase_util.features.MfccStaticExtractor(),
+        'mfcc_delta': dcase_util.features.MfccDeltaExtractor()
+    }
+    graph = dcase_util.features.FeatureGraph(signals=signals)
+    features = graph.extract(extractors=extractors)
+    nose.tools.eq_(graph.misses, 5)
+    nose.tools.eq_(features['mfcc'].shape, (2, 20, 101))
+
+    for signal_id, signal in enumerate(signals):
+        for label, extractor in extractors.items():
+            numpy.testing.assert_allclose(
+                features[label][signal_id],
+                extractor.extract(y=signal),
+                atol=1e-10
+            )
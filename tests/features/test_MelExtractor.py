@@ -2,6 +2,7 @@
 
 import nose.tools
 import dcase_util
+import numpy
 
 
 def test_extract():
@@ -28,3 +29,34 @@ def test_extract():
     nose.tools.eq_(mels.shape[0], params['n_mels'])
     nose.tools.eq_(mels.shape[1], 101)
 
+
+
+def test_extract_batch():
+    mel_extractor = dcase_util.features.MelExtractor()
+
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    signals = [audio_container.data, audio_container.data * 0.5, audio_container.data[:44100]]
+
+    mels = mel_extractor.extract_batch(signals=signals)
+    nose.tools.eq_(len(mels), 3)
+    nose.tools.eq_(mels[0].shape, (40, 101))
+    nose.tools.eq_(mels[2].shape, (40, 51))
+
+    for signal_id, y in enumerate(signals):
+        numpy.testing.assert_allclose(mels[signal_id], mel_extractor.extract(y=y), rtol=1e-6, atol=1e-8)
+
+
+def test_extract_dtype_policy():
+    mel_extractor = dcase_util.features.MelExtractor()
+
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    mels = mel_extractor.extract(y=audio_container)
+
+    with dcase_util.utils.DtypePolicy(compute='float32'):
+        mels_float32 = mel_extractor.extract(y=audio_container)
+        nose.tools.eq_(mels_float32.dtype, numpy.float32)
+        nose.tools.eq_(mel_extractor.extract_batch(signals=[audio_container.data])[0].dtype, numpy.float32)
+
+    numpy.testing.assert_allclose(mels_float32, mels, rtol=1e-4, atol=1e-6)
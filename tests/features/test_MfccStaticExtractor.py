@@ -2,6 +2,8 @@
 
 import nose.tools
 import dcase_util
+import librosa
+import numpy
 
 
 def test_extract():
@@ -28,3 +30,44 @@ def test_extract():
 
     nose.tools.eq_(mfccs.shape[0], params['n_mfccs'])
     nose.tools.eq_(mfccs.shape[1], 101)
+
+
+def test_extract_batch():
+    mfcc_extractor = dcase_util.features.MfccStaticExtractor()
+
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    signals = [audio_container.data, audio_container.data * 0.5]
+
+    mfccs = mfcc_extractor.extract_batch(signals=signals)
+    nose.tools.eq_(len(mfccs), 2)
+
+    for signal_id, y in enumerate(signals):
+        numpy.testing.assert_allclose(mfccs[signal_id], mfcc_extractor.extract(y=y), rtol=1e-6, atol=1e-6)
+
+
+def test_filterbank_cache():
+    cache = dcase_util.features.filterbank_cache
+    hits = cache.info()['hits'].get('mel', 0)
+
+    mfcc_extractor1 = dcase_util.features.MfccStaticExtractor(n_mels=33, n_mfcc=17)
+    mfcc_extractor2 = dcase_util.features.MfccStaticExtractor(n_mels=33, n_mfcc=17)
+
+    nose.tools.ok_(mfcc_extractor1.mel_basis is mfcc_extractor2.mel_basis)
+    nose.tools.ok_(mfcc_extractor1.dct_basis is mfcc_extractor2.dct_basis)
+    nose.tools.ok_(mfcc_extractor1.window is mfcc_extractor2.window)
+    nose.tools.ok_(cache.info()['hits']['mel'] > hits)
+    nose.tools.eq_(mfcc_extractor1.mel_basis.flags.writeable, False)
+
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    mel_spectrum = numpy.dot(
+        mfcc_extractor1.mel_basis,
+        mfcc_extractor1.get_spectrogram(y=audio_container)
+    )
+
+    numpy.testing.assert_allclose(
+        mfcc_extractor1.extract(y=audio_container),
+        librosa.feature.mfcc(S=librosa.power_to_db(mel_spectrum), n_mfcc=17),
+        atol=1e-8
+    )
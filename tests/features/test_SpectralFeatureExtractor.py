@@ -3,6 +3,7 @@
 import nose.tools
 from nose.tools import *
 import dcase_util
+import numpy
 
 
 def test_get_spectrogram():
@@ -51,3 +52,125 @@ def test_non_mono():
         sfe = dcase_util.features.SpectralFeatureExtractor(**params)
         audio_container = dcase_util.utils.Example.audio_container()
         sfe.get_spectrogram(y=audio_container)
+
+
+def test_get_spectrogram_batch():
+    sfe = dcase_util.features.SpectralFeatureExtractor()
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    signals = [audio_container.data, audio_container.data * 0.5, audio_container.data[::-1]]
+
+    for spectrogram_type in ['magnitude', 'power']:
+        spec = sfe.get_spectrogram_batch(signals=signals, spectrogram_type=spectrogram_type)
+        nose.tools.eq_(spec.shape, (3, 1025, 101))
+
+        for signal_id, y in enumerate(signals):
+            numpy.testing.assert_allclose(
+                spec[signal_id],
+                sfe.get_spectrogram(y=y, spectrogram_type=spectrogram_type),
+                rtol=1e-6, atol=1e-8
+            )
+
+
+@raises(ValueError)
+def test_get_spectrogram_batch_length():
+    with dcase_util.utils.DisableLogger():
+        sfe = dcase_util.features.SpectralFeatureExtractor()
+        audio_container = dcase_util.utils.Example.audio_container()
+        audio_container.mixdown()
+        sfe.get_spectrogram_batch(signals=[audio_container.data, audio_container.data[:1000]])
+
+
+def test_get_spectrogram_stream():
+    sfe = dcase_util.features.SpectralFeatureExtractor()
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    y = audio_container.data
+
+    for block_length in [1, 1000, 2048, 30000, len(y)]:
+        blocks = (y[i:i + block_length] for i in range(0, len(y), block_length))
+        spec = numpy.concatenate(list(sfe.get_spectrogram_stream(blocks=blocks)), axis=-1)
+        numpy.testing.assert_allclose(spec, sfe.get_spectrogram(y=y), rtol=1e-10, atol=1e-12)
+
+
+def test_extract_stream():
+    audio_filename = dcase_util.utils.Example.audio_filename()
+    audio_container = dcase_util.containers.AudioContainer().load(filename=audio_filename, mono=True)
+
+    for extractor in [dcase_util.features.MelExtractor(),
+                      dcase_util.features.MfccDeltaExtractor(),
+                      dcase_util.features.MfccAccelerationExtractor()]:
+        features = numpy.concatenate(
+            list(extractor.extract_stream(filename=audio_filename, block_length_samples=4096)),
+            axis=-1
+        )
+        numpy.testing.assert_allclose(features, extractor.extract(y=audio_container.data), rtol=1e-7, atol=1e-10)
+
+
+@raises(ValueError)
+def test_extract_stream_fs():
+    with dcase_util.utils.DisableLogger():
+        mel = dcase_util.features.MelExtractor(fs=16000)
+        list(mel.extract_stream(filename=dcase_util.utils.Example.audio_filename()))
+
+
+def test_extract_stream_no_input():
+    for extractor in [dcase_util.features.MelExtractor(),
+                      dcase_util.features.MfccDeltaExtractor(),
+                      dcase_util.features.MfccAccelerationExtractor()]:
+        with dcase_util.utils.DisableLogger():
+            nose.tools.assert_raises(ValueError, list, extractor.extract_stream())
+
+
+def test_extract_stream_dtype_policy():
+    audio_filename = dcase_util.utils.Example.audio_filename()
+    with dcase_util.utils.DtypePolicy(compute='float32'):
+        for extractor in [dcase_util.features.MelExtractor(),
+                          dcase_util.features.MfccDeltaExtractor(),
+                          dcase_util.features.MfccAccelerationExtractor()]:
+            for features in extractor.extract_stream(filename=audio_filename, block_length_samples=16384):
+                nose.tools.eq_(features.dtype, numpy.float32)
+
+
+def test_extract_stream_dynamic_range():
+    import os
+    import tempfile
+
+    # Loud noise followed by noise 100 dB lower, decibel clipping is relative to the loud part
+    random_state = numpy.random.RandomState(0)
+    y = numpy.concatenate((random_state.uniform(-0.5, 0.5, 44100), random_state.uniform(-0.5, 0.5, 3 * 44100) * 1e-5))
+
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.wav', dir=tempfile.gettempdir(), delete=False)
+    try:
+        dcase_util.containers.AudioContainer(data=y, fs=44100).save(filename=tmp.name, bit_depth=32)
+        audio_container = dcase_util.containers.AudioContainer().load(filename=tmp.name, mono=True)
+
+        for extractor in [dcase_util.features.MfccStaticExtractor(spectrogram_type='power'),
+                          dcase_util.features.MfccDeltaExtractor(spectrogram_type='power'),
+                          dcase_util.features.MfccAccelerationExtractor(spectrogram_type='power')]:
+            reference = extractor.extract(y=audio_container.data)
+            for block_length in [4096, 65536]:
+                features = numpy.concatenate(
+                    list(extractor.extract_stream(filename=tmp.name, block_length_samples=block_length)),
+                    axis=-1
+                )
+                numpy.testing.assert_allclose(features, reference, rtol=1e-7, atol=1e-6)
+
+            # Blocks are clipped relative to the running maximum, output does not depend on block length
+            features = [
+                numpy.concatenate(
+                    list(extractor.extract_stream(
+                        blocks=(audio_container.data[i:i + block_length]
+                                for i in range(0, audio_container.length, block_length))
+                    )),
+                    axis=-1
+                ) for block_length in [4096, 65536]
+            ]
+            numpy.testing.assert_allclose(features[0], features[1], rtol=1e-7, atol=1e-6)
+
+    finally:
+        try:
+            tmp.close()
+            os.unlink(tmp.name)
+        except:
+            pass
@@ -0,0 +1,132 @@
+""" Unit tests for StreamingFeatureExtractor """
+
+import nose.tools
+from nose.tools import *
+import dcase_util
+import numpy
+import librosa
+
+
+def test_push():
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    y = audio_container.data
+
+    mel = dcase_util.features.MelExtractor()
+    stream = dcase_util.features.StreamingFeatureExtractor(extractor=mel)
+
+    features = [stream.push(y[i:i + 333]) for i in range(0, len(y), 333)]
+    nose.tools.eq_(features[0].shape, (40, 0))
+
+    features = numpy.concatenate(features, axis=-1)
+    numpy.testing.assert_allclose(
+        features,
+        mel.extract_from_spectrogram(mel.get_spectrogram(y=y, center=False)),
+        rtol=1e-10, atol=1e-10
+    )
+
+    # Same output after reset
+    stream.reset()
+    numpy.testing.assert_allclose(stream.push(y), features)
+
+
+def test_delta():
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    y = audio_container.data
+
+    delta = dcase_util.features.MfccDeltaExtractor()
+    static = dcase_util.features.MfccStaticExtractor.extract_from_spectrogram(
+        delta, delta.get_spectrogram(y=y, center=False)
+    )
+    reference = librosa.feature.delta(static, width=delta.width, order=1, axis=-1)
+
+    stream = dcase_util.features.StreamingFeatureExtractor(extractor=delta)
+    nose.tools.eq_(stream.lookahead, 4)
+
+    features = numpy.concatenate([stream.push(y[i:i + 1000]) for i in range(0, len(y), 1000)], axis=-1)
+    nose.tools.eq_(features.shape[1], static.shape[1] - 4)
+
+    features = numpy.concatenate([features, stream.flush()], axis=-1)
+    nose.tools.eq_(features.shape, reference.shape)
+
+    # Interior frames match offline delta
+    numpy.testing.assert_allclose(features[:, 4:-4], reference[:, 4:-4], rtol=1e-10, atol=1e-10)
+
+    stream = dcase_util.features.StreamingFeatureExtractor(extractor=delta, lookahead=1)
+    nose.tools.eq_(stream.push(y).shape[1], static.shape[1] - 1)
+    nose.tools.eq_(stream.latency_samples, delta.n_fft + delta.hop_length_samples)
+
+
+def test_block_length():
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    y = audio_container.data
+
+    for extractor in [dcase_util.features.MfccStaticExtractor(), dcase_util.features.MfccDeltaExtractor()]:
+        stream = dcase_util.features.StreamingFeatureExtractor(extractor=extractor)
+        hop = extractor.hop_length_samples
+        n_fft = extractor.n_fft
+
+        # One frame per push
+        frame_features = [stream.push(y[:n_fft])] + [
+            stream.push(y[i:i + hop]) for i in range(n_fft, len(y), hop)
+        ]
+        frame_features = numpy.concatenate(frame_features + [stream.flush()], axis=-1)
+
+        # One second per push
+        stream.reset()
+        second_features = [stream.push(y[i:i + extractor.fs]) for i in range(0, len(y), extractor.fs)]
+        second_features = numpy.concatenate(second_features + [stream.flush()], axis=-1)
+
+        nose.tools.eq_(frame_features.shape, second_features.shape)
+        numpy.testing.assert_allclose(frame_features, second_features, rtol=1e-10, atol=1e-10)
+
+    # Without clipping, static features match offline extraction without clipping
+    mfcc = dcase_util.features.MfccStaticExtractor()
+    stream = dcase_util.features.StreamingFeatureExtractor(extractor=mfcc, top_db=None)
+    mel_spectrum = numpy.matmul(mfcc.mel_basis, mfcc.get_spectrogram(y=y, center=False))
+    numpy.testing.assert_allclose(
+        stream.push(y),
+        numpy.matmul(mfcc.dct_basis, librosa.power_to_db(mel_spectrum, top_db=None)),
+        rtol=1e-8, atol=1e-8
+    )
+
+
+
+def test_max_frames():
+    audio_container = dcase_util.utils.Example.audio_container()
+    audio_container.mixdown()
+    y = audio_container.data
+
+    for extractor in [dcase_util.features.MelExtractor(), dcase_util.features.MfccAccelerationExtractor(),
+                      dcase_util.features.RMSEnergyExtractor()]:
+        reference = dcase_util.features.StreamingFeatureExtractor(extractor=extractor)
+        reference = numpy.concatenate([reference.push(y), reference.flush()], axis=-1)
+
+        # Pushes longer than max_frames are processed in chunks
+        stream = dcase_util.features.StreamingFeatureExtractor(extractor=extractor, max_frames=3)
+        features = numpy.concatenate([stream.push(y), stream.flush()], axis=-1)
+        numpy.testing.assert_allclose(features, reference, rtol=1e-10, atol=1e-10)
+
+        # Features written to the given output buffer
+        stream.reset()
+        out = numpy.zeros((stream.n_features, reference.shape[1]))
+        features = stream.push(y, out=out)
+        nose.tools.eq_(numpy.shares_memory(features, out), True)
+        numpy.testing.assert_allclose(features, reference[:, :features.shape[1]], rtol=1e-10, atol=1e-10)
+
+
+@raises(ValueError)
+def test_output_buffer():
+    with dcase_util.utils.DisableLogger():
+        stream = dcase_util.features.StreamingFeatureExtractor(extractor=dcase_util.features.MelExtractor())
+        stream.push(numpy.zeros(stream.extractor.n_fft), out=numpy.zeros((stream.n_features, 0)))
+
+@raises(ValueError)
+def test_lookahead():
+    with dcase_util.utils.DisableLogger():
+        dcase_util.features.StreamingFeatureExtractor(
+            extractor=dcase_util.features.MfccAccelerationExtractor(width=5),
+            lookahead=5
+        )
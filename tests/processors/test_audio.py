@@ -54,3 +54,23 @@ def test_MonoAudioReadingProcessor():
     nose.tools.eq_(audio.fs, 44100)
     nose.tools.eq_(len(audio.data.shape), 1)
     nose.tools.eq_(audio.length, 441001)
+
+
+def test_AudioReadingProcessor_process_batch():
+    processor = dcase_util.processors.MonoAudioReadingProcessor()
+    filename = dcase_util.utils.Example.audio_filename()
+    audios = list(processor.process_batch(
+        items=[
+            filename,
+            {
+                'filename': filename,
+                'focus_start_seconds': 1.0,
+                'focus_duration_seconds': 2.0
+            }
+        ],
+        n_jobs=2
+    ))
+
+    nose.tools.eq_(len(audios), 2)
+    nose.tools.eq_(audios[0].length, 441001)
+    nose.tools.eq_(audios[1].freeze().length, 44100*2.0)
@@ -0,0 +1,117 @@
+import nose.tools
+import dcase_util
+import tempfile
+import shutil
+import os
+
+
+def test_BatchFeatureExtractor():
+    audio_filename = dcase_util.utils.Example().audio_filename()
+    tmp_dir = tempfile.mkdtemp()
+
+    try:
+        extractor = dcase_util.processors.BatchFeatureExtractor(
+            processing_chain=[
+                {
+                    'processor_name': 'dcase_util.processors.MonoAudioReadingProcessor',
+                    'init_parameters': {
+                        'fs': 44100
+                    }
+                },
+                {
+                    'processor_name': 'dcase_util.processors.MelExtractorProcessor',
+                    'init_parameters': {
+                        'fs': 44100
+                    }
+                }
+            ],
+            output_path=tmp_dir,
+            output_extension='npy',
+            n_jobs=2,
+            disable_progress_bar=True,
+            log_progress=False
+        )
+
+        report = extractor.extract(items=[audio_filename])
+        nose.tools.eq_(report['processed'], [audio_filename])
+        nose.tools.eq_(report['failed'], {})
+
+        feature_filename = extractor.output_filename(filename=audio_filename)
+        nose.tools.eq_(os.path.isfile(feature_filename), True)
+        nose.tools.eq_(extractor.is_up_to_date(filename=audio_filename), True)
+
+        features = dcase_util.containers.FeatureContainer().load(filename=feature_filename)
+        nose.tools.eq_(features.shape, (40, 501))
+
+        # Up to date, skipped
+        report = extractor.extract(items=[audio_filename])
+        nose.tools.eq_(report['processed'], [])
+        nose.tools.eq_(report['skipped'], [audio_filename])
+
+        # Missing file reported as failed
+        report = extractor.extract(items=[os.path.join(tmp_dir, 'missing.wav')])
+        nose.tools.eq_(len(report['failed']), 1)
+
+        # Files with the same basename in different directories
+        with dcase_util.utils.DisableLogger():
+            nose.tools.assert_raises(
+                ValueError,
+                extractor.extract,
+                [os.path.join(tmp_dir, 'a', 'audio.wav'), os.path.join(tmp_dir, 'b', 'audio.wav')]
+            )
+
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+def test_BatchFeatureExtractor_repository():
+    audio_filename = dcase_util.utils.Example().audio_filename()
+    tmp_dir = tempfile.mkdtemp()
+
+    try:
+        extractor = dcase_util.processors.BatchFeatureExtractor(
+            processing_chain=[
+                {
+                    'processor_name': 'dcase_util.processors.MonoAudioReadingProcessor',
+                    'init_parameters': {
+                        'fs': 44100
+                    }
+                },
+                {
+                    'processor_name': 'dcase_util.processors.RepositoryFeatureExtractorProcessor',
+                    'init_parameters': {
+                        'parameters': {
+                            'mel': {},
+                            'mfcc': {}
+                        }
+                    }
+                }
+            ],
+            output_path=tmp_dir,
+            output_extension='npy',
+            disable_progress_bar=True,
+            log_progress=False
+        )
+
+        extractor.extract(items=[audio_filename])
+        nose.tools.eq_(extractor.is_up_to_date(filename=audio_filename), True)
+
+        repository = dcase_util.containers.FeatureRepository().load(
+            filename=extractor.output_filename(filename=audio_filename)
+        )
+        nose.tools.eq_(sorted(repository.labels), ['mel', 'mfcc'])
+
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+@nose.tools.raises(ValueError)
+def test_BatchFeatureExtractor_wrong_chain():
+    with dcase_util.utils.DisableLogger():
+        dcase_util.processors.BatchFeatureExtractor(
+            processing_chain=[
+                {
+                    'processor_name': 'dcase_util.processors.MonoAudioReadingProcessor'
+                }
+            ]
+        )
@@ -1,7 +1,9 @@
 import nose.tools
 import dcase_util
 import tempfile
+import shutil
 import os
+import numpy
 
 
 def test_RepositoryFeatureExtractorProcessor():
@@ -148,3 +150,165 @@ def test_writing_reading():
         except:
             pass
 
+
+
+def test_reading_memory_mapped():
+    container = dcase_util.utils.Example.feature_container()
+
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.npy', dir=tempfile.gettempdir(), delete=False)
+    try:
+        container.save(filename=tmp.name)
+
+        reader = dcase_util.processors.FeatureReadingProcessor()
+        data = reader.process(filename=tmp.name, focus_start=10, focus_stop=20)
+        nose.tools.eq_(data.memory_mapped, True)
+        nose.tools.eq_(data.get_focused().shape, (container.shape[0], 10))
+
+        reader = dcase_util.processors.FeatureReadingProcessor(memory_map=False)
+        data = reader.process(filename=tmp.name)
+        nose.tools.eq_(data.memory_mapped, False)
+        nose.tools.eq_(data.shape, container.shape)
+
+    finally:
+        try:
+            tmp.close()
+            os.unlink(tmp.name)
+            os.unlink(tmp.name + '.cpickle')
+        except:
+            pass
+
+
+def test_reading_store():
+    container = dcase_util.utils.Example.feature_container()
+    repository = dcase_util.utils.Example.feature_repository()
+
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        store_filename = os.path.join(tmp_dir, 'store.cpickle')
+        store = dcase_util.containers.FeatureStore(filename=store_filename)
+        store.set_container(key='file1.wav', container=container)
+        store.set_repository(key='file2.wav', repository=repository)
+        store.save()
+
+        reader = dcase_util.processors.FeatureReadingProcessor(store=store_filename)
+        data = reader.process(filename='file1.wav', focus_start=10, focus_stop=20)
+        nose.tools.eq_(data.get_focused().shape, (container.shape[0], 10))
+
+        reader = dcase_util.processors.RepositoryFeatureReadingProcessor(store=store_filename)
+        data = reader.process(filename='file2.wav')
+        nose.tools.eq_(sorted(data.labels), sorted(repository.labels))
+
+    finally:
+        for item in os.listdir(tmp_dir):
+            os.unlink(os.path.join(tmp_dir, item))
+
+        os.rmdir(tmp_dir)
+
+
+def test_RepositoryFeatureExtractorProcessor_shared_spectrogram():
+    audio = dcase_util.utils.Example.audio_container()
+    extractor = dcase_util.processors.RepositoryFeatureExtractorProcessor(
+        parameters={
+            'mel': {},
+            'mfcc': {
+                'spectrogram_type': 'power'
+            },
+            'rmse': {},
+            'centroid': {}
+        }
+    )
+    processed = extractor.process(data=audio)
+
+    # Input is not modified
+    nose.tools.eq_(audio.focus_channel, None)
+
+    for stream_id in range(0, audio.streams):
+        audio.focus_channel = stream_id
+        numpy.testing.assert_allclose(
+            processed['mel'][stream_id].data,
+            dcase_util.features.MelExtractor().extract(y=audio.get_focused())
+        )
+        numpy.testing.assert_allclose(
+            processed['mfcc'][stream_id].data,
+            dcase_util.features.MfccStaticExtractor(spectrogram_type='power').extract(y=audio.get_focused())
+        )
+        numpy.testing.assert_allclose(
+            processed['rmse'][stream_id].data,
+            dcase_util.features.RMSEnergyExtractor().extract(y=audio.get_focused())
+        )
+        numpy.testing.assert_allclose(
+            processed['centroid'][stream_id].data,
+            dcase_util.features.SpectralCentroidExtractor().extract(y=audio.get_focused())
+        )
+
+
+def test_RepositoryFeatureExtractorProcessor_multichannel():
+    audio = dcase_util.utils.Example.audio_container_ch4()
+    audio.set_focus(start_seconds=0.5, duration_seconds=1.0)
+    extractor = dcase_util.processors.RepositoryFeatureExtractorProcessor(
+        parameters={
+            'mel': {},
+            'mfcc_delta': {},
+            'zcr': {}
+        }
+    )
+    processed = extractor.process(data=audio)
+    nose.tools.eq_(sorted(processed['mel'].keys()), [0, 1, 2, 3])
+
+    focused = audio.get_focused()
+    for stream_id in range(0, audio.streams):
+        nose.tools.eq_(processed['mel'][stream_id].data.shape, (40, 51))
+        numpy.testing.assert_allclose(
+            processed['mel'][stream_id].data,
+            dcase_util.features.MelExtractor().extract(y=focused[stream_id]),
+            rtol=1e-6, atol=1e-8
+        )
+        numpy.testing.assert_allclose(
+            processed['mfcc_delta'][stream_id].data,
+            dcase_util.features.MfccDeltaExtractor().extract(y=focused[stream_id]),
+            rtol=1e-6, atol=1e-6
+        )
+        numpy.testing.assert_allclose(
+            processed['zcr'][stream_id].data,
+            dcase_util.features.ZeroCrossingRateExtractor().extract(y=focused[stream_id])
+        )
+
+
+def test_RepositoryFeatureExtractorProcessor_feature_cache():
+    tmp_path = tempfile.mkdtemp()
+    try:
+        audio = dcase_util.utils.Example.audio_container()
+        parameters = {
+            'mel': {},
+            'mfcc': {}
+        }
+        processed = dcase_util.processors.RepositoryFeatureExtractorProcessor(
+            parameters=parameters,
+            feature_cache_path=tmp_path
+        ).process(data=audio)
+
+        # Other experiment with overlapping parameters
+        parameters['zcr'] = {}
+        extractor = dcase_util.processors.RepositoryFeatureExtractorProcessor(
+            parameters=parameters,
+            feature_cache_path=tmp_path
+        )
+        cached = extractor.process(data=audio)
+        nose.tools.eq_(extractor.get_feature_cache().hits, 4)
+        nose.tools.eq_(extractor.get_feature_cache().misses, 2)
+
+        for label in ['mel', 'mfcc']:
+            for stream_id in range(0, audio.channels):
+                numpy.testing.assert_array_equal(cached[label][stream_id].data, processed[label][stream_id].data)
+
+        nose.tools.eq_(cached['zcr'][0].shape, (1, 101))
+
+        audio.mixdown()
+        extractor = dcase_util.processors.MelExtractorProcessor(feature_cache_path=tmp_path)
+        extractor.process(data=audio)
+        mel = extractor.process(data=audio)
+        nose.tools.eq_(extractor.get_feature_cache().hits, 1)
+        numpy.testing.assert_array_equal(mel.data, dcase_util.features.MelExtractor().extract(audio))
+
+    finally:
+        shutil.rmtree(tmp_path)
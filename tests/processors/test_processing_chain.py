@@ -25,3 +25,289 @@ def test_ProcessingChain():
         duration_seconds=2.0
     )
     nose.tools.eq_(data.shape, (40, 501))
+
+
+def test_process_in_place():
+    import numpy
+
+    chain = dcase_util.processors.ProcessingChain()
+    chain.push_processor(
+        processor_name='dcase_util.processors.NormalizationProcessor',
+        init_parameters={'mean': numpy.ones((40, 1)), 'std': 2 * numpy.ones((40, 1))}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.AggregationProcessor',
+        init_parameters={'recipe': ['mean'], 'win_length_frames': 10, 'hop_length_frames': 1}
+    )
+
+    container = dcase_util.utils.Example.feature_container()
+    original = container.data.copy()
+
+    data = chain.process(data=container)
+    data_in_place = chain.process(data=container, in_place=True)
+
+    # Input is not modified
+    numpy.testing.assert_array_equal(container.data, original)
+    numpy.testing.assert_array_equal(data_in_place.data, data.data)
+
+    results = chain.benchmark_in_place(data=container, repetitions=1)
+    nose.tools.eq_(results['copy']['copies'], 2)
+    nose.tools.eq_(results['in_place']['copies'], 1)
+    nose.tools.eq_(results['in_place']['copied_bytes'] < results['copy']['copied_bytes'], True)
+
+
+def test_process_batch():
+    import numpy
+
+    chain = dcase_util.processors.ProcessingChain()
+    chain.push_processor(
+        processor_name='dcase_util.processors.MonoAudioReadingProcessor',
+        init_parameters={'fs': 44100}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.MelExtractorProcessor',
+        init_parameters={}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.NormalizationProcessor',
+        init_parameters={'mean': numpy.ones((40, 1)), 'std': 2 * numpy.ones((40, 1))}
+    )
+
+    items = [
+        {
+            'filename': dcase_util.utils.Example().audio_filename(),
+            'focus_start_seconds': focus_start_seconds,
+            'focus_duration_seconds': 1.0
+        } for focus_start_seconds in [0.0, 0.5, 1.0]
+    ]
+
+    data = chain.process_batch(items=items)
+    nose.tools.eq_(len(data), 3)
+    for item, item_data in zip(items, data):
+        numpy.testing.assert_allclose(item_data.data, chain.process(**item).data, rtol=1e-6, atol=1e-8)
+
+    # Audio given directly
+    chain.pop(0)
+    audio = dcase_util.containers.AudioContainer().load(filename=dcase_util.utils.Example().audio_filename(), mono=True)
+    audio_data = chain.process_batch(items=[{'data': audio}, {'data': audio}], in_place=True)
+    nose.tools.eq_(len(audio_data), 2)
+    numpy.testing.assert_allclose(audio_data[1].data, chain.process(data=audio).data, rtol=1e-6, atol=1e-8)
+
+
+def test_map():
+    import numpy
+
+    chain = dcase_util.processors.ProcessingChain()
+    chain.push_processor(
+        processor_name='dcase_util.processors.MonoAudioReadingProcessor',
+        init_parameters={'fs': 44100}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.MelExtractorProcessor',
+        init_parameters={}
+    )
+
+    items = [
+        {
+            'filename': dcase_util.utils.Example().audio_filename(),
+            'focus_start_seconds': focus_start_seconds,
+            'focus_duration_seconds': 1.0
+        } for focus_start_seconds in [0.0, 0.5, 1.0, 1.5, 2.0]
+    ]
+    items[2] = {'filename': 'missing.wav'}
+
+    for backend, chunk_size in [('thread', 1), ('thread', 2), ('process', 2)]:
+        with dcase_util.utils.DisableLogger():
+            data = list(chain.map(items=items, workers=2, backend=backend, chunk_size=chunk_size))
+
+        nose.tools.eq_(len(data), 5)
+        nose.tools.eq_(data[2], None)
+        numpy.testing.assert_allclose(data[3].data, chain.process(**items[3]).data)
+
+    # Data type is applied in the workers only
+    valid_items = [item for item in items if item['filename'] != 'missing.wav']
+    data = list(chain.map(items=valid_items * 2, workers=4, backend='thread', dtype='float32'))
+    nose.tools.eq_(set([item.data.dtype for item in data]), set([numpy.dtype('float32')]))
+    nose.tools.eq_(dcase_util.utils.compute_dtype(), None)
+    nose.tools.eq_(chain.process(**items[0]).data.dtype, numpy.float64)
+
+
+@nose.tools.raises(ValueError)
+def test_map_unknown_backend():
+    with dcase_util.utils.DisableLogger():
+        list(dcase_util.processors.ProcessingChain().map(items=[], backend='cluster'))
+
+
+def test_profiler():
+    import json
+    import tempfile
+    import os
+
+    chain = dcase_util.processors.ProcessingChain()
+    chain.push_processor(
+        processor_name='dcase_util.processors.MonoAudioReadingProcessor',
+        init_parameters={'fs': 44100}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.MelExtractorProcessor',
+        init_parameters={'n_mels': 20}
+    )
+
+    item = {
+        'filename': dcase_util.utils.Example().audio_filename()
+    }
+
+    with dcase_util.processors.ProcessingChainProfiler() as profiler:
+        chain.process(**item)
+        chain.process(**item)
+        chain.process_batch(items=[item, item])
+
+    chain.process(**item)
+
+    report = profiler.report()
+    nose.tools.eq_(list(report.keys()), ['0:MonoAudioReadingProcessor', '1:MelExtractorProcessor'])
+    nose.tools.eq_(report['1:MelExtractorProcessor']['calls'], 3)
+    nose.tools.eq_(report['1:MelExtractorProcessor']['items'], 4)
+    nose.tools.eq_(report['1:MelExtractorProcessor']['shape'], [20, 501])
+    nose.tools.eq_(report['1:MelExtractorProcessor']['dtype'], 'float64')
+    nose.tools.eq_(report['1:MelExtractorProcessor']['peak_mean'], None)
+    nose.tools.ok_(report['1:MelExtractorProcessor']['wall_p99'] >= report['1:MelExtractorProcessor']['wall_p50'])
+
+    nose.tools.ok_('1:MelExtractorProcessor' in profiler.to_string())
+
+    tmp = tempfile.NamedTemporaryFile('r+', suffix='.json', dir=tempfile.gettempdir(), delete=False)
+    try:
+        profiler.save_chrome_trace(tmp.name)
+        with open(tmp.name) as file_handle:
+            events = json.load(file_handle)['traceEvents']
+
+        nose.tools.eq_(len(events), 6)
+        nose.tools.eq_(events[0]['ph'], 'X')
+
+    finally:
+        tmp.close()
+        os.unlink(tmp.name)
+
+
+def test_step_cache():
+    import numpy
+    import tempfile
+    import shutil
+
+    chain = dcase_util.processors.ProcessingChain()
+    chain.push_processor(
+        processor_name='dcase_util.processors.MonoAudioReadingProcessor',
+        init_parameters={'fs': 44100}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.MelExtractorProcessor',
+        init_parameters={'n_mels': 20}
+    )
+    chain.push_processor(
+        processor_name='dcase_util.processors.NormalizationProcessor',
+        init_parameters={'mean': numpy.zeros(20).tolist(), 'std': numpy.ones(20).tolist()},
+        deterministic=False
+    )
+    nose.tools.eq_(chain.deterministic_prefix_length(), 2)
+
+    item = {'filename': dcase_util.utils.Example().audio_filename()}
+    reference = chain.process(**item)
+
+    tmp_path = tempfile.mkdtemp()
+    try:
+        for path in [None, tmp_path]:
+            chain.enable_step_cache(path=path)
+
+            numpy.testing.assert_allclose(chain.process(**item).data, reference.data)
+            numpy.testing.assert_allclose(chain.process(in_place=True, **item).data, reference.data)
+            for data in chain.process_batch(items=[item, item]):
+                numpy.testing.assert_allclose(data.data, reference.data)
+
+            nose.tools.eq_(chain.step_cache.misses, 1)
+            nose.tools.eq_(chain.step_cache.hits, 3)
+            nose.tools.eq_(len(chain.step_cache), 1)
+
+    finally:
+        shutil.rmtree(tmp_path)
+
+    chain.disable_step_cache()
+    nose.tools.eq_(chain.step_cache, None)
+
+    # Stateful sequencer ends the prefix
+    chain = dcase_util.processors.ProcessingChain()
+    chain.push_processor(processor_name='dcase_util.processors.MonoAudioReadingProcessor')
+    chain.push_processor(processor_name='dcase_util.processors.MelExtractorProcessor')
+    chain.push_processor(processor_name='dcase_util.processors.SequencingProcessor')
+    chain.push_processor(processor_name='dcase_util.processors.DataShapingProcessor')
+    nose.tools.eq_(chain.deterministic_prefix_length(), 2)
+
+    # Processors are not deterministic unless marked
+    class CustomProcessor(dcase_util.processors.Processor):
+        pass
+
+    nose.tools.eq_(CustomProcessor.deterministic, False)
+
+
+def test_step_cache_processor_state():
+    import numpy
+    import os
+    import tempfile
+    import shutil
+
+    tmp_path = tempfile.mkdtemp()
+    try:
+        feature_filename = os.path.join(tmp_path, 'features.cpickle')
+        normalizer_filename = os.path.join(tmp_path, 'norm.cpickle')
+        cache_path = os.path.join(tmp_path, 'cache')
+
+        dcase_util.containers.FeatureContainer(data=numpy.ones((4, 10))).save(filename=feature_filename)
+        dcase_util.data.Normalizer(mean=numpy.zeros((4, 1)), std=numpy.ones((4, 1))).save(
+            filename=normalizer_filename
+        )
+
+        def process():
+            chain = dcase_util.processors.ProcessingChain()
+            chain.push_processor(processor_name='dcase_util.processors.FeatureReadingProcessor')
+            chain.push_processor(
+                processor_name='dcase_util.processors.NormalizationProcessor',
+                init_parameters={'filename': normalizer_filename}
+            )
+            chain.enable_step_cache(path=cache_path)
+            return chain.process(filename=feature_filename).data, chain.step_cache
+
+        data, cache = process()
+        numpy.testing.assert_allclose(data, numpy.ones((4, 10)))
+
+        # Same statistics, cached output is used
+        data, cache = process()
+        nose.tools.eq_(cache.hits, 1)
+
+        # Statistics loaded by the processor changed
+        dcase_util.data.Normalizer(mean=numpy.ones((4, 1)), std=numpy.ones((4, 1)) * 2).save(
+            filename=normalizer_filename
+        )
+        data, cache = process()
+        nose.tools.eq_(cache.hits, 0)
+        numpy.testing.assert_allclose(data, numpy.zeros((4, 10)))
+
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+def test_processor_class_errors():
+    chain = dcase_util.processors.ProcessingChain()
+    with dcase_util.utils.DisableLogger():
+        nose.tools.assert_raises(ValueError, chain.processor_class_reference, 'UnknownProcessor')
+        nose.tools.assert_raises(ValueError, chain.processor_class, 'UnknownProcessor')
+        nose.tools.assert_raises(
+            ValueError, dcase_util.processors.ProcessingChainItem, {'processor_name': 'UnknownProcessor'}
+        )
+
+    nose.tools.eq_(
+        chain.processor_class_reference('MelExtractorProcessor'),
+        dcase_util.processors.MelExtractorProcessor
+    )
+    nose.tools.ok_(
+        isinstance(chain.processor_class('MelExtractorProcessor'), dcase_util.processors.MelExtractorProcessor)
+    )
+
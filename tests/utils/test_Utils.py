@@ -2,6 +2,10 @@
 
 import nose.tools
 import dcase_util
+import numpy
+import os
+import shutil
+import tempfile
 from dcase_util.utils import get_parameter_hash, SimpleMathStringEvaluator
 
 
@@ -87,3 +91,172 @@ def test_is_int():
     nose.tools.eq_(dcase_util.utils.is_float(120.121), True)
     nose.tools.eq_(dcase_util.utils.is_float('str'), False)
 
+
+
+def test_get_audio_info():
+    filename = dcase_util.utils.Example.audio_filename()
+
+    info = dcase_util.utils.get_audio_info(filename=filename, use_cache=False)
+    nose.tools.eq_(info['fs'], 44100)
+    nose.tools.eq_(info['channels'], 2)
+    nose.tools.eq_(info['bit_depth'], 16)
+
+    cache = dcase_util.utils.AudioInfoCache()
+    nose.tools.eq_(cache.get(filename=filename), info)
+    nose.tools.eq_(cache.get(filename=filename), info)
+    nose.tools.eq_(cache.misses, 1)
+    nose.tools.eq_(cache.hits, 1)
+    nose.tools.eq_(filename in cache, True)
+
+
+def test_audio_info_cache():
+    tmp_path = tempfile.mkdtemp()
+    try:
+        audio = dcase_util.utils.Example.audio_container()
+        for name in ['a.wav', 'b.wav']:
+            audio.save(filename=os.path.join(tmp_path, name))
+
+        cache = dcase_util.utils.AudioInfoCache().prefetch(path=tmp_path, n_jobs=2)
+        nose.tools.eq_(len(cache), 2)
+        nose.tools.eq_(cache.get(filename=os.path.join(tmp_path, 'a.wav'))['duration_samples'], audio.length)
+        nose.tools.eq_(cache.misses, 2)
+
+        cache_filename = os.path.join(tmp_path, 'audio_info.cpickle')
+        cache.save(filename=cache_filename)
+
+        cache = dcase_util.utils.AudioInfoCache().load(filename=cache_filename)
+        nose.tools.eq_(cache.get(filename=os.path.join(tmp_path, 'b.wav'))['channels'], 2)
+        nose.tools.eq_(cache.hits, 1)
+
+        # Modified file is read again
+        dcase_util.containers.AudioContainer(data=audio.data[:, :1000], fs=44100).save(
+            filename=os.path.join(tmp_path, 'b.wav')
+        )
+        nose.tools.eq_(cache.get(filename=os.path.join(tmp_path, 'b.wav'))['duration_samples'], 1000)
+        nose.tools.eq_(cache.misses, 1)
+
+    finally:
+        shutil.rmtree(tmp_path)
+
+
+def test_resample():
+    y = numpy.random.RandomState(0).randn(2, 44100)
+    for res_type in dcase_util.utils.resampler_list():
+        nose.tools.eq_(dcase_util.utils.resample(y, orig_sr=44100, target_sr=16000, res_type=res_type).shape, (2, 16000))
+
+    dcase_util.utils.register_resampler('decimate', lambda y, orig_sr, target_sr, scale=False: y[..., ::2])
+    try:
+        nose.tools.eq_(dcase_util.utils.resample(y[0], orig_sr=44100, target_sr=22050, res_type='decimate').shape, (22050,))
+
+    finally:
+        del dcase_util.utils.resampling.resamplers['decimate']
+
+    results = dcase_util.utils.benchmark_resamplers(res_types=['polyphase', 'kaiser_fast'], duration_seconds=1.0, repetitions=1)
+    nose.tools.eq_(sorted(results.keys()), ['kaiser_fast', 'polyphase'])
+    nose.tools.eq_(results['polyphase']['snr_db'] > 40, True)
+
+
+def test_interval_index():
+    index = dcase_util.utils.IntervalIndex(onsets=[2.0, 0.6, 1.0], offsets=[2.5, 0.8, 3.0])
+    nose.tools.eq_(len(index), 3)
+    nose.tools.eq_(index.onsets, [0.6, 1.0, 2.0])
+    nose.tools.eq_(index.first_overlap(start=0.0, stop=0.5), None)
+    nose.tools.eq_(index.first_overlap(start=0.5, stop=0.6), 0)
+    nose.tools.eq_(index.first_overlap(start=0.8, stop=0.9), None)
+    nose.tools.eq_(index.first_overlap(start=2.6, stop=2.7), 1)
+    nose.tools.eq_(index.overlapping(start=0.7, stop=2.0), [0, 1, 2])
+    nose.tools.eq_(index.overlapping(start=3.0, stop=4.0), [])
+
+    index = dcase_util.utils.IntervalIndex.from_items([{'onset': 0.6, 'offset': 0.8}])
+    nose.tools.eq_(index.first_overlap(start=0.7, stop=0.75), 0)
+
+
+def test_dtype_policy():
+    nose.tools.eq_(dcase_util.utils.get_dtype_policy(), {'compute': None, 'storage': None})
+    nose.tools.eq_(dcase_util.utils.compute_dtype(default='float64'), numpy.float64)
+
+    x = numpy.zeros(10)
+    with dcase_util.utils.DtypePolicy(compute='float32', storage='float16'):
+        nose.tools.eq_(dcase_util.utils.compute_dtype(default='float64'), numpy.float32)
+        nose.tools.eq_(dcase_util.utils.to_compute_dtype(x).dtype, numpy.float32)
+        nose.tools.eq_(dcase_util.utils.to_storage_dtype(x).dtype, numpy.float16)
+        nose.tools.eq_(dcase_util.utils.to_compute_dtype(numpy.zeros(10, dtype=int)).dtype, int)
+
+        with dcase_util.utils.DtypePolicy(compute='float64'):
+            nose.tools.eq_(dcase_util.utils.get_dtype_policy(), {'compute': numpy.float64, 'storage': numpy.float16})
+
+        nose.tools.eq_(dcase_util.utils.compute_dtype(), numpy.float32)
+
+    nose.tools.eq_(dcase_util.utils.get_dtype_policy(), {'compute': None, 'storage': None})
+    nose.tools.eq_(dcase_util.utils.to_compute_dtype(x) is x, True)
+    nose.tools.eq_(dcase_util.utils.from_storage_dtype(x.astype(numpy.float16)).dtype, numpy.float32)
+
+
+def test_dtype_policy_threads():
+    from multiprocessing.pool import ThreadPool
+
+    def compute(dtype):
+        with dcase_util.utils.DtypePolicy(compute=dtype):
+            return [dcase_util.utils.compute_dtype() for i in range(100)]
+
+    pool = ThreadPool(processes=8)
+    try:
+        dtypes = ['float32', 'float64'] * 8
+        for dtype, result in zip(dtypes, pool.map(compute, dtypes, chunksize=1)):
+            nose.tools.eq_(set(result), set([numpy.dtype(dtype)]))
+
+    finally:
+        pool.terminate()
+
+    nose.tools.eq_(dcase_util.utils.get_dtype_policy(), {'compute': None, 'storage': None})
+
+
+@nose.tools.raises(ValueError)
+def test_dtype_policy_invalid():
+    with dcase_util.utils.DisableLogger():
+        with dcase_util.utils.DtypePolicy(compute='float16'):
+            pass
+
+
+def test_quantize():
+    x = numpy.vstack((numpy.linspace(-1, 1, 100), numpy.linspace(0, 10, 100), numpy.ones(100)))
+
+    for dtype in ['int8', 'uint8']:
+        quantized, scale, offset = dcase_util.utils.quantize(x, dtype=dtype)
+        nose.tools.eq_(quantized.dtype, numpy.dtype(dtype))
+        nose.tools.eq_(scale.shape, (3, 1))
+
+        reconstructed = dcase_util.utils.dequantize(quantized, scale=scale, offset=offset)
+        nose.tools.eq_(reconstructed.dtype, numpy.float32)
+        numpy.testing.assert_array_less(numpy.abs(reconstructed - x).max(axis=1), scale[:, 0] / 2 + 1e-5)
+
+    for compression in [None, 'zlib']:
+        encoded, info = dcase_util.utils.encode_array(x, storage_type='uint8', compression=compression)
+        nose.tools.eq_(encoded.dtype, numpy.uint8)
+        nose.tools.eq_(dcase_util.utils.decode_array(encoded, info=info).shape, x.shape)
+
+    encoded, info = dcase_util.utils.encode_array(x, compression='zlib')
+    numpy.testing.assert_array_equal(dcase_util.utils.decode_array(encoded, info=info), x)
+
+
+@nose.tools.raises(ValueError)
+def test_encode_array_invalid():
+    with dcase_util.utils.DisableLogger():
+        dcase_util.utils.encode_array(numpy.zeros(10), storage_type='int16')
+
+
+def test_in_place():
+    x = numpy.zeros(10)
+
+    nose.tools.eq_(dcase_util.utils.in_place_enabled(), False)
+    nose.tools.eq_(dcase_util.utils.copy_unless_in_place(x) is x, False)
+
+    with dcase_util.utils.InPlace():
+        nose.tools.eq_(dcase_util.utils.copy_unless_in_place(x) is x, True)
+
+        with dcase_util.utils.InPlace(enabled=False):
+            nose.tools.eq_(dcase_util.utils.in_place_enabled(), False)
+
+        nose.tools.eq_(dcase_util.utils.in_place_enabled(), True)
+
+    nose.tools.eq_(dcase_util.utils.in_place_enabled(), False)